@@ -0,0 +1,106 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+from social import schema
+from social.models import ContentStatus, Platform
+
+
+# Rough shape of a mature store: mostly published history, a scheduled
+# pipeline for the next few weeks and a smaller pile of drafts.
+PLATFORM_WEIGHTS = {Platform.TWITTER: 0.5, Platform.LINKEDIN: 0.3, Platform.INSTAGRAM: 0.2}
+STATUS_WEIGHTS = {ContentStatus.PUBLISHED: 0.6, ContentStatus.SCHEDULED: 0.25, ContentStatus.DRAFT: 0.15}
+LENGTHS = {Platform.TWITTER: (80, 280), Platform.LINKEDIN: (400, 1500), Platform.INSTAGRAM: (200, 900)}
+
+_WORDS = (
+    "launch team product customers growth insight data design remote hiring "
+    "culture roadmap feedback release community partner event webinar story "
+    "lesson results quarter milestone thanks excited announce learn build ship "
+    "today week future trend tips guide behind scenes question share"
+).split()
+_HASHTAGS = ["#ai", "#startup", "#marketing", "#product", "#design", "#hiring", "#tech", "#growth"]
+
+
+def _sentences(rng: random.Random, count: int) -> list:
+    out = []
+    for _ in range(count):
+        words = rng.choices(_WORDS, k=rng.randint(6, 16))
+        out.append(" ".join(words).capitalize() + rng.choice([".", "!", "?"]))
+    return out
+
+
+def synthetic_records(n: int, seed: int = 0, today: Optional[date] = None) -> Iterator[dict]:
+    """Yield ``n`` realistic store records lazily (suitable for 1M+ entries).
+
+    Platforms, statuses and post lengths follow the weights above; topics
+    repeat with a long-tailed distribution; published posts fall in the past
+    year, scheduled ones in the next 90 days. IDs are unique.
+    """
+    rng = random.Random(seed)
+    if today is None:
+        today = date.today()
+    sentences = _sentences(rng, 400)
+    topics = [" ".join(rng.sample(_WORDS, rng.randint(1, 3))) for _ in range(300)]
+    topic_weights = [1 / (i + 1) for i in range(len(topics))]
+    platforms, platform_w = list(PLATFORM_WEIGHTS), list(PLATFORM_WEIGHTS.values())
+    statuses, status_w = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+    seen = set()
+
+    for _ in range(n):
+        entry_id = uuid.UUID(int=rng.getrandbits(128)).hex[:8]
+        while entry_id in seen:
+            entry_id = uuid.UUID(int=rng.getrandbits(128)).hex[:8]
+        seen.add(entry_id)
+
+        platform = rng.choices(platforms, platform_w)[0]
+        status = rng.choices(statuses, status_w)[0]
+        low, high = LENGTHS[platform]
+        target = rng.randint(low, high)
+        parts, length = [], 0
+        while length < target - 40:
+            sentence = rng.choice(sentences)
+            parts.append(sentence)
+            length += len(sentence) + 1
+        content = " ".join(parts) + " " + " ".join(rng.sample(_HASHTAGS, 2))
+
+        if status is ContentStatus.PUBLISHED:
+            scheduled = today - timedelta(days=rng.randint(1, 365))
+        elif status is ContentStatus.SCHEDULED:
+            scheduled = today + timedelta(days=rng.randint(0, 90))
+        else:
+            scheduled = None
+        anchor = scheduled or today
+        created = datetime.combine(anchor, datetime.min.time()) - timedelta(
+            days=rng.randint(0, 30), seconds=rng.randint(0, 86399)
+        )
+        yield {
+            "id": entry_id,
+            "platform": platform.value,
+            "content": content[:high],
+            "topic": rng.choices(topics, topic_weights)[0],
+            "created_at": created.isoformat(),
+            "scheduled_date": scheduled.isoformat() if scheduled else None,
+            "status": status.value,
+        }
+
+
+def build_store(path: Path, n: int, seed: int = 0) -> Path:
+    """Write a store file with ``n`` synthetic entries directly, without ContentStore."""
+    schema.write_file(path, synthetic_records(n, seed))
+    return path
+
+
+class Timer:
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
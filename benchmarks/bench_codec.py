@@ -0,0 +1,66 @@
+"""Store decode/filter benchmark: time and memory for loading entries.
+
+Usage: python benchmarks/bench_codec.py [--entries 500000]
+
+Memory is the traced allocation size of the decoded ContentEntry list
+(measured in a separate pass, since tracing slows the timed runs).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _common import Timer, build_store  # noqa: E402
+
+from social.models import ContentEntry, ContentStatus, Platform  # noqa: E402
+from social.store import ContentStore  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_store(Path(tmp) / "content.json", args.entries)
+        print(f"{args.entries} entries, store {path.stat().st_size / 1e6:.1f} MB")
+
+        store = ContentStore(path=path)
+        with Timer() as t:
+            raw = store._load()
+        print(f"  parse JSON:        {t.elapsed:6.2f}s")
+
+        with Timer() as t:
+            entries = [ContentEntry.from_dict(r) for r in raw]
+        print(f"  decode entries:    {t.elapsed:6.2f}s ({len(entries) / t.elapsed:>9.0f} entries/s)")
+
+        with Timer() as t:
+            records = [e.to_dict() for e in entries]
+        print(f"  encode entries:    {t.elapsed:6.2f}s ({len(records) / t.elapsed:>9.0f} entries/s)")
+        del entries, records
+
+        with Timer() as t:
+            found = store.list_entries(platform=Platform.TWITTER, status=ContentStatus.SCHEDULED)
+        print(f"  list (cold):       {t.elapsed:6.2f}s ({len(found)} matches)")
+        with Timer() as t:
+            store.list_entries(platform=Platform.TWITTER, status=ContentStatus.SCHEDULED)
+        print(f"  list (cached):     {t.elapsed:6.2f}s")
+
+        gc.collect()
+        tracemalloc.start()
+        entries = [ContentEntry.from_dict(r) for r in raw]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  decoded list size: {size / 1e6:6.1f} MB ({size / len(entries):.0f} bytes/entry)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Export throughput benchmark.
+
+Usage: python benchmarks/bench_export.py [--entries 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _common import Timer, build_store  # noqa: E402
+
+from social.exporter import export_columnar, export_csv, export_ics, read_columnar  # noqa: E402
+from social.store import ContentStore  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        store = ContentStore(path=build_store(tmp_path / "content.json", args.entries))
+        print(f"{args.entries} entries, store {store.path.stat().st_size / 1e6:.1f} MB")
+
+        for name, writer, target, mode in [
+            ("csv", export_csv, os.devnull, "w"),
+            ("ics", export_ics, os.devnull, "w"),
+            ("columnar", export_columnar, tmp_path / "out.col", "wb"),
+        ]:
+            with open(target, mode) as out, Timer() as t:
+                count = writer(store.iter_raw(), out)
+            print(f"{name:>9}: {count:>8} rows in {t.elapsed:6.2f}s ({count / t.elapsed:>9.0f} rows/s)")
+
+        with Timer() as t:
+            column = read_columnar(tmp_path / "out.col", ["platform"])["platform"]
+        print(f"read one column ({len(column)} values) in {t.elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
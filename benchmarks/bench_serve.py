@@ -0,0 +1,99 @@
+"""Load benchmark for `social serve`.
+
+Starts the server in-process on a synthetic store and drives it with
+concurrent keep-alive clients issuing a read-heavy mix (get by ID, filtered
+list, calendar range) plus occasional updates.
+
+Usage: python benchmarks/bench_serve.py [--entries 10000] [--clients 50] [--requests 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _common import build_store  # noqa: E402
+
+from social.server import SocialServer  # noqa: E402
+from social.store import ContentStore  # noqa: E402
+
+
+async def _client(port, ids, n_requests, latencies, rng):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(n_requests):
+            roll = rng.random()
+            body = b""
+            if roll < 0.6:
+                method, path = "GET", f"/entries/{rng.choice(ids)}"
+            elif roll < 0.8:
+                method, path = "GET", "/calendar?from=2026-03-01&to=2026-03-07"
+            elif roll < 0.95:
+                method, path = "GET", "/entries?platform=linkedin&status=draft"
+            else:
+                method, path = "PATCH", f"/entries/{rng.choice(ids)}"
+                body = json.dumps({"topic": "updated"}).encode()
+            start = time.perf_counter()
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run(store, clients, requests):
+    server = SocialServer(store, port=0)
+    await server.start()
+    ids = list(server.state.entries)
+    latencies = []
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            _client(server.port, ids, requests, latencies, random.Random(i))
+            for i in range(clients)
+        ])
+        elapsed = time.perf_counter() - start
+    finally:
+        await server.close()
+    latencies.sort()
+    print(f"{len(latencies)} requests from {clients} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:.0f} req/s)")
+    print(f"latency p50 {statistics.median(latencies) * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ContentStore(path=build_store(Path(tmp) / "content.json", args.entries))
+        asyncio.run(run(store, args.clients, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare two benchmark result files written by run.py.
+
+Prints the change for every (case, entries) pair present in both files and
+exits with status 1 if any case got slower by more than the threshold.
+
+Usage: python benchmarks/compare.py BASELINE.json CURRENT.json [--threshold 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+
+def _index(path: str) -> dict:
+    with open(path) as f:
+        results = json.load(f)["results"]
+    return {(r["case"], r["entries"]): r["seconds"] for r in results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative slowdown that counts as a regression (0.2 = 20%%).")
+    args = parser.parse_args()
+
+    baseline, current = _index(args.baseline), _index(args.current)
+    regressions = 0
+    for key in sorted(set(baseline) & set(current), key=lambda k: (k[0], k[1] or 0)):
+        before, after = baseline[key], current[key]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "  improved"
+        case, entries = key
+        label = f"{case} @ {entries}" if entries is not None else case
+        print(f"{label:<28} {before * 1000:10.1f} ms -> {after * 1000:10.1f} ms  {change:+7.1%}{flag}")
+
+    missing = sorted(set(baseline) - set(current), key=lambda k: (k[0], k[1] or 0))
+    for case, entries in missing:
+        print(f"{case} @ {entries}: missing from {args.current}")
+    if regressions:
+        print(f"{regressions} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
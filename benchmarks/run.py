@@ -0,0 +1,295 @@
+"""Benchmark suite for the CLI's hot paths on synthetic stores.
+
+Times cold-process operations (load + list, filter, prefix lookup, add,
+update, delete, week-view render), bulk import/export, and generation
+throughput against a local fake Messages API. Results are written as JSON
+for comparison with benchmarks/compare.py.
+
+Usage: python benchmarks/run.py [--sizes 1000,10000,100000] [--repeat 3]
+                                [--cases list,filter,...] [--out results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform as platform_mod
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import warnings
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _common import Timer, build_store, synthetic_records  # noqa: E402
+
+import anthropic  # noqa: E402
+from rich.console import Console  # noqa: E402
+
+from social import generator  # noqa: E402
+from social.calendar import render_week_view  # noqa: E402
+from social.exporter import export_columnar, export_csv, export_ics  # noqa: E402
+from social.importer import import_file  # noqa: E402
+from social.models import ContentEntry, ContentStatus, Platform  # noqa: E402
+from social.store import ContentStore  # noqa: E402
+
+
+class Context:
+    def __init__(self, path: Path, n: int, tmp: Path, seed: int):
+        self.path = path
+        self.n = n
+        self.tmp = tmp
+        self.rng = random.Random(seed)
+        ids = [r["id"] for r in ContentStore(path).iter_raw()]
+        self.rng.shuffle(ids)
+        self.ids = ids
+        self.runs = 0
+
+
+# name -> function(ctx) returning elapsed seconds for one run
+CASES: Dict[str, Callable[[Context], float]] = {}
+
+
+def case(name: str):
+    def register(fn):
+        CASES[name] = fn
+        return fn
+    return register
+
+
+# Every store case opens a fresh ContentStore, as a CLI invocation would.
+
+@case("list")
+def _list(ctx: Context) -> float:
+    with Timer() as t:
+        ContentStore(ctx.path).list_entries()
+    return t.elapsed
+
+
+@case("filter")
+def _filter(ctx: Context) -> float:
+    with Timer() as t:
+        ContentStore(ctx.path).list_entries(platform=Platform.TWITTER, status=ContentStatus.SCHEDULED)
+    return t.elapsed
+
+
+@case("prefix_lookup")
+def _prefix_lookup(ctx: Context) -> float:
+    prefix = ctx.rng.choice(ctx.ids)[:6]
+    with Timer() as t:
+        ContentStore(ctx.path).get_entry(prefix)
+    return t.elapsed
+
+
+@case("add")
+def _add(ctx: Context) -> float:
+    entry = ContentEntry.new(Platform.TWITTER, "Benchmark post #bench", "benchmark")
+    with Timer() as t:
+        ContentStore(ctx.path).add_entry(entry)
+    return t.elapsed
+
+
+@case("update")
+def _update(ctx: Context) -> float:
+    entry_id = ctx.rng.choice(ctx.ids)
+    with Timer() as t:
+        ContentStore(ctx.path).update_entry(entry_id, topic=f"benchmark {ctx.runs}")
+    ctx.runs += 1
+    return t.elapsed
+
+
+@case("delete")
+def _delete(ctx: Context) -> float:
+    entry_id = ctx.ids.pop()
+    with Timer() as t:
+        ContentStore(ctx.path).delete_entry(entry_id)
+    return t.elapsed
+
+
+@case("week_render")
+def _week_render(ctx: Context) -> float:
+    console = Console(file=io.StringIO(), width=160)
+    with Timer() as t:
+        console.print(render_week_view(ContentStore(ctx.path).list_entries()))
+    return t.elapsed
+
+
+@case("import")
+def _import(ctx: Context) -> float:
+    source = ctx.tmp / "import.ndjson"
+    if not source.exists():
+        with open(source, "w") as f:
+            for record in synthetic_records(ctx.n, seed=ctx.n + 1):
+                f.write(json.dumps(record) + "\n")
+    target = ctx.tmp / f"import-{ctx.runs}.json"
+    ctx.runs += 1
+    with Timer() as t:
+        import_file(ContentStore(target), source, errors_path=ctx.tmp / "import.errors")
+    target.unlink()
+    return t.elapsed
+
+
+def _export_case(writer, binary: bool = False) -> Callable[[Context], float]:
+    def run(ctx: Context) -> float:
+        out_path = ctx.tmp / "export.out"
+        with open(out_path, "wb" if binary else "w") as out, Timer() as t:
+            writer(ContentStore(ctx.path).iter_raw(), out)
+        return t.elapsed
+    return run
+
+
+CASES["export_csv"] = _export_case(export_csv)
+CASES["export_ics"] = _export_case(export_ics)
+CASES["export_columnar"] = _export_case(export_columnar, binary=True)
+
+
+# Generation against a local stand-in for the Messages API
+
+class _FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.latency:
+            threading.Event().wait(self.latency)
+        body = json.dumps({
+            "id": "msg_bench",
+            "type": "message",
+            "role": "assistant",
+            "model": "bench",
+            "content": [{"type": "text", "text": "Benchmark post with a few words. #bench"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 10, "output_tokens": 10},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FakeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # the default backlog of 5 resets concurrent clients
+
+
+def bench_generation(calls: int, concurrency: int, latency: float) -> List[dict]:
+    handler = type("Handler", (_FakeAPIHandler,), {"latency": latency})
+    server = _FakeAPIServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    results = []
+    warnings.simplefilter("ignore", DeprecationWarning)  # SDK model deprecation notices
+    try:
+        client = anthropic.Anthropic(base_url=base_url, api_key="bench", max_retries=0)
+        with Timer() as t:
+            for i in range(calls):
+                generator.generate_content(f"topic {i}", Platform.TWITTER, client=client)
+        results.append({"case": "generate_sync", "entries": None, "calls": calls,
+                        "seconds": t.elapsed, "calls_per_second": calls / t.elapsed})
+
+        async def run_async() -> float:
+            aclient = anthropic.AsyncAnthropic(base_url=base_url, api_key="bench", max_retries=0)
+            limit = asyncio.Semaphore(concurrency)
+
+            async def one(i):
+                async with limit:
+                    await generator.agenerate_content(f"topic {i}", Platform.TWITTER, client=aclient)
+
+            with Timer() as t:
+                await asyncio.gather(*(one(i) for i in range(calls * 4)))
+            await aclient.close()
+            return t.elapsed
+
+        elapsed = asyncio.run(run_async())
+        results.append({"case": "generate_async", "entries": None, "calls": calls * 4,
+                        "concurrency": concurrency, "seconds": elapsed,
+                        "calls_per_second": calls * 4 / elapsed})
+    finally:
+        server.shutdown()
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(__file__), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="Comma-separated store sizes (up to 1000000).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the median is reported.")
+    parser.add_argument("--cases", default=None, help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--no-generation", action="store_true", help="Skip the generation cases.")
+    parser.add_argument("--calls", type=int, default=50, help="Generation calls for the sync case.")
+    parser.add_argument("--concurrency", type=int, default=100, help="In-flight calls for the async case.")
+    parser.add_argument("--api-latency", type=float, default=0.02, help="Fake API response delay in seconds.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark-results.json")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    names = args.cases.split(",") if args.cases else list(CASES)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown case(s): {', '.join(sorted(unknown))}")
+
+    results = []
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            with Timer() as t:
+                path = build_store(tmp_path / "content.json", n, seed=args.seed)
+            print(f"{n} entries ({path.stat().st_size / 1e6:.1f} MB, built in {t.elapsed:.1f}s)")
+            ctx = Context(path, n, tmp_path, args.seed)
+            for name in names:
+                times = [CASES[name](ctx) for _ in range(args.repeat)]
+                median = statistics.median(times)
+                results.append({"case": name, "entries": n, "seconds": median,
+                                "min": min(times), "repeat": args.repeat})
+                print(f"  {name:<16} {median * 1000:10.1f} ms")
+
+    if not args.no_generation:
+        for result in bench_generation(args.calls, args.concurrency, args.api_latency):
+            results.append(result)
+            print(f"{result['case']:<18} {result['calls_per_second']:10.1f} calls/s")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform_mod.python_version(),
+            "platform": platform_mod.platform(),
+            "cpus": os.cpu_count(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from social import schema
+
+
+class Archive:
+    """Cold storage for published entries in immutable gzip segments.
+
+    Each archiving run writes one new segment (``segment-000001.json.gz``,
+    ...) in the store's schema layout; segments are never rewritten. A small
+    ``index.json`` maps entry IDs to segment numbers so single lookups only
+    decompress one segment.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._index: Optional[Dict[str, int]] = None
+        self._index_key = None
+        self._segment_cache: Optional[tuple] = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / "index.json"
+
+    def segment_path(self, number: int) -> Path:
+        return self.directory / f"segment-{number:06d}.json.gz"
+
+    def index(self) -> Dict[str, int]:
+        """Return the ID -> segment number map, re-read only when it changes."""
+        try:
+            st = os.stat(self.index_path)
+        except FileNotFoundError:
+            return {}
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._index is None or self._index_key != key:
+            with open(self.index_path) as f:
+                self._index = json.load(f)["ids"]
+            self._index_key = key
+        return self._index
+
+    def segments(self) -> List[int]:
+        return sorted(set(self.index().values()))
+
+    def append(self, records: List[dict]) -> int:
+        """Write ``records`` as a new segment and return its number."""
+        index = dict(self.index())
+        number = max(index.values(), default=0) + 1
+        schema.write_file(self.segment_path(number), records, compress=True)
+        for record in records:
+            index[record["id"]] = number
+        schema.atomic_write_json(self.index_path, {"version": 1, "ids": index})
+        return number
+
+    def _segment(self, number: int) -> Dict[str, dict]:
+        if self._segment_cache is None or self._segment_cache[0] != number:
+            records = schema.iter_records(self.segment_path(number))
+            self._segment_cache = (number, {r["id"]: r for r in records})
+        return self._segment_cache[1]
+
+    def find(self, entry_id: str) -> List[dict]:
+        """Archived records whose ID equals or starts with ``entry_id``."""
+        index = self.index()
+        if entry_id in index:
+            ids = [entry_id]
+        else:
+            ids = [i for i in index if i.startswith(entry_id)]
+        return [self._segment(index[i])[i] for i in ids]
+
+    def iter_records(self) -> Iterator[dict]:
+        """Stream every archived record, oldest segment first."""
+        for number in self.segments():
+            yield from schema.iter_records(self.segment_path(number))
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import abc
+from collections import Counter
+from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from rich.console import Console
+import click
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from social import trace
 from social.models import ContentEntry, ContentStatus, Platform
+from social.series import SeriesBook
 from social.store import ContentStore
 
 STATUS_COLORS = {
@@ -25,63 +31,293 @@ def _truncate(text: str, max_len: int = 40) -> str:
     return text[: max_len - 3] + "..."
 
 
-def render_calendar_table(
-    entries: List[ContentEntry], title: str = "Content Calendar"
-) -> Table:
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())  # Monday
+
+
+@dataclass(frozen=True)
+class Period:
+    """A run of whole weeks shown as a grid; ``month`` marks a month view."""
+
+    start: date  # always a Monday
+    weeks: int
+    month: Optional[date] = None  # first day of the month
+
+    @classmethod
+    def for_weeks(cls, day: date, weeks: int = 1) -> Period:
+        return cls(week_start(day), weeks)
+
+    @classmethod
+    def for_month(cls, day: date) -> Period:
+        first = day.replace(day=1)
+        last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        start = week_start(first)
+        return cls(start, (last - start).days // 7 + 1, first)
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=7 * self.weeks - 1)
+
+    @property
+    def title(self) -> str:
+        if self.month is not None:
+            return self.month.strftime("%B %Y")
+        if self.weeks == 1:
+            return f"Week of {self.start.isoformat()}"
+        return f"{self.start.isoformat()} to {self.end.isoformat()}"
+
+    def shift(self, step: int) -> Period:
+        """The period ``step`` months (month views) or spans of weeks away."""
+        if self.month is not None:
+            index = self.month.year * 12 + self.month.month - 1 + step
+            return Period.for_month(date(index // 12, index % 12 + 1, 1))
+        return Period(self.start + timedelta(weeks=step * self.weeks), self.weeks)
+
+
+# Rows kept before the cache starts over; a screenful is a few dozen
+ROW_CACHE_SIZE = 10_000
+
+
+class RowCache:
+    """Formatted rows keyed by entry ID, reused until the entry changes.
+
+    Entries are re-decoded whenever the store file changes, so rows are
+    matched on the displayed fields rather than on object identity.
+    """
+
+    def __init__(self, fmt: Optional[Callable[[ContentEntry], object]] = None):
+        self.fmt = fmt or calendar_row
+        self._rows: Dict[str, Tuple[tuple, object]] = {}
+
+    def get(self, entry: ContentEntry):
+        key = (entry.platform, entry.status, entry.scheduled_date, entry.topic, entry.content)
+        cached = self._rows.get(entry.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if len(self._rows) >= ROW_CACHE_SIZE:
+            self._rows.clear()
+        row = self.fmt(entry)
+        self._rows[entry.id] = (key, row)
+        return row
+
+
+def new_calendar_table(title: str = "Content Calendar", workspace_column: bool = False) -> Table:
     table = Table(title=title, show_lines=False)
+    if workspace_column:
+        table.add_column("Workspace", style="cyan", max_width=14)
     table.add_column("ID", style="dim", width=10)
     table.add_column("Platform", width=12)
     table.add_column("Status", width=11)
     table.add_column("Scheduled", width=12)
     table.add_column("Topic / Preview", min_width=30)
+    return table
+
+
+def calendar_row(entry: ContentEntry) -> tuple:
+    color = STATUS_COLORS.get(entry.status, "white")
+    status_text = Text(entry.status.value, style=color)
+    scheduled = entry.scheduled_date or "--"
+    preview = _truncate(f"{entry.topic}: {entry.content}")
+    return (entry.id, entry.platform.value.title(), status_text, scheduled, preview)
 
+
+def render_calendar_table(
+    entries: List[ContentEntry],
+    title: str = "Content Calendar",
+    workspaces: Optional[List[str]] = None,
+    cache: Optional[RowCache] = None,
+) -> Table:
+    """Build the calendar table; ``workspaces`` (one name per entry) adds a column."""
+    row = cache.get if cache is not None else calendar_row
+    with trace.span("render.table", rows=len(entries)):
+        table = new_calendar_table(title, workspace_column=workspaces is not None)
+        if workspaces is None:
+            for entry in entries:
+                table.add_row(*row(entry))
+        else:
+            for name, entry in zip(workspaces, entries):
+                table.add_row(name, *row(entry))
+    return table
+
+
+def grid_line(entry: ContentEntry) -> str:
+    """One entry as a line in a calendar grid cell."""
+    color = STATUS_COLORS.get(entry.status, "white")
+    return f"[{color}]{entry.platform.value[:2].title()}[/{color}] {_truncate(entry.topic, 16)}"
+
+
+def render_weeks_view(
+    entries: List[ContentEntry],
+    period: Period,
+    per_day: Optional[int] = None,
+    cache: Optional[RowCache] = None,
+) -> Table:
+    """A Monday-to-Sunday grid with one row per week of ``period``.
+
+    Each day shows up to ``per_day`` entries (all when None) and a count of
+    the rest. Entries outside the period are ignored.
+    """
+    line = cache.get if cache is not None else grid_line
+    by_day: Dict[str, List[ContentEntry]] = {}
     for entry in entries:
-        color = STATUS_COLORS.get(entry.status, "white")
-        status_text = Text(entry.status.value, style=color)
-        scheduled = entry.scheduled_date or "--"
-        preview = _truncate(f"{entry.topic}: {entry.content}")
-        table.add_row(entry.id, entry.platform.value.title(), status_text, scheduled, preview)
+        if entry.scheduled_date:
+            by_day.setdefault(entry.scheduled_date[:10], []).append(entry)
 
+    table = Table(title=period.title, show_lines=True)
+    for i in range(7):
+        table.add_column((period.start + timedelta(days=i)).strftime("%a"), min_width=12, ratio=1)
+    today = date.today()
+    for week in range(period.weeks):
+        cells = []
+        for i in range(7):
+            day = period.start + timedelta(days=7 * week + i)
+            label = day.strftime("%m/%d")
+            if day == today:
+                label = f"[reverse]{label}[/reverse]"
+            elif period.month is not None and day.month != period.month.month:
+                label = f"[dim]{label}[/dim]"
+            day_entries = by_day.get(day.isoformat(), [])
+            shown = day_entries if per_day is None else day_entries[:per_day]
+            lines = [f"[bold]{label}[/bold]"] + [line(e) for e in shown]
+            if len(shown) < len(day_entries):
+                lines.append(f"[dim]+{len(day_entries) - len(shown)} more[/dim]")
+            cells.append("\n".join(lines))
+        table.add_row(*cells)
     return table
 
 
 def render_week_view(
     entries: List[ContentEntry], start_date: Optional[date] = None
 ) -> Table:
-    if start_date is None:
-        today = date.today()
-        start_date = today - timedelta(days=today.weekday())  # Monday
+    return render_weeks_view(entries, Period.for_weeks(start_date or date.today(), 1))
 
-    table = Table(title=f"Week of {start_date.isoformat()}", show_lines=True)
 
-    days = []
-    for i in range(7):
-        d = start_date + timedelta(days=i)
-        day_name = d.strftime("%a %m/%d")
-        table.add_column(day_name, width=20)
-        days.append(d.isoformat())
+# Lines around the rows: title, borders, header and the pager footer
+_LIST_CHROME = 7
+_GRID_CHROME = 6
 
-    # Group entries by scheduled date
-    by_date = {}
-    for entry in entries:
-        if entry.scheduled_date and entry.scheduled_date in days:
-            by_date.setdefault(entry.scheduled_date, []).append(entry)
+_NEXT_KEYS = {"n", "j", " ", "\x1b[C", "\x1b[B", "\x1b[6~"}  # arrows right/down, PgDn
+_PREV_KEYS = {"p", "k", "b", "\x1b[D", "\x1b[A", "\x1b[5~"}  # arrows left/up, PgUp
+_QUIT_KEYS = {"q", "\x1b", "\x03"}
 
-    # Build row cells
-    max_rows = max((len(v) for v in by_date.values()), default=0)
-    for row_idx in range(max(max_rows, 1)):
-        cells = []
-        for day_iso in days:
-            day_entries = by_date.get(day_iso, [])
-            if row_idx < len(day_entries):
-                e = day_entries[row_idx]
-                color = STATUS_COLORS.get(e.status, "white")
-                cells.append(f"[{color}]{e.platform.value.title()}[/{color}]\n{_truncate(e.topic, 16)}")
-            else:
-                cells.append("")
-        table.add_row(*cells)
 
-    return table
+class CalendarPager(abc.ABC):
+    """Page-at-a-time calendar on the terminal's alternate screen.
+
+    Only what fits the terminal height is rendered, and callers skip the
+    pager when everything fits on one screen (see :meth:`fits`). The store is queried
+    again on every key press (cheap while the file is unchanged) and
+    formatted rows come from a shared :class:`RowCache`.
+    """
+
+    footer = "[dim]n/→ next  p/← previous  q quit[/dim]"
+
+    def __init__(
+        self,
+        store: ContentStore,
+        console: Console,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ):
+        self.store = store
+        self.console = console
+        self.platform = platform
+        self.status = status
+        self.include_archived = include_archived
+
+    @abc.abstractmethod
+    def fits(self) -> bool:
+        """Whether the first page holds everything, so paging is pointless."""
+
+    @abc.abstractmethod
+    def render(self) -> RenderableType:
+        """The current page."""
+
+    @abc.abstractmethod
+    def move(self, step: int) -> None:
+        """Go ``step`` pages forward (or back, when negative)."""
+
+    def run(self, read_key: Callable[[], str] = click.getchar) -> None:
+        with self.console.screen() as screen:
+            while True:
+                screen.update(Group(self.render(), Text.from_markup(self.footer)))
+                key = read_key()
+                if key in _QUIT_KEYS:
+                    return
+                if key in _NEXT_KEYS:
+                    self.move(1)
+                elif key in _PREV_KEYS:
+                    self.move(-1)
+
+
+class ListPager(CalendarPager):
+    """The calendar table, one screenful of rows per page."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page = 0
+        self.cache = RowCache()
+
+    def page_size(self) -> int:
+        return max(1, self.console.height - _LIST_CHROME)
+
+    def _entries(self) -> List[ContentEntry]:
+        return self.store.list_entries(self.platform, self.status, self.include_archived)
+
+    def fits(self) -> bool:
+        return len(self._entries()) <= self.page_size()
+
+    def render(self) -> RenderableType:
+        entries = self._entries()
+        size = self.page_size()
+        pages = max(1, -(-len(entries) // size))
+        self.page = min(self.page, pages - 1)
+        first = self.page * size
+        visible = entries[first:first + size]
+        title = f"Content Calendar (page {self.page + 1}/{pages}, {len(entries)} entries)"
+        return render_calendar_table(visible, title, cache=self.cache)
+
+    def move(self, step: int) -> None:
+        self.page = max(0, self.page + step)  # render() clamps the upper end
+
+
+class GridPager(CalendarPager):
+    """Week or month grids; paging moves to the next or previous period."""
+
+    def __init__(self, store: ContentStore, console: Console, period: Period, **kwargs):
+        super().__init__(store, console, **kwargs)
+        self.period = period
+        self.series = SeriesBook(store)
+        self.cache = RowCache(grid_line)
+
+    def per_day(self) -> int:
+        # Each week row is its date label, the entries and a separator line
+        return max(1, (self.console.height - _GRID_CHROME) // self.period.weeks - 2)
+
+    def _entries(self) -> List[ContentEntry]:
+        return self.series.scheduled_between(
+            self.period.start, self.period.end,
+            self.platform, self.status, self.include_archived,
+        )
+
+    def fits(self) -> bool:
+        per_day = Counter(e.scheduled_date[:10] for e in self._entries())
+        busiest = [0] * self.period.weeks
+        for day, count in per_day.items():
+            try:
+                week = (date.fromisoformat(day) - self.period.start).days // 7
+            except ValueError:
+                continue  # shown nowhere in the grid, so it takes no space
+            if 0 <= week < self.period.weeks:
+                busiest[week] = max(busiest[week], count)
+        return sum(n + 2 for n in busiest) <= self.console.height - _GRID_CHROME
+
+    def render(self) -> RenderableType:
+        return render_weeks_view(self._entries(), self.period, self.per_day(), self.cache)
+
+    def move(self, step: int) -> None:
+        self.period = self.period.shift(step)
 
 
 def display_entry_detail(entry: ContentEntry, console: Optional[Console] = None) -> None:
@@ -107,19 +343,45 @@ def display_calendar(
     status: Optional[ContentStatus] = None,
     week: bool = False,
     console: Optional[Console] = None,
+    include_archived: bool = False,
+    period: Optional[Period] = None,
+    pager: bool = False,
 ) -> None:
-    if console is None:
-        console = Console()
+    """Print the calendar, or browse it a screenful at a time with ``pager``.
 
-    entries = store.list_entries(platform=platform, status=status)
+    Like ``less -F``, the pager is only used when the output would not fit
+    the console height.
 
-    if not entries:
-        console.print("[dim]No content entries found.[/dim]")
-        return
+    ``period`` (or ``week`` for the current week) shows a grid of just that
+    date range, including planned occurrences of recurring series, instead
+    of the full table.
+    """
+    if console is None:
+        console = Console()
+    if period is None and week:
+        period = Period.for_weeks(date.today(), 1)
+    filters = dict(platform=platform, status=status, include_archived=include_archived)
 
-    if week:
-        table = render_week_view(entries)
+    if period is not None:
+        if pager:
+            grid = GridPager(store, console, period, **filters)
+            if not grid.fits():
+                grid.run()
+                return
+        entries = SeriesBook(store).scheduled_between(period.start, period.end, **filters)
+        with trace.span("render.week", weeks=period.weeks):
+            table = render_weeks_view(entries, period)
     else:
+        entries = store.list_entries(**filters)
+        if not entries:
+            console.print("[dim]No content entries found.[/dim]")
+            return
+        if pager:
+            rows = ListPager(store, console, **filters)
+            if not rows.fits():
+                rows.run()
+                return
         table = render_calendar_table(entries)
 
-    console.print(table)
+    with trace.span("render.print"):
+        console.print(table)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# Rotate the log once it grows past this size. Readers notice the new file
+# and resynchronize through ChangeFeedGap.
+MAX_LOG_BYTES = 8 << 20
+
+# Commits touching more entries than this are logged as a single "reset"
+# event instead of one event per entry.
+MAX_EVENTS_PER_COMMIT = 1000
+
+
+class ChangeFeedGap(Exception):
+    """Raised when a reader missed events and must reload the full store."""
+
+
+class ChangeLog:
+    """Append-only NDJSON log of store changes with monotonic sequence numbers.
+
+    Each line is ``{"seq": n, "op": "add"|"update"|"delete"|"archive"|"reset",
+    "id": ..., "entry": {...}}``. ``entry`` is the stored record after the
+    change (null for deletes, archived entries and resets).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._last: Optional[Tuple[tuple, int]] = None
+
+    def _stat_key(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size)
+
+    def last_seq(self) -> int:
+        key = self._stat_key()
+        if key is None:
+            return 0
+        if self._last is not None and self._last[0] == key:
+            return self._last[1]
+        seq = 0
+        with open(self.path, "rb") as f:
+            size = key[1]
+            window = 4096
+            while size:
+                f.seek(max(0, size - window))
+                lines = f.read().splitlines()
+                if len(lines) > 1 or window >= size:
+                    if lines:
+                        seq = json.loads(lines[-1])["seq"]
+                    break
+                window *= 2
+        self._last = (key, seq)
+        return seq
+
+    def append(self, changes: List[Tuple[str, dict]]) -> int:
+        """Log ``(op, record)`` pairs and return the last sequence number."""
+        seq = self.last_seq()
+        if not changes:
+            return seq
+        if len(changes) > MAX_EVENTS_PER_COMMIT:
+            seq += 1
+            lines = [json.dumps({"seq": seq, "op": "reset", "id": None, "entry": None})]
+        else:
+            lines = []
+            for op, record in changes:
+                seq += 1
+                lines.append(json.dumps({
+                    "seq": seq,
+                    "op": op,
+                    "id": record["id"],
+                    "entry": None if op in ("delete", "archive") else record,
+                }))
+        data = "\n".join(lines) + "\n"
+
+        key = self._stat_key()
+        if key is not None and key[1] + len(data) > MAX_LOG_BYTES:
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, str(self.path))
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        else:
+            with open(self.path, "a") as f:
+                f.write(data)
+        self._last = (self._stat_key(), seq)
+        return seq
+
+
+class ChangeFeed:
+    """Incremental reader over a ChangeLog.
+
+    ``poll`` costs a single ``stat`` when nothing changed; otherwise it reads
+    only the bytes appended since the previous poll.
+    """
+
+    def __init__(self, path: Path, from_start: bool = False):
+        self.path = path
+        self.seq = 0
+        self.offset = 0
+        self._ino = None
+        if not from_start:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return
+            self._ino = st.st_ino
+            self.offset = st.st_size
+            self.seq = ChangeLog(path).last_seq()
+
+    @property
+    def position(self) -> Tuple[Optional[int], int, int]:
+        """``(inode, offset, seq)`` to persist and later pass to :meth:`resume`."""
+        return (self._ino, self.offset, self.seq)
+
+    @classmethod
+    def resume(cls, path: Path, position: Tuple[Optional[int], int, int]) -> ChangeFeed:
+        """Continue reading after a previously saved :attr:`position`."""
+        feed = cls(path, from_start=True)
+        feed._ino, feed.offset, feed.seq = position
+        return feed
+
+    def poll(self) -> List[dict]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if st.st_ino == self._ino and st.st_size == self.offset:
+            return []
+        if st.st_ino != self._ino or st.st_size < self.offset:
+            self._ino = st.st_ino
+            self.offset = 0
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # leave a partially written line for later
+        self.offset += end
+        events = [json.loads(line) for line in data[:end].splitlines() if line]
+        events = [e for e in events if e["seq"] > self.seq]
+        if not events:
+            return []
+
+        expected = self.seq + 1
+        self.seq = events[-1]["seq"]
+        if (expected > 1 and events[0]["seq"] != expected) or any(
+            e["op"] == "reset" for e in events
+        ):
+            raise ChangeFeedGap(f"Change feed resumed at {events[0]['seq']}, expected {expected}")
+        return events
@@ -1,27 +1,202 @@
 from __future__ import annotations
 
+import os
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
 import click
-from rich.console import Console
-from rich.table import Table
 
-from social.calendar import display_calendar, display_entry_detail
-from social.generator import GenerationError, generate_content, regenerate_content
 from social.models import ContentEntry, ContentStatus, Platform
-from social.platforms import list_platforms
-from social.store import ContentStore, EntryNotFoundError
 
-console = Console()
-store = ContentStore()
+# Heavy dependencies (rich, anthropic) and the store are loaded on first use
+# inside command handlers, so cheap commands start fast.
+console = None
+store = None
+# Shared API client, set by long-lived sessions such as ``social shell``.
+client = None
+
+
+def _get_console():
+    global console
+    if console is None:
+        from rich.console import Console
+
+        console = Console()
+    return console
+
+
+def _get_store():
+    global store
+    if store is None:
+        from social.store import ContentStore
+        from social.workspaces import WorkspaceError, require_workspace
+
+        try:
+            path = require_workspace(_root_option("workspace"))
+        except WorkspaceError as e:
+            raise click.UsageError(str(e))
+        store = ContentStore(path)
+    return store
+
 
 PLATFORM_CHOICES = click.Choice([p.value for p in Platform])
 STATUS_CHOICES = click.Choice([s.value for s in ContentStatus])
+FORMAT_CHOICES = click.Choice(["table", "json", "ndjson"])
+EDITABLE_FIELDS = ("content", "topic", "platform", "status", "scheduled_date")
+
+
+def _root_option(name: str, default=None):
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return default
+    return (ctx.find_root().obj or {}).get(name, default)
+
+
+def _output_format() -> str:
+    return _root_option("format", "table")
+
+
+def _machine_output() -> bool:
+    return _output_format() != "table"
+
+
+def _emit(records) -> None:
+    from social.ndjson import write_records
+
+    write_records(records, _output_format(), sys.stdout)
+
+
+def _read_stdin_records() -> list:
+    from social.ndjson import read_records
+
+    try:
+        return list(read_records(sys.stdin))
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="stdin")
 
 
-@click.group()
+def _prompt_unless_stdin(text: str):
+    """Option callback that prompts for a missing value unless --stdin is set."""
+
+    def callback(ctx, param, value):
+        if value is None and not ctx.params.get("from_stdin"):
+            value = click.prompt(text, type=param.type)
+        return value
+
+    return callback
+
+
+def _parse_date(value: str, param: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter(f"Invalid date: {value} (expected YYYY-MM-DD)", param_hint=param)
+
+
+def _parse_platform_limits(values, param: str, cast=int) -> dict:
+    limits = {}
+    for value in values:
+        name, sep, number = value.partition("=")
+        try:
+            limits[Platform(name)] = cast(number)
+        except ValueError:
+            raise click.BadParameter(f"Invalid value: {value} (expected PLATFORM=N)", param_hint=param)
+    return limits
+
+
+class SocialGroup(click.Group):
+    """Root group that reports a broken platform config file as a CLI error."""
+
+    def invoke(self, ctx):
+        from social.platforms import PlatformConfigError
+
+        try:
+            return super().invoke(ctx)
+        except PlatformConfigError as e:
+            raise click.ClickException(str(e))
+
+
+@click.group(cls=SocialGroup)
 @click.version_option(package_name="social-content")
-def cli():
+@click.option(
+    "--format", "output_format", type=FORMAT_CHOICES, default="table", show_default=True,
+    help="Output format. json and ndjson print ContentEntry records for scripting.",
+)
+@click.option(
+    "--profile", is_flag=True,
+    help="Trace store, generation and rendering spans; writes Chrome trace JSON "
+         "($SOCIAL_TRACE or social-trace.json) and prints a summary to stderr.",
+)
+@click.option("--cprofile", "cprofile_path", type=click.Path(dir_okay=False), default=None,
+              help="Also capture a cProfile of the command to this file (pstats format).")
+@click.option("--workspace", default=None, envvar="SOCIAL_WORKSPACE", metavar="NAME",
+              help="Workspace (brand) whose store to use. [env: SOCIAL_WORKSPACE]")
+@click.option("--all-workspaces", is_flag=True,
+              help="Query every workspace at once (calendar and search only).")
+@click.pass_context
+def cli(ctx, output_format, profile, cprofile_path, workspace, all_workspaces):
     """Social - AI-powered social media content creation tool."""
-    pass
+    obj = ctx.ensure_object(dict)
+    obj["format"] = output_format
+    obj["workspace"] = workspace
+    obj["all_workspaces"] = all_workspaces
+    if all_workspaces:
+        if workspace:
+            raise click.UsageError("Use either --workspace or --all-workspaces, not both.")
+        if ctx.invoked_subcommand not in ("calendar", "search"):
+            raise click.UsageError("--all-workspaces only applies to calendar and search.")
+    if profile or cprofile_path or os.environ.get("SOCIAL_TRACE"):
+        _start_profiling(ctx, profile, cprofile_path)
+
+
+def _start_profiling(ctx, profile: bool, cprofile_path) -> None:
+    """Enable tracing and/or cProfile for this invocation, reporting on exit."""
+    from social import trace
+
+    if profile:
+        env_path = os.environ.get("SOCIAL_TRACE")
+        trace.enable(Path(env_path) if env_path and env_path != "1" else None)
+    if trace.active() is not None:
+        ctx.call_on_close(_report_trace)
+    if cprofile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+        def dump():
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+            click.echo(f"cProfile stats written to {cprofile_path}", err=True)
+
+        ctx.call_on_close(dump)
+        profiler.enable()
+    # Close callbacks run last-registered first, so the command span ends
+    # before the trace is written.
+    command_span = trace.span(f"cli.{ctx.invoked_subcommand}")
+    command_span.__enter__()
+    ctx.call_on_close(lambda: command_span.__exit__(None, None, None))
+
+
+def _report_trace() -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    from social import trace
+
+    tracer = trace.finish()
+    if tracer is None:
+        return
+    table = Table(title="Trace summary")
+    table.add_column("Span")
+    for column in ("Calls", "Total ms", "Mean ms", "Max ms"):
+        table.add_column(column, justify="right")
+    for row in tracer.summary():
+        table.add_row(row["span"], str(row["calls"]), f"{row['total_ms']:.1f}",
+                      f"{row['mean_ms']:.2f}", f"{row['max_ms']:.1f}")
+    err = Console(stderr=True)
+    err.print(table)
+    err.print(f"[dim]Trace written to {tracer.path or trace.DEFAULT_TRACE_PATH}[/dim]")
 
 
 @cli.command()
@@ -29,14 +204,63 @@ def cli():
 @click.option("--topic", "-t", prompt="Content topic")
 @click.option("--schedule", "-s", default=None, help="Schedule date (YYYY-MM-DD).")
 @click.option("--save/--no-save", default=True, help="Save generated content.")
-def generate(platform, topic, schedule, save):
+@click.option("--check-duplicates", is_flag=True,
+              help="Look for a stored post on a near-identical topic before calling the API.")
+@click.option("--avoid-overused", is_flag=True,
+              help="Tell the model to skip hashtags used 3+ times on this platform in the last 30 days.")
+def generate(platform, topic, schedule, save, check_duplicates, avoid_overused):
     """Generate AI-powered content for a social media platform."""
+    from social.generator import GenerationError, generate_content, regenerate_content
+
+    console = _get_console()
+    store = _get_store()
     plat = Platform(platform)
+
+    if check_duplicates:
+        from social.dedupe import DuplicateIndex
+
+        matches = DuplicateIndex(store).similar_topics(topic, plat)
+        if matches:
+            if _machine_output():
+                # Hand back the existing post instead of paying for a new one
+                _emit([matches[0].entry.to_dict()])
+                return
+            console.print(f"[yellow]Similar {platform} posts already exist:[/yellow]")
+            for m in matches[:5]:
+                console.print(f"  [bold]{m.entry.id}[/bold] {m.entry.topic} [dim]({m.similarity:.0%})[/dim]")
+            if not click.confirm("Generate anyway?", default=False):
+                return
+
+    avoid_tags = []
+    if avoid_overused:
+        from social.hashtags import HashtagIndex
+
+        avoid_tags = HashtagIndex(store).overused(plat)
+
+    if _machine_output():
+        try:
+            content = generate_content(topic, plat, client=client, avoid_tags=avoid_tags)
+        except GenerationError as e:
+            raise click.ClickException(str(e))
+        entry = ContentEntry.new(
+            platform=plat,
+            content=content,
+            topic=topic,
+            scheduled_date=schedule,
+            status=ContentStatus.SCHEDULED if schedule else ContentStatus.DRAFT,
+        )
+        if save:
+            store.add_entry(entry)
+        _emit([entry.to_dict()])
+        return
+
     console.print(f"\n[bold]Generating {platform} content about:[/bold] {topic}\n")
 
+    if avoid_tags:
+        console.print(f"[dim]Avoiding overused hashtags: {' '.join(avoid_tags)}[/dim]")
     with console.status("Generating content..."):
         try:
-            content = generate_content(topic, plat)
+            content = generate_content(topic, plat, client=client, avoid_tags=avoid_tags)
         except GenerationError as e:
             console.print(f"[red]Error:[/red] {e}")
             raise SystemExit(1)
@@ -62,7 +286,7 @@ def generate(platform, topic, schedule, save):
         with console.status("Regenerating..."):
             try:
                 entry_obj = ContentEntry.new(platform=plat, content=content, topic=topic)
-                new_content = regenerate_content(entry_obj, feedback)
+                new_content = regenerate_content(entry_obj, feedback, client=client)
             except GenerationError as e:
                 console.print(f"[red]Error:[/red] {e}")
                 raise SystemExit(1)
@@ -72,38 +296,164 @@ def generate(platform, topic, schedule, save):
         console.print(f"\n[dim]({len(new_content)} characters)[/dim]\n")
 
         if save and click.confirm("Save this version?", default=True):
-            new_entry = ContentEntry.new(
-                platform=plat,
-                content=new_content,
-                topic=topic,
-                scheduled_date=schedule,
-                status=ContentStatus.SCHEDULED if schedule else ContentStatus.DRAFT,
+            # Replace the saved text; the first version stays in its history.
+            store.update_entry(entry.id, content=new_content)
+            console.print(
+                f"[green]Saved[/green] as a new revision of [bold]{entry.id}[/bold] "
+                f"(see `social history {entry.id}`)"
             )
-            store.add_entry(new_entry)
-            console.print(f"[green]Saved[/green] with ID: [bold]{new_entry.id}[/bold]")
 
 
 @cli.group(invoke_without_command=True)
 @click.option("--platform", "-p", type=PLATFORM_CHOICES, default=None)
 @click.option("--status", type=STATUS_CHOICES, default=None)
-@click.option("--week", "-w", is_flag=True, help="Show week view.")
+@click.option("--week", "-w", is_flag=True, help="Show this week as a grid.")
+@click.option("--weeks", type=click.IntRange(1, 52), default=None, help="Show N weeks as a grid.")
+@click.option(
+    "--month", is_flag=False, flag_value="this", default=None, metavar="[YYYY-MM]",
+    help="Show a month as a grid (default: this month).",
+)
+@click.option("--from", "date_from", default=None, metavar="DATE",
+              help="First week shown by --week/--weeks (YYYY-MM-DD).")
+@click.option("--no-pager", is_flag=True, help="Print everything instead of paging on a terminal.")
+@click.option("--watch", is_flag=True, help="Keep the calendar open and redraw it on changes.")
+@click.option("--interval", default=1.0, show_default=True, help="Seconds between change checks in --watch mode.")
+@click.option("--include-archived", is_flag=True, help="Also show archived published entries.")
 @click.pass_context
-def calendar(ctx, platform, status, week):
+def calendar(
+    ctx, platform, status, week, weeks, month, date_from, no_pager, watch, interval, include_archived
+):
     """View and manage the content calendar."""
     if ctx.invoked_subcommand is None:
         plat = Platform(platform) if platform else None
         stat = ContentStatus(status) if status else None
-        display_calendar(store, platform=plat, status=stat, week=week, console=console)
+        period = _calendar_period(week, weeks, month, date_from)
+
+        if _root_option("all_workspaces"):
+            if watch:
+                raise click.UsageError("--watch follows a single workspace.")
+            from social.workspaces import list_across, list_workspaces
+
+            pairs = list_across(list_workspaces(), plat, stat, include_archived)
+            if period is not None:
+                lo, hi = period.start.isoformat(), period.end.isoformat()
+                pairs = [
+                    (name, e) for name, e in pairs
+                    if e.scheduled_date and lo <= e.scheduled_date[:10] <= hi
+                ]
+            _show_across(pairs, "Content Calendar (all workspaces)", period=period)
+            return
+
+        if watch:
+            if period is not None:
+                raise click.UsageError("--watch shows the full calendar table.")
+            from social.watch import watch_calendar
+
+            try:
+                watch_calendar(
+                    _get_store(), platform=plat, status=stat,
+                    console=_get_console(), interval=interval,
+                )
+            except KeyboardInterrupt:
+                pass
+            return
+
+        if _machine_output():
+            if period is not None:
+                from social.series import SeriesBook
+
+                entries = SeriesBook(_get_store()).scheduled_between(
+                    period.start, period.end, plat, stat, include_archived
+                )
+            else:
+                entries = _get_store().list_entries(
+                    platform=plat, status=stat, include_archived=include_archived
+                )
+            _emit(e.to_dict() for e in entries)
+            return
+
+        from social.calendar import display_calendar
+
+        console = _get_console()
+        display_calendar(
+            _get_store(), platform=plat, status=stat, console=console,
+            include_archived=include_archived, period=period,
+            pager=not no_pager and console.is_interactive and sys.stdin.isatty(),
+        )
+
+
+def _calendar_period(week: bool, weeks, month, date_from):
+    """The grid period picked by --week/--weeks/--month, or None for the table."""
+    if sum((week, weeks is not None, month is not None)) > 1:
+        raise click.UsageError("Use only one of --week, --weeks and --month.")
+    if date_from and month is not None:
+        raise click.UsageError("--from sets the first week; pick a month with --month YYYY-MM.")
+    from social.calendar import Period
+
+    if month is not None:
+        if month == "this":
+            return Period.for_month(date.today())
+        try:
+            return Period.for_month(datetime.strptime(month, "%Y-%m").date())
+        except ValueError:
+            raise click.BadParameter(f"Invalid month: {month} (expected YYYY-MM)", param_hint="--month")
+    if week or weeks is not None or date_from:
+        start = _parse_date(date_from, "--from") if date_from else date.today()
+        return Period.for_weeks(start, weeks or 1)
+    return None
+
+
+def _show_across(pairs, title: str, period=None) -> None:
+    """Print ``(workspace, entry)`` pairs from several workspaces."""
+    if _machine_output():
+        _emit({**e.to_dict(), "workspace": name} for name, e in pairs)
+        return
+    console = _get_console()
+    if period is not None:
+        from social.calendar import render_weeks_view
+
+        console.print(render_weeks_view([e for _, e in pairs], period))
+        return
+    if not pairs:
+        console.print("[dim]No content entries found.[/dim]")
+        return
+    from social.calendar import render_calendar_table
+
+    names = [name for name, _ in pairs]
+    console.print(render_calendar_table([e for _, e in pairs], title, workspaces=names))
 
 
 @calendar.command("add")
-@click.option("--platform", "-p", type=PLATFORM_CHOICES, prompt="Platform")
-@click.option("--content", "-c", prompt="Content text")
-@click.option("--topic", "-t", prompt="Topic")
+@click.option(
+    "--stdin", "from_stdin", is_flag=True, is_eager=True,
+    help="Read entries as NDJSON records from standard input.",
+)
+@click.option("--platform", "-p", type=PLATFORM_CHOICES, callback=_prompt_unless_stdin("Platform"))
+@click.option("--content", "-c", callback=_prompt_unless_stdin("Content text"))
+@click.option("--topic", "-t", callback=_prompt_unless_stdin("Topic"))
 @click.option("--schedule", "-s", default=None, help="Schedule date (YYYY-MM-DD).")
 @click.option("--status", default="draft", type=STATUS_CHOICES)
-def calendar_add(platform, content, topic, schedule, status):
+def calendar_add(from_stdin, platform, content, topic, schedule, status):
     """Manually add content to the calendar."""
+    from social.calendar import display_entry_detail
+
+    console = _get_console()
+    store = _get_store()
+
+    if from_stdin:
+        from social.ndjson import entry_from_record
+
+        try:
+            entries = [entry_from_record(r) for r in _read_stdin_records()]
+            store.add_entries(entries)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="stdin")
+        if _machine_output():
+            _emit(e.to_dict() for e in entries)
+        else:
+            console.print(f"[green]Added[/green] {len(entries)} entries")
+        return
+
     entry = ContentEntry.new(
         platform=Platform(platform),
         content=content,
@@ -112,6 +462,9 @@ def calendar_add(platform, content, topic, schedule, status):
         status=ContentStatus(status),
     )
     store.add_entry(entry)
+    if _machine_output():
+        _emit([entry.to_dict()])
+        return
     console.print(f"[green]Added[/green] entry [bold]{entry.id}[/bold]")
     display_entry_detail(entry, console=console)
 
@@ -119,6 +472,28 @@ def calendar_add(platform, content, topic, schedule, status):
 @cli.command()
 def platforms():
     """List supported platforms and their constraints."""
+    from social.platforms import list_platforms
+
+    if _machine_output():
+        _emit(
+            {
+                "platform": config.platform.value,
+                "name": config.name,
+                "max_length": config.max_length,
+                "tone": config.tone,
+                "hashtag_style": config.hashtag_style,
+                "description": config.description,
+                "length_counting": config.length_counting,
+                "max_hashtags": config.max_hashtags,
+                "max_lines": config.max_lines,
+                "banned_terms": list(config.banned_terms),
+            }
+            for config in list_platforms()
+        )
+        return
+
+    from rich.table import Table
+
     table = Table(title="Supported Platforms")
     table.add_column("Platform", style="bold")
     table.add_column("Max Length", justify="right")
@@ -133,8 +508,189 @@ def platforms():
             config.hashtag_style,
         )
 
+    _get_console().print(table)
+
+
+@cli.command()
+@click.argument("query")
+@click.option("--platform", "-p", type=PLATFORM_CHOICES, default=None)
+@click.option("--status", type=STATUS_CHOICES, default=None)
+@click.option("--include-archived", is_flag=True, help="Also search archived entries.")
+def search(query, platform, status, include_archived):
+    """Find posts whose topic or content contains every word of QUERY."""
+    plat = Platform(platform) if platform else None
+    stat = ContentStatus(status) if status else None
+    if _root_option("all_workspaces"):
+        from social.workspaces import list_workspaces, search_across
+
+        pairs = search_across(list_workspaces(), query, plat, stat, include_archived)
+        _show_across(pairs, f"Search: {query} (all workspaces)")
+        return
+
+    entries = _get_store().search(query, plat, stat, include_archived)
+    if _machine_output():
+        _emit(e.to_dict() for e in entries)
+        return
+    console = _get_console()
+    if not entries:
+        console.print("[dim]No matching entries.[/dim]")
+        return
+    from social.calendar import render_calendar_table
+
+    console.print(render_calendar_table(entries, f"Search: {query}"))
+
+
+@cli.group()
+def workspace():
+    """Manage workspaces (one store per brand)."""
+    pass
+
+
+@workspace.command("list")
+def workspace_list():
+    """List workspaces and their store files."""
+    from social.workspaces import list_workspaces, workspace_path
+
+    rows = []
+    for name in list_workspaces():
+        path = workspace_path(name)
+        size = path.stat().st_size if path.exists() else 0
+        rows.append({"workspace": name, "path": str(path), "bytes": size})
+    if _machine_output():
+        _emit(rows)
+        return
+
+    from rich.table import Table
+
+    current = _root_option("workspace") or "default"
+    table = Table(title="Workspaces")
+    table.add_column("Workspace", style="bold")
+    table.add_column("Store")
+    table.add_column("Size", justify="right")
+    for row in rows:
+        marker = " *" if row["workspace"] == current else ""
+        table.add_row(row["workspace"] + marker, row["path"], f"{row['bytes'] / 1024:.0f} KB")
+    _get_console().print(table)
+
+
+@workspace.command("create")
+@click.argument("name")
+def workspace_create(name):
+    """Create an empty workspace called NAME."""
+    from social.workspaces import WorkspaceError, create_workspace
+
+    try:
+        path = create_workspace(name)
+    except WorkspaceError as e:
+        raise click.BadParameter(str(e), param_hint="NAME")
+    if _machine_output():
+        _emit([{"workspace": name, "path": str(path)}])
+        return
+    _get_console().print(f"[green]Created[/green] workspace [bold]{name}[/bold] ({path})")
+    _get_console().print(f"[dim]Use it with: social --workspace {name} ...[/dim]")
+
+
+@cli.command()
+def models():
+    """Show which model each platform and task is routed to, and recent model health.
+
+    Health and decisions accumulate within one process (``social shell`` or
+    ``social serve``), so a fresh invocation shows routes only.
+    """
+    from social import generator
+    from social.routing import DRAFT, REGENERATE, SHORTEN
+
+    router = generator.router
+    routes = []
+    for plat in Platform:
+        for task in (DRAFT, REGENERATE, SHORTEN):
+            tier, attempts = router.plan(plat, task)
+            routes.append({"platform": plat.value, "task": task, "tier": tier,
+                           "models": [model for model, _ in attempts], "reason": attempts[0][1]})
+    snapshot = router.snapshot()
+
+    if _machine_output():
+        _emit([{"routes": routes, **snapshot}])
+        return
+
+    from rich.table import Table
+
+    console = _get_console()
+    table = Table(title="Model routes")
+    table.add_column("Platform", style="bold")
+    table.add_column("Task")
+    table.add_column("Tier")
+    table.add_column("Models (in order)")
+    for route in routes:
+        models_text = " -> ".join(route["models"])
+        if route["reason"] != "primary":
+            models_text += f" [yellow]({route['reason']})[/yellow]"
+        table.add_row(route["platform"], route["task"], route["tier"], models_text)
     console.print(table)
 
+    if snapshot["models"]:
+        health = Table(title="Model health (this session)")
+        health.add_column("Model", style="bold")
+        for column in ("Calls", "Median ms", "Error rate"):
+            health.add_column(column, justify="right")
+        health.add_column("Cooling down")
+        for model, stats in snapshot["models"].items():
+            latency = stats["median_latency_ms"]
+            health.add_row(model, str(stats["calls"]), "--" if latency is None else f"{latency:.0f}",
+                           f"{stats['error_rate']:.0%}", "yes" if stats["cooling_down"] else "")
+        console.print(health)
+
+
+@cli.command()
+@click.option("--platform", "-p", type=PLATFORM_CHOICES, default=None, help="Only check this platform.")
+@click.option("--status", type=STATUS_CHOICES, default=None, help="Only check entries with this status.")
+@click.option("--config", "config_path", type=click.Path(exists=True, dir_okay=False), default=None,
+              help="Platform config (TOML or JSON) to validate against instead of the active one.")
+@click.option("--include-archived", is_flag=True, help="Also check archived entries.")
+def validate(platform, status, config_path, include_archived):
+    """Check stored posts against platform rules (length, hashtags, lines, banned terms).
+
+    Exits with status 1 when any post breaks a rule.
+    """
+    from social.platforms import PlatformConfigError, load_platforms
+    from social.validation import validate_records
+
+    configs = None
+    if config_path:
+        try:
+            configs = load_platforms(Path(config_path))
+        except PlatformConfigError as e:
+            raise click.BadParameter(str(e), param_hint="--config")
+
+    records = _get_store().iter_raw(include_archived=include_archived)
+    if platform or status:
+        records = (
+            r for r in records
+            if (platform is None or r["platform"] == platform) and (status is None or r["status"] == status)
+        )
+    violations = list(validate_records(records, configs))
+
+    if _machine_output():
+        _emit(v.to_dict() for v in violations)
+    elif not violations:
+        _get_console().print("[green]All posts pass platform rules.[/green]")
+    else:
+        from rich.table import Table
+
+        table = Table(title="Platform rule violations")
+        table.add_column("ID", style="dim", width=10)
+        table.add_column("Platform", width=12)
+        table.add_column("Rule")
+        table.add_column("Problem")
+        for v in violations:
+            table.add_row(v.entry_id, v.platform.value.title(), v.rule, v.message)
+        console = _get_console()
+        console.print(table)
+        posts = len({v.entry_id for v in violations})
+        console.print(f"[red]{len(violations)} violation(s) in {posts} post(s)[/red]")
+    if violations:
+        raise SystemExit(1)
+
 
 @cli.command()
 @click.argument("entry_id")
@@ -143,17 +699,66 @@ def platforms():
 @click.option("--status", default=None, type=STATUS_CHOICES)
 @click.option("--regenerate", "-r", is_flag=True, help="Regenerate content using AI.")
 def edit(entry_id, content, schedule, status, regenerate):
-    """Edit an existing content entry."""
-    entry = store.get_entry(entry_id)
+    """Edit an existing content entry.
+
+    Pass - as ENTRY_ID to read NDJSON update records (each with a full "id")
+    from standard input and apply them in one write.
+    """
+    from social.calendar import display_entry_detail
+    from social.store import EntryNotFoundError
+
+    console = _get_console()
+    store = _get_store()
+
+    if entry_id == "-":
+        updates = {}
+        for record in _read_stdin_records():
+            record = dict(record)
+            target = record.pop("id", None)
+            if not target:
+                raise click.BadParameter("Record without an id", param_hint="stdin")
+            fields = {k: v for k, v in record.items() if k in EDITABLE_FIELDS}
+            try:
+                if "platform" in fields:
+                    fields["platform"] = Platform(fields["platform"])
+                if "status" in fields:
+                    fields["status"] = ContentStatus(fields["status"])
+            except ValueError as e:
+                raise click.BadParameter(f"{target}: {e}", param_hint="stdin")
+            updates[target] = fields
+        try:
+            updated = store.update_entries(updates)
+        except EntryNotFoundError as e:
+            console.print(f"[red]{e}[/red]")
+            raise SystemExit(1)
+        if _machine_output():
+            _emit(e.to_dict() for e in updated)
+        else:
+            console.print(f"[green]Updated[/green] {len(updated)} entries")
+        return
+
+    entry = store.get_entry(entry_id, include_archived=False)
+    book = None
+    if entry is None and "@" in entry_id:
+        # A planned series occurrence: stored as an entry once it is edited
+        from social.series import SeriesBook
+
+        book = SeriesBook(store)
+        try:
+            entry = book.placeholder(entry_id)
+        except EntryNotFoundError:
+            entry = None
     if entry is None:
         console.print(f"[red]Entry not found:[/red] {entry_id}")
         raise SystemExit(1)
 
     if regenerate:
+        from social.generator import GenerationError, regenerate_content
+
         feedback = click.prompt("Feedback for regeneration (optional)", default="", show_default=False)
         with console.status("Regenerating..."):
             try:
-                new_content = regenerate_content(entry, feedback)
+                new_content = regenerate_content(entry, feedback, client=client)
             except GenerationError as e:
                 console.print(f"[red]Error:[/red] {e}")
                 raise SystemExit(1)
@@ -173,16 +778,25 @@ def edit(entry_id, content, schedule, status, regenerate):
         kwargs["status"] = ContentStatus(status)
 
     if not kwargs:
+        if _machine_output():
+            _emit([entry.to_dict()])
+            return
         console.print("[dim]No changes specified.[/dim]")
         display_entry_detail(entry, console=console)
         return
 
     try:
-        updated = store.update_entry(entry.id, **kwargs)
+        if book is not None:
+            updated = book.materialize(entry.id, **kwargs)
+        else:
+            updated = store.update_entry(entry.id, **kwargs)
     except EntryNotFoundError:
         console.print(f"[red]Entry not found:[/red] {entry_id}")
         raise SystemExit(1)
 
+    if _machine_output():
+        _emit([updated.to_dict()])
+        return
     console.print("[green]Updated![/green]")
     display_entry_detail(updated, console=console)
 
@@ -191,22 +805,667 @@ def edit(entry_id, content, schedule, status, regenerate):
 @click.argument("entry_id")
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation.")
 def delete(entry_id, force):
-    """Delete a content entry from the calendar."""
-    entry = store.get_entry(entry_id)
+    """Delete a content entry from the calendar.
+
+    Pass - as ENTRY_ID (with --force) to read NDJSON records with an "id"
+    from standard input and delete them in one write.
+    """
+    from social.calendar import display_entry_detail
+    from social.store import EntryNotFoundError
+
+    console = _get_console()
+    store = _get_store()
+
+    if entry_id == "-":
+        if not force:
+            raise click.UsageError("Reading IDs from stdin requires --force.")
+        ids = [r.get("id") for r in _read_stdin_records()]
+        if not all(ids):
+            raise click.BadParameter("Record without an id", param_hint="stdin")
+        try:
+            deleted = store.delete_entries(ids)
+        except EntryNotFoundError as e:
+            console.print(f"[red]{e}[/red]")
+            raise SystemExit(1)
+        if _machine_output():
+            _emit(e.to_dict() for e in deleted)
+        else:
+            console.print(f"[green]Deleted[/green] {len(deleted)} entries")
+        return
+
+    entry = store.get_entry(entry_id, include_archived=False)
+    book = None
+    if entry is None and "@" in entry_id:
+        # A planned series occurrence: stored as an entry once it is edited
+        from social.series import SeriesBook
+
+        book = SeriesBook(store)
+        try:
+            entry = book.placeholder(entry_id)
+        except EntryNotFoundError:
+            entry = None
     if entry is None:
         console.print(f"[red]Entry not found:[/red] {entry_id}")
         raise SystemExit(1)
 
-    display_entry_detail(entry, console=console)
+    if not _machine_output():
+        display_entry_detail(entry, console=console)
 
     if not force and not click.confirm("Delete this entry?", default=False):
         console.print("[dim]Cancelled.[/dim]")
         return
 
     try:
-        store.delete_entry(entry.id)
+        if book is not None:
+            # Nothing is stored yet: drop the date from the series instead
+            series, day = book.resolve(entry.id)
+            book.skip(series.id, day)
+        else:
+            store.delete_entry(entry.id)
     except EntryNotFoundError:
         console.print(f"[red]Entry not found:[/red] {entry_id}")
         raise SystemExit(1)
 
+    if _machine_output():
+        _emit([entry.to_dict()])
+        return
     console.print(f"[green]Deleted[/green] entry [bold]{entry.id}[/bold]")
+
+
+@cli.command()
+@click.argument("entry_id")
+@click.option("--show", "show_rev", type=int, default=None, help="Print the content of one revision.")
+@click.option("--rollback", "rollback_rev", type=int, default=None,
+              help="Restore the content of a revision (saved as a new revision).")
+def history(entry_id, show_rev, rollback_rev):
+    """Show the content revisions of an entry, or roll back to one."""
+    from social.store import EntryNotFoundError
+
+    console = _get_console()
+    store = _get_store()
+
+    try:
+        if rollback_rev is not None:
+            entry = store.revert_entry(entry_id, rollback_rev)
+        revisions = store.revisions(entry_id)
+    except EntryNotFoundError:
+        console.print(f"[red]Entry not found:[/red] {entry_id}")
+        raise SystemExit(1)
+    except KeyError as e:
+        console.print(f"[red]{e.args[0]}[/red]")
+        raise SystemExit(1)
+
+    if rollback_rev is not None:
+        if _machine_output():
+            _emit([entry.to_dict()])
+        else:
+            console.print(
+                f"[green]Restored[/green] revision {rollback_rev} of [bold]{entry.id}[/bold] "
+                f"as revision {revisions[-1].rev}"
+            )
+        return
+
+    if show_rev is not None:
+        revisions = [r for r in revisions if r.rev == show_rev]
+        if not revisions:
+            console.print(f"[red]No revision {show_rev} for entry {entry_id}[/red]")
+            raise SystemExit(1)
+
+    if _machine_output():
+        _emit({"rev": r.rev, "at": r.at, "content": r.content} for r in revisions)
+        return
+    if show_rev is not None:
+        console.print(revisions[0].content)
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"History of {entry_id}")
+    table.add_column("Rev", justify="right")
+    table.add_column("Saved", style="dim")
+    table.add_column("Chars", justify="right")
+    table.add_column("Change", justify="right")
+    table.add_column("Content", max_width=60)
+    previous = None
+    for r in revisions:
+        change = "" if previous is None else f"{len(r.content) - len(previous):+d}"
+        saved = r.at[:16].replace("T", " ") if r.at else "-"
+        preview = r.content[:80] + ("..." if len(r.content) > 80 else "")
+        table.add_row(str(r.rev), saved, str(len(r.content)), change, preview)
+        previous = r.content
+    console.print(table)
+
+
+@cli.command()
+@click.option("--platform", "-p", type=PLATFORM_CHOICES, default=None)
+@click.option("--threshold", default=0.8, show_default=True, help="Minimum estimated similarity (0-1).")
+def dedupe(platform, threshold):
+    """Report clusters of near-duplicate posts across the store."""
+    from social.dedupe import DuplicateIndex
+
+    clusters = DuplicateIndex(_get_store()).clusters(threshold=threshold)
+    if platform:
+        clusters = [c for c in clusters if c[0].platform.value == platform]
+
+    if _machine_output():
+        _emit(
+            {**e.to_dict(), "cluster": n}
+            for n, cluster in enumerate(clusters, start=1)
+            for e in cluster
+        )
+        return
+
+    console = _get_console()
+    if not clusters:
+        console.print("[green]No near-duplicates found.[/green]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"{len(clusters)} near-duplicate cluster(s)")
+    table.add_column("#", justify="right")
+    table.add_column("ID", style="bold")
+    table.add_column("Platform")
+    table.add_column("Topic")
+    table.add_column("Content", max_width=60)
+    for n, cluster in enumerate(clusters, start=1):
+        for i, e in enumerate(cluster):
+            preview = e.content[:80] + ("..." if len(e.content) > 80 else "")
+            table.add_row(str(n) if i == 0 else "", e.id, e.platform.value, e.topic, preview,
+                          end_section=i == len(cluster) - 1)
+    console.print(table)
+
+
+@cli.command()
+@click.option("--from", "date_from", default=None, help="Only posts dated on or after this date.")
+@click.option("--to", "date_to", default=None, help="Only posts dated on or before this date.")
+@click.option("--platform", "-p", type=PLATFORM_CHOICES, default=None)
+@click.option("--top", default=10, show_default=True, help="Rows per ranking.")
+def hashtags(date_from, date_to, platform, top):
+    """Rank hashtags by frequency, co-occurrence and recency.
+
+    Posts are dated by their scheduled date, or creation date if unscheduled.
+    """
+    from social.hashtags import HashtagIndex
+
+    start = _parse_date(date_from, "--from") if date_from else None
+    end = _parse_date(date_to, "--to") if date_to else None
+    report = HashtagIndex(_get_store()).report(
+        start, end, Platform(platform) if platform else None, top=top
+    )
+
+    if _machine_output():
+        _emit([report.to_dict()])
+        return
+
+    console = _get_console()
+    if not report.frequency:
+        console.print("[dim]No hashtags found.[/dim]")
+        return
+
+    from rich.table import Table
+
+    frequency = Table(title=f"Most used ({report.tagged_posts} posts with hashtags)")
+    frequency.add_column("Hashtag", style="bold")
+    frequency.add_column("Posts", justify="right")
+    frequency.add_column("Share", justify="right")
+    frequency.add_column("Last used")
+    for t in report.frequency:
+        frequency.add_row(t.tag, str(t.count), f"{t.count / report.tagged_posts:.0%}", t.last_used)
+    console.print(frequency)
+
+    if report.cooccurrence:
+        pairs = Table(title="Used together")
+        pairs.add_column("Hashtags", style="bold")
+        pairs.add_column("Posts", justify="right")
+        for a, b, n in report.cooccurrence:
+            pairs.add_row(f"{a} + {b}", str(n))
+        console.print(pairs)
+
+    recent = Table(title="Most recently used")
+    recent.add_column("Hashtag", style="bold")
+    recent.add_column("Last used")
+    recent.add_column("Posts", justify="right")
+    for t in report.recency:
+        recent.add_row(t.tag, t.last_used, str(t.count))
+    console.print(recent)
+
+
+@cli.group()
+def schedule():
+    """Automatically schedule draft content."""
+    pass
+
+
+@schedule.command("auto")
+@click.option("--start", default=None, help="First schedulable date (YYYY-MM-DD). Defaults to today.")
+@click.option("--days", default=365, show_default=True, help="Scheduling horizon in days.")
+@click.option("--cap", multiple=True, help="Daily cap per platform, e.g. twitter=3.")
+@click.option("--spacing", default=2, show_default=True, help="Minimum days between posts on the same topic.")
+@click.option("--blackout", multiple=True, help="Date to keep free (YYYY-MM-DD).")
+@click.option("--dry-run", is_flag=True, help="Show the plan without saving it.")
+def schedule_auto(start, days, cap, spacing, blackout, dry_run):
+    """Assign dates to unscheduled drafts."""
+    from social.scheduler import DEFAULT_DAILY_CAPS, ScheduleRules, schedule_drafts
+
+    console = _get_console()
+    store = _get_store()
+    caps = dict(DEFAULT_DAILY_CAPS)
+    caps.update(_parse_platform_limits(cap, "--cap"))
+    rules = ScheduleRules(
+        daily_caps=caps,
+        topic_spacing_days=spacing,
+        blackout_dates=frozenset(_parse_date(d, "--blackout") for d in blackout),
+    )
+    start_date = _parse_date(start, "--start") if start else None
+
+    result = schedule_drafts(store, rules, start=start_date, horizon_days=days, dry_run=dry_run)
+
+    if _machine_output():
+        records = [{"id": i, "scheduled_date": d} for i, d in result.assignments.items()]
+        records += [{"id": i, "error": "unplaced"} for i in result.unplaced]
+        _emit(records)
+        return
+
+    if not result.assignments and not result.unplaced:
+        console.print("[dim]No unscheduled drafts found.[/dim]")
+        return
+
+    verb = "Would schedule" if dry_run else "Scheduled"
+    console.print(f"[green]{verb}[/green] {len(result.assignments)} entries")
+    if result.assignments:
+        dates = sorted(result.assignments.values())
+        console.print(f"[dim]From {dates[0]} to {dates[-1]}[/dim]")
+    if result.unplaced:
+        console.print(
+            f"[yellow]{len(result.unplaced)} drafts did not fit in the {days}-day horizon[/yellow]"
+        )
+
+
+@cli.group()
+def series():
+    """Recurring content, expanded from rules instead of stored per post."""
+    pass
+
+
+@series.command("add")
+@click.option("--platform", "-p", type=PLATFORM_CHOICES, prompt="Platform")
+@click.option("--topic", "-t", prompt="Topic")
+@click.option("--every", "freq", type=click.Choice(["day", "week", "month"]), default="week", show_default=True)
+@click.option("--interval", default=1, show_default=True, help="Repeat every N days/weeks/months.")
+@click.option("--on", "weekdays", default=None, help="Weekdays for weekly series, e.g. tue,thu.")
+@click.option("--start", default=None, help="First occurrence (YYYY-MM-DD). Defaults to today.")
+@click.option("--until", default=None, help="Last possible occurrence (YYYY-MM-DD).")
+@click.option("--count", type=int, default=None, help="Number of occurrences.")
+@click.option("--time", "at", default=None, metavar="HH:MM", help="Time of day for each occurrence.")
+@click.option("--content", "-c", default="", help="Fixed text for every occurrence (default: generate from the topic).")
+@click.option("--lead-days", default=3, show_default=True, help="Days ahead that `series generate` creates each post.")
+def series_add(platform, topic, freq, interval, weekdays, start, until, count, at, content, lead_days):
+    """Add a recurring series."""
+    from social.series import Recurrence, Series, SeriesBook, SeriesError, parse_weekday
+
+    if until and count:
+        raise click.UsageError("Use --until or --count, not both.")
+    if at is not None:
+        try:
+            datetime.strptime(at, "%H:%M")
+        except ValueError:
+            raise click.BadParameter(f"Invalid time: {at} (expected HH:MM)", param_hint="--time")
+    try:
+        rule = Recurrence(
+            {"day": "daily", "week": "weekly", "month": "monthly"}[freq],
+            _parse_date(start, "--start") if start else date.today(),
+            interval,
+            tuple(parse_weekday(d) for d in weekdays.split(",")) if weekdays else (),
+            _parse_date(until, "--until") if until else None,
+            count,
+        )
+    except SeriesError as e:
+        raise click.UsageError(str(e))
+    added = SeriesBook(_get_store()).add(
+        Series.new(Platform(platform), topic, rule, content=content, time=at, lead_days=lead_days)
+    )
+    if _machine_output():
+        _emit([added.to_dict()])
+        return
+    _get_console().print(
+        f"[green]Added[/green] series [bold]{added.id}[/bold]: {topic} ({rule.describe()})"
+    )
+
+
+@series.command("list")
+def series_list():
+    """List recurring series and their next occurrence."""
+    from social.series import SeriesBook
+
+    all_series = SeriesBook(_get_store()).list()
+    today = date.today()
+    if _machine_output():
+        _emit(s.to_dict() for s in all_series)
+        return
+    console = _get_console()
+    if not all_series:
+        console.print("[dim]No series found.[/dim]")
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Series")
+    table.add_column("ID", style="dim")
+    table.add_column("Platform")
+    table.add_column("Topic")
+    table.add_column("Repeats")
+    table.add_column("Next")
+    table.add_column("Stored", justify="right")
+    for s in all_series:
+        upcoming = next(s.rule.between(today, date.max), None)
+        table.add_row(
+            s.id, s.platform.value.title(), s.topic, s.rule.describe(),
+            upcoming.isoformat() if upcoming else "--", str(len(s.occurrences)),
+        )
+    console.print(table)
+
+
+@series.command("show")
+@click.argument("series_id")
+@click.option("--from", "date_from", default=None, help="First date (YYYY-MM-DD). Defaults to today.")
+@click.option("--to", "date_to", default=None, help="Last date (YYYY-MM-DD). Defaults to 8 weeks on.")
+def series_show(series_id, date_from, date_to):
+    """Show a series' occurrences in a date range."""
+    from social.series import SeriesBook
+
+    found = SeriesBook(_get_store()).get(series_id)
+    if found is None:
+        _get_console().print(f"[red]Series not found:[/red] {series_id}")
+        raise SystemExit(1)
+    start = _parse_date(date_from, "--from") if date_from else date.today()
+    end = _parse_date(date_to, "--to") if date_to else start + timedelta(weeks=8)
+
+    rows = []
+    for day in found.rule.between(start, end):
+        iso = day.isoformat()
+        if iso in found.skipped:
+            rows.append({"id": found.occurrence_id(day), "date": iso, "state": "skipped", "entry": None})
+        elif iso in found.occurrences:
+            rows.append({"id": found.occurrence_id(day), "date": iso, "state": "stored",
+                         "entry": found.occurrences[iso]})
+        else:
+            rows.append({"id": found.occurrence_id(day), "date": iso, "state": "planned", "entry": None})
+    if _machine_output():
+        _emit(rows)
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"{found.topic} ({found.rule.describe()})")
+    table.add_column("Occurrence", style="dim")
+    table.add_column("Date")
+    table.add_column("State")
+    table.add_column("Entry")
+    colors = {"planned": "yellow", "stored": "blue", "skipped": "dim"}
+    for row in rows:
+        color = colors[row["state"]]
+        table.add_row(row["id"], row["date"], f"[{color}]{row['state']}[/{color}]", row["entry"] or "")
+    _get_console().print(table)
+
+
+@series.command("skip")
+@click.argument("series_id")
+@click.argument("day")
+def series_skip(series_id, day):
+    """Drop the occurrence on DAY (YYYY-MM-DD) from a series."""
+    from social.series import SeriesBook, SeriesError
+    from social.store import EntryNotFoundError
+
+    skipped = _parse_date(day, "DAY")
+    try:
+        updated = SeriesBook(_get_store()).skip(series_id, skipped)
+    except (EntryNotFoundError, SeriesError) as e:
+        _get_console().print(f"[red]{e}[/red]")
+        raise SystemExit(1)
+    if _machine_output():
+        _emit([{"series": updated.id, "skipped": skipped.isoformat()}])
+        return
+    _get_console().print(f"[green]Skipped[/green] {day}")
+
+
+@series.command("delete")
+@click.argument("series_id")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation.")
+def series_delete(series_id, force):
+    """Delete a series; posts already created for it are kept."""
+    from social.series import SeriesBook
+    from social.store import EntryNotFoundError
+
+    book = SeriesBook(_get_store())
+    found = book.get(series_id)
+    if found is None:
+        _get_console().print(f"[red]Series not found:[/red] {series_id}")
+        raise SystemExit(1)
+    if not force and not click.confirm(f"Delete series {found.id} ({found.topic})?"):
+        return
+    try:
+        book.delete(found.id)
+    except EntryNotFoundError as e:
+        _get_console().print(f"[red]{e}[/red]")
+        raise SystemExit(1)
+    if _machine_output():
+        _emit([found.to_dict()])
+        return
+    _get_console().print(f"[green]Deleted[/green] series {found.id}")
+
+
+@series.command("generate")
+@click.option("--loop", is_flag=True, help="Keep generating upcoming posts until interrupted.")
+@click.option("--interval", default=3600.0, show_default=True, help="Seconds between passes in --loop mode.")
+@click.option("--concurrency", default=8, show_default=True, help="Concurrent API requests.")
+def series_generate(loop, interval, concurrency):
+    """Create posts for occurrences within each series' lead time."""
+    from social.series import SeriesBook, generate_due, generate_loop
+
+    console = _get_console()
+    book = SeriesBook(_get_store())
+
+    def show(report):
+        if _machine_output():
+            records = [e.to_dict() for e in report.created]
+            records += [{"id": i, "error": error} for i, error in report.failed.items()]
+            _emit(records)
+            return
+        if report.created:
+            console.print(f"[green]Created[/green] {len(report.created)} scheduled posts")
+        for occurrence_id, error in report.failed.items():
+            console.print(f"[red]Failed[/red] {occurrence_id}: {error}")
+        if not report.created and not report.failed and not loop:
+            console.print("[dim]Nothing coming up.[/dim]")
+
+    if loop:
+        try:
+            generate_loop(book, interval=interval, concurrency=concurrency, on_report=show)
+        except KeyboardInterrupt:
+            console.print("[dim]Stopped.[/dim]")
+        return
+
+    report = generate_due(book, concurrency=concurrency)
+    show(report)
+    if report.failed:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.option("--due", is_flag=True, help="Publish scheduled entries whose date has arrived.")
+@click.option("--loop", is_flag=True, help="Keep publishing due entries until interrupted.")
+@click.option("--interval", default=60.0, show_default=True, help="Seconds between passes in --loop mode.")
+@click.option("--adapter", type=click.Choice(["file", "http"]), default="file", show_default=True)
+@click.option("--out", default=None, help="Output directory for the file adapter.")
+@click.option("--url", default=None, help="Base URL for the http adapter.")
+@click.option("--concurrency", multiple=True, help="Concurrent publishes per platform, e.g. twitter=8.")
+@click.option("--rate", multiple=True, help="Max publishes per second per platform, e.g. twitter=5.")
+def publish(due, loop, interval, adapter, out, url, concurrency, rate):
+    """Publish scheduled content through platform adapters."""
+    from social.publisher import (
+        FileAdapter,
+        HTTPAdapter,
+        PlatformLimits,
+        publish_due,
+        publish_loop,
+    )
+
+    console = _get_console()
+    store = _get_store()
+    if not due and not loop:
+        raise click.UsageError("Specify --due or --loop.")
+
+    if adapter == "http":
+        if not url:
+            raise click.UsageError("--url is required for the http adapter.")
+        target = HTTPAdapter(url)
+    else:
+        target = FileAdapter(Path(out) if out else store.path.parent / "published")
+    adapters = {p: target for p in Platform}
+
+    workers = _parse_platform_limits(concurrency, "--concurrency")
+    rates = _parse_platform_limits(rate, "--rate", cast=float)
+    limits = {
+        p: PlatformLimits(
+            concurrency=workers.get(p, PlatformLimits.concurrency),
+            rate_per_second=rates.get(p, PlatformLimits.rate_per_second),
+        )
+        for p in Platform
+    }
+
+    def show(report):
+        if _machine_output():
+            records = [{"id": i, "status": ContentStatus.PUBLISHED.value} for i in report.published]
+            records += [{"id": i, "error": error} for i, error in report.failed.items()]
+            _emit(records)
+            return
+        if report.published:
+            console.print(f"[green]Published[/green] {len(report.published)} entries")
+        for entry_id, error in report.failed.items():
+            console.print(f"[red]Failed[/red] {entry_id}: {error}")
+        if not report.published and not report.failed and not loop:
+            console.print("[dim]Nothing due.[/dim]")
+
+    if loop:
+        try:
+            publish_loop(store, adapters, interval=interval, limits=limits, on_report=show)
+        except KeyboardInterrupt:
+            console.print("[dim]Stopped.[/dim]")
+        return
+
+    report = publish_due(store, adapters, limits=limits)
+    show(report)
+    if report.failed:
+        raise SystemExit(1)
+
+
+@cli.command()
+def shell():
+    """Start an interactive session that keeps the store loaded."""
+    from social.shell import SocialShell
+
+    root_args = ["--format", _output_format()]
+    if _root_option("workspace"):
+        root_args += ["--workspace", _root_option("workspace")]
+    SocialShell(store=_get_store(), root_args=root_args).cmdloop()
+
+
+@cli.command()
+@click.option("--older-than", default=90, show_default=True, help="Archive published entries older than this many days.")
+def archive(older_than):
+    """Move old published entries out of the main store into compressed archive segments."""
+    count = _get_store().archive_published(older_than_days=older_than)
+    if _machine_output():
+        _emit([{"archived": count}])
+        return
+    if count:
+        _get_console().print(f"[green]Archived[/green] {count} published entries")
+    else:
+        _get_console().print("[dim]Nothing to archive.[/dim]")
+
+
+@cli.command("import")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--errors", "errors_path", default=None, type=click.Path(dir_okay=False, path_type=Path),
+              help="Where to write rejected rows (NDJSON). Defaults to PATH.errors.ndjson.")
+@click.option("--workers", default=None, type=int, help="Validation worker processes (default: CPU count).")
+def import_(path, errors_path, workers):
+    """Bulk import entries from a CSV or NDJSON file."""
+    from social.importer import import_file
+
+    console = _get_console()
+    store = _get_store()
+    if errors_path is None:
+        errors_path = path.with_name(path.name + ".errors.ndjson")
+
+    report = import_file(store, path, errors_path=errors_path, workers=workers)
+
+    if _machine_output():
+        _emit([{"imported": report.imported, "rejected": report.rejected}])
+        return
+    console.print(f"[green]Imported[/green] {report.imported} entries")
+    if report.rejected:
+        console.print(f"[yellow]Rejected[/yellow] {report.rejected} rows, see {errors_path}")
+
+
+@cli.command()
+@click.option("--file-format", "-f", "file_format", type=click.Choice(["ics", "csv", "columnar"]),
+              default="csv", show_default=True,
+              help="Format of the exported file (the root --format only affects the summary).")
+@click.option("--from", "date_from", default=None, help="Only entries scheduled on or after this date.")
+@click.option("--to", "date_to", default=None, help="Only entries scheduled on or before this date.")
+@click.option("--output", "-o", default=None, type=click.Path(dir_okay=False, path_type=Path),
+              help="Output file (required for columnar; defaults to stdout otherwise).")
+@click.option("--include-archived", is_flag=True, help="Also export archived published entries.")
+def export(file_format, date_from, date_to, output, include_archived):
+    """Export the calendar as iCalendar, CSV or a columnar file."""
+    from social.exporter import export_columnar, export_csv, export_ics, in_range
+
+    store = _get_store()
+    start = _parse_date(date_from, "--from") if date_from else None
+    end = _parse_date(date_to, "--to") if date_to else None
+    records = in_range(store.iter_raw(include_archived=include_archived), start, end)
+
+    if file_format == "columnar":
+        if output is None:
+            raise click.UsageError("--output is required for the columnar format.")
+        with open(output, "wb") as f:
+            count = export_columnar(records, f)
+    else:
+        writer = export_ics if file_format == "ics" else export_csv
+        if output is None:
+            writer(records, sys.stdout)
+            return
+        with open(output, "w", newline="") as f:
+            count = writer(records, f)
+    if _machine_output():
+        _emit([{"count": count, "output": str(output)}])
+        return
+    _get_console().print(f"[green]Exported[/green] {count} entries to {output}")
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8765, show_default=True)
+@click.option("--workers", default=16, show_default=True, help="Threads for disk writes and API calls.")
+def serve(host, port, workers):
+    """Serve the content store over a local HTTP JSON API."""
+    import asyncio
+
+    from social.server import SocialServer
+
+    server = SocialServer(_get_store(), host=host, port=port, max_workers=workers)
+
+    async def run():
+        await server.start()
+        _get_console().print(f"[green]Serving[/green] on http://{host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        _get_console().print("[dim]Stopped.[/dim]")
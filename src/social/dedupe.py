@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import base64
+import json
+import random
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+
+from social.models import ContentEntry, Platform
+from social.schema import atomic_write_json
+from social.store import ContentStore
+
+
+# Content signatures use 32 hash functions in 8 LSH bands of 4 rows;
+# topic signatures use 16 in 8 bands of 2. A pair lands in a shared bucket
+# with high probability once its similarity is above roughly 0.6 (content)
+# or 0.35 (topic), and candidates are then checked against the threshold.
+CONTENT_PERMS, CONTENT_BANDS = 32, 8
+TOPIC_PERMS, TOPIC_BANDS = 16, 8
+
+CONTENT_THRESHOLD = 0.8
+TOPIC_THRESHOLD = 0.75
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(_MERSENNE)) for _ in range(CONTENT_PERMS)]
+
+_WORD_RE = re.compile(r"[\w#@']+")
+
+
+def tokens(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    """Overlapping word n-grams (single words for very short texts)."""
+    words = tokens(text)
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(features: Iterable[str], perms: int = CONTENT_PERMS) -> Tuple[int, ...]:
+    hashes = [zlib.crc32(f.encode("utf-8")) for f in features]
+    if not hashes:
+        return (0,) * perms
+    return tuple(
+        min((a * h + b) % _MERSENNE for h in hashes) & 0xFFFFFFFF
+        for a, b in _PERMS[:perms]
+    )
+
+
+def estimate(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _bands(sig: Tuple[int, ...], bands: int) -> List[tuple]:
+    rows = len(sig) // bands
+    return [(i, sig[i * rows:(i + 1) * rows]) for i in range(bands)]
+
+
+def _pack(sig: Tuple[int, ...]) -> str:
+    return base64.b64encode(struct.pack(f"<{len(sig)}I", *sig)).decode("ascii")
+
+
+def _unpack(data: str) -> Tuple[int, ...]:
+    raw = base64.b64decode(data)
+    return struct.unpack(f"<{len(raw) // 4}I", raw)
+
+
+def _fingerprint(record: dict) -> int:
+    return zlib.crc32(f"{record['platform']}\0{record['topic']}\0{record['content']}".encode("utf-8"))
+
+
+@dataclass
+class Match:
+    entry: ContentEntry
+    similarity: float
+
+
+class DuplicateIndex:
+    """MinHash/LSH index over stored content and topics.
+
+    Signatures are cached in a sidecar file next to the store
+    (``content.simindex``) and only recomputed for entries whose platform,
+    topic or content changed. Lookups hash the query, probe one bucket per
+    band and verify the few candidates, so they do not scan the store.
+    """
+
+    def __init__(self, store: ContentStore):
+        self.store = store
+        self.path = store.path.with_suffix(".simindex")
+        self._key = None
+        self._records: Dict[str, dict] = {}
+        self._content_sigs: Dict[str, Tuple[int, ...]] = {}
+        self._topic_sigs: Dict[str, Tuple[int, ...]] = {}
+        self._content_buckets: Dict[tuple, List[str]] = {}
+        self._topic_buckets: Dict[tuple, List[str]] = {}
+
+    def _read_cache(self) -> Dict[str, list]:
+        try:
+            with open(self.path) as f:
+                return json.load(f).get("entries", {})
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_cache(self, cached: Dict[str, list]) -> None:
+        atomic_write_json(self.path, {"version": 1, "entries": cached})
+
+    def refresh(self) -> None:
+        """Bring the index in line with the store; cheap when nothing changed."""
+        self.store._ensure_file()
+        key = self.store._stat_key()
+        if key == self._key:
+            return
+        cached = self._read_cache()
+        fresh: Dict[str, list] = {}
+        records: Dict[str, dict] = {}
+        dirty = False
+        for record in self.store.iter_raw():
+            entry_id = record["id"]
+            records[entry_id] = record
+            fingerprint = _fingerprint(record)
+            hit = cached.get(entry_id)
+            if hit is None or hit[0] != fingerprint:
+                hit = [
+                    fingerprint,
+                    _pack(minhash(shingles(record["content"]))),
+                    _pack(minhash(tokens(record["topic"]), TOPIC_PERMS)),
+                ]
+                dirty = True
+            fresh[entry_id] = hit
+        if dirty or len(fresh) != len(cached):
+            self._write_cache(fresh)
+
+        self._records = records
+        self._content_sigs, self._topic_sigs = {}, {}
+        self._content_buckets, self._topic_buckets = {}, {}
+        for entry_id, (_, content_sig, topic_sig) in fresh.items():
+            platform = records[entry_id]["platform"]
+            self._content_sigs[entry_id] = sig = _unpack(content_sig)
+            for band in _bands(sig, CONTENT_BANDS):
+                self._content_buckets.setdefault((platform, band), []).append(entry_id)
+            self._topic_sigs[entry_id] = sig = _unpack(topic_sig)
+            for band in _bands(sig, TOPIC_BANDS):
+                self._topic_buckets.setdefault((platform, band), []).append(entry_id)
+        self._key = key
+
+    def _matches(self, scored: Dict[str, float], threshold: float) -> List[Match]:
+        matches = [
+            Match(ContentEntry.from_dict(self._records[entry_id]), score)
+            for entry_id, score in scored.items()
+            if score >= threshold
+        ]
+        matches.sort(key=lambda m: (-m.similarity, m.entry.created_at))
+        return matches
+
+    def similar_topics(
+        self,
+        topic: str,
+        platform: Platform,
+        threshold: float = TOPIC_THRESHOLD,
+    ) -> List[Match]:
+        """Entries for ``platform`` whose topic is a near match for ``topic``.
+
+        Meant to be consulted before generating, when only the topic is known.
+        """
+        self.refresh()
+        words = set(tokens(topic))
+        sig = minhash(words, TOPIC_PERMS)
+        candidates = {
+            entry_id
+            for band in _bands(sig, TOPIC_BANDS)
+            for entry_id in self._topic_buckets.get((platform.value, band), ())
+        }
+        scored = {
+            entry_id: jaccard(words, set(tokens(self._records[entry_id]["topic"])))
+            for entry_id in candidates
+        }
+        return self._matches(scored, threshold)
+
+    def similar_content(
+        self,
+        content: str,
+        platform: Platform,
+        threshold: float = CONTENT_THRESHOLD,
+    ) -> List[Match]:
+        """Entries for ``platform`` whose text is a near duplicate of ``content``."""
+        self.refresh()
+        sig = minhash(shingles(content))
+        candidates = {
+            entry_id
+            for band in _bands(sig, CONTENT_BANDS)
+            for entry_id in self._content_buckets.get((platform.value, band), ())
+        }
+        scored = {entry_id: estimate(sig, self._content_sigs[entry_id]) for entry_id in candidates}
+        return self._matches(scored, threshold)
+
+    def clusters(self, threshold: float = CONTENT_THRESHOLD) -> List[List[ContentEntry]]:
+        """Groups of two or more same-platform entries with near-identical text.
+
+        Clusters are returned largest first; entries within a cluster are
+        ordered by creation time.
+        """
+        self.refresh()
+        parent = {entry_id: entry_id for entry_id in self._records}
+
+        def find(x: str) -> str:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        sigs = self._content_sigs
+        for bucket in self._content_buckets.values():
+            if len(bucket) < 2:
+                continue
+            # Identical signatures join directly; the remaining distinct ones
+            # are compared against one representative per group seen so far.
+            by_sig: Dict[Tuple[int, ...], str] = {}
+            for entry_id in bucket:
+                first = by_sig.setdefault(sigs[entry_id], entry_id)
+                if first != entry_id:
+                    parent[find(entry_id)] = find(first)
+            leaders: List[Tuple[int, ...]] = []
+            for sig, entry_id in by_sig.items():
+                for leader in leaders:
+                    if estimate(leader, sig) >= threshold:
+                        parent[find(entry_id)] = find(by_sig[leader])
+                        break
+                else:
+                    leaders.append(sig)
+
+        groups: Dict[str, List[ContentEntry]] = {}
+        for entry_id in self._records:
+            groups.setdefault(find(entry_id), []).append(
+                ContentEntry.from_dict(self._records[entry_id])
+            )
+        result = [sorted(g, key=lambda e: e.created_at) for g in groups.values() if len(g) > 1]
+        result.sort(key=lambda g: (-len(g), g[0].created_at))
+        return result
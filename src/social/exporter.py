@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from json.encoder import encode_basestring_ascii
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from social.models import ContentStatus
+
+
+FIELDS = ["id", "platform", "content", "topic", "created_at", "scheduled_date", "status"]
+
+# Low-cardinality columns are dictionary-encoded in the columnar format.
+DICTIONARY_COLUMNS = ("platform", "status")
+
+COLUMNAR_MAGIC = b"SOCIALCOL1\n"
+
+
+def _encode_value(value) -> bytes:
+    if value is None:
+        return b"null\n"
+    if isinstance(value, str):
+        return encode_basestring_ascii(value).encode("ascii") + b"\n"
+    return json.dumps(value).encode("utf-8") + b"\n"
+
+
+def in_range(
+    records: Iterable[dict],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Iterator[dict]:
+    """Filter records to those scheduled within ``[start, end]`` (inclusive).
+
+    Without bounds every record passes; with bounds, unscheduled records are
+    dropped.
+    """
+    if start is None and end is None:
+        yield from records
+        return
+    lo = start.isoformat() if start else ""
+    hi = end.isoformat() if end else None
+    for record in records:
+        day = (record.get("scheduled_date") or "")[:10]
+        if not day or day < lo or (hi is not None and day > hi):
+            continue
+        yield record
+
+
+def export_csv(records: Iterable[dict], stream: TextIO) -> int:
+    writer = csv.DictWriter(stream, fieldnames=FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+def _ics_escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_fold(line: str) -> str:
+    """Fold a content line to 75 octets per RFC 5545."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Do not split a multi-byte UTF-8 sequence
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def export_ics(records: Iterable[dict], stream: TextIO) -> int:
+    """Write scheduled and published entries as all-day VEVENTs."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    stream.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//social-content//EN\r\n")
+    count = 0
+    for record in records:
+        if record["status"] == ContentStatus.DRAFT.value or not record.get("scheduled_date"):
+            continue
+        try:
+            day = date.fromisoformat(record["scheduled_date"][:10])
+        except ValueError:
+            continue
+        platform = record["platform"].title()
+        summary = f"[{platform}] {record['topic']}"
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{record['id']}@social-content",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(day + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_ics_escape(summary)}",
+            f"DESCRIPTION:{_ics_escape(record['content'])}",
+            f"CATEGORIES:{_ics_escape(platform)}",
+            f"X-SOCIAL-STATUS:{record['status']}",
+            "END:VEVENT",
+        ]
+        stream.write("".join(_ics_fold(line) for line in lines))
+        count += 1
+    stream.write("END:VCALENDAR\r\n")
+    return count
+
+
+def export_columnar(records: Iterable[dict], out: BinaryIO) -> int:
+    """Write records in a stdlib-only column-oriented layout.
+
+    Layout: the magic line, one JSON header line, then one block per column.
+    Each block holds one JSON value per line; dictionary-encoded columns hold
+    integer codes into the header's ``dictionary`` list. Block offsets in the
+    header are relative to the end of the header line, so a reader can seek
+    straight to the columns it needs. Columns are spooled to temporary files
+    while streaming, keeping memory flat.
+    """
+    spools = {name: tempfile.TemporaryFile() for name in FIELDS}
+    dictionaries: Dict[str, Dict[str, int]] = {name: {} for name in DICTIONARY_COLUMNS}
+    plain = [(name, spools[name].write) for name in FIELDS if name not in dictionaries]
+    coded = [(name, spools[name].write, dictionaries[name]) for name in DICTIONARY_COLUMNS]
+    rows = 0
+    try:
+        for record in records:
+            for name, write in plain:
+                write(_encode_value(record.get(name)))
+            for name, write, codes in coded:
+                write(b"%d\n" % codes.setdefault(record.get(name), len(codes)))
+            rows += 1
+
+        columns = []
+        offset = 0
+        for name in FIELDS:
+            length = spools[name].tell()
+            column = {"name": name, "offset": offset, "length": length}
+            if name in dictionaries:
+                column["dictionary"] = list(dictionaries[name])
+            columns.append(column)
+            offset += length
+
+        out.write(COLUMNAR_MAGIC)
+        out.write(json.dumps({"rows": rows, "columns": columns}).encode("utf-8") + b"\n")
+        for name in FIELDS:
+            spools[name].seek(0)
+            shutil.copyfileobj(spools[name], out)
+    finally:
+        for spool in spools.values():
+            spool.close()
+    return rows
+
+
+def read_columnar(path: Path, columns: Optional[List[str]] = None) -> Dict[str, list]:
+    """Read selected columns (all by default) from a columnar export."""
+    with open(path, "rb") as f:
+        if f.readline() != COLUMNAR_MAGIC:
+            raise ValueError(f"Not a columnar export: {path}")
+        header = json.loads(f.readline())
+        data_start = f.tell()
+        by_name = {c["name"]: c for c in header["columns"]}
+        wanted = columns if columns is not None else list(by_name)
+        result = {}
+        for name in wanted:
+            if name not in by_name:
+                raise KeyError(f"Unknown column: {name}")
+            column = by_name[name]
+            f.seek(data_start + column["offset"])
+            values = [json.loads(line) for line in f.read(column["length"]).splitlines()]
+            dictionary = column.get("dictionary")
+            if dictionary is not None:
+                values = [dictionary[v] for v in values]
+            result[name] = values
+    return result
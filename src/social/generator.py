@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import os
+import asyncio
+import weakref
+from typing import Optional, Sequence
 
 import anthropic
 
+from social import trace
 from social.models import ContentEntry, Platform
 from social.platforms import PlatformConfig, get_platform_config
-
-
-DEFAULT_MODEL = "claude-sonnet-4-20250514"
+from social.routing import DRAFT, REGENERATE, SHORTEN, Router
+from social.validation import content_length
 
 SYSTEM_PROMPT = (
     "You are an expert social media content creator. You write platform-specific "
@@ -22,11 +24,19 @@ class GenerationError(Exception):
     pass
 
 
-def _get_model() -> str:
-    return os.environ.get("SOCIAL_MODEL", DEFAULT_MODEL)
+_AUTH_ERROR_MESSAGE = (
+    "API key not set or invalid. "
+    "Set your key: export ANTHROPIC_API_KEY=sk-ant-..."
+)
+
+
+# Shared by every call in the process so latency and error history carry over
+router = Router()
 
 
-def build_prompt(topic: str, config: PlatformConfig, extra: str = "") -> str:
+def build_prompt(
+    topic: str, config: PlatformConfig, extra: str = "", avoid_tags: Sequence[str] = ()
+) -> str:
     prompt = (
         f"Create a {config.name} post about the following topic:\n\n"
         f"Topic: {topic}\n\n"
@@ -37,51 +47,73 @@ def build_prompt(topic: str, config: PlatformConfig, extra: str = "") -> str:
         f"- Format description: {config.description}\n\n"
         f"Example format:\n{config.example_format}"
     )
+    if avoid_tags:
+        tags = ", ".join(f"#{tag.lstrip('#')}" for tag in avoid_tags)
+        prompt += f"\n\nAvoid these recently overused hashtags: {tags}"
     if extra:
         prompt += f"\n\nAdditional instructions: {extra}"
     return prompt
 
 
+def _request(prompt: str, model: str) -> dict:
+    return dict(
+        model=model,
+        max_tokens=1024,
+        system=SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": prompt}],
+    )
+
+
+def _shorten_prompt(content: str, config: PlatformConfig) -> str:
+    return (
+        f"The previous response was {content_length(content, config)} characters. "
+        f"It MUST be under {config.max_length} characters. "
+        f"Rewrite it shorter while keeping the key message:\n\n{content}"
+    )
+
+
+def _regenerate_extra(original: ContentEntry, feedback: str) -> str:
+    if not feedback:
+        return ""
+    return f"The previous version was:\n{original.content}\n\nFeedback: {feedback}"
+
+
+def _create(client: anthropic.Anthropic, prompt: str, platform: Platform, task: str):
+    """Send one request through the router, failing over to the next model on overload."""
+    for attempt in router.attempts(platform, task):
+        with attempt:
+            response = client.messages.create(**_request(prompt, attempt.model))
+        if attempt.ok:
+            return response
+
+
 def generate_content(
     topic: str,
     platform: Platform,
     extra: str = "",
+    client: Optional[anthropic.Anthropic] = None,
+    task: str = DRAFT,
+    avoid_tags: Sequence[str] = (),
 ) -> str:
     config = get_platform_config(platform)
-    user_prompt = build_prompt(topic, config, extra)
+    user_prompt = build_prompt(topic, config, extra, avoid_tags)
 
     try:
-        client = anthropic.Anthropic()
-        response = client.messages.create(
-            model=_get_model(),
-            max_tokens=1024,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
+        if client is None:
+            with trace.span("api.client"):
+                client = anthropic.Anthropic()
+        response = _create(client, user_prompt, platform, task)
     except anthropic.AuthenticationError:
-        raise GenerationError(
-            "API key not set or invalid. "
-            "Set your key: export ANTHROPIC_API_KEY=sk-ant-..."
-        )
+        raise GenerationError(_AUTH_ERROR_MESSAGE)
     except anthropic.APIError as e:
         raise GenerationError(f"API error: {e}")
 
     content = response.content[0].text
 
     # If content exceeds platform limit, retry once asking for shorter version
-    if len(content) > config.max_length:
+    if content_length(content, config) > config.max_length:
         try:
-            retry_prompt = (
-                f"The previous response was {len(content)} characters. "
-                f"It MUST be under {config.max_length} characters. "
-                f"Rewrite it shorter while keeping the key message:\n\n{content}"
-            )
-            response = client.messages.create(
-                model=_get_model(),
-                max_tokens=1024,
-                system=SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": retry_prompt}],
-            )
+            response = _create(client, _shorten_prompt(content, config), platform, SHORTEN)
             content = response.content[0].text
         except anthropic.APIError:
             pass  # Return the original content with a length warning
@@ -92,9 +124,73 @@ def generate_content(
 def regenerate_content(
     original: ContentEntry,
     feedback: str = "",
+    client: Optional[anthropic.Anthropic] = None,
+) -> str:
+    extra = _regenerate_extra(original, feedback)
+    return generate_content(original.topic, original.platform, extra, client=client, task=REGENERATE)
+
+
+# One async client (and so one connection pool) per event loop, shared by
+# every agenerate_content call that does not pass its own.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anthropic.AsyncAnthropic]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_async_client() -> anthropic.AsyncAnthropic:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = anthropic.AsyncAnthropic()
+    return client
+
+
+async def _acreate(client: anthropic.AsyncAnthropic, prompt: str, platform: Platform, task: str):
+    for attempt in router.attempts(platform, task):
+        with attempt:
+            response = await client.messages.create(**_request(prompt, attempt.model))
+        if attempt.ok:
+            return response
+
+
+async def agenerate_content(
+    topic: str,
+    platform: Platform,
+    extra: str = "",
+    client: Optional[anthropic.AsyncAnthropic] = None,
+    task: str = DRAFT,
+    avoid_tags: Sequence[str] = (),
+) -> str:
+    """Async counterpart of :func:`generate_content` using the SDK's async client."""
+    config = get_platform_config(platform)
+    user_prompt = build_prompt(topic, config, extra, avoid_tags)
+
+    try:
+        if client is None:
+            client = _shared_async_client()
+        response = await _acreate(client, user_prompt, platform, task)
+    except anthropic.AuthenticationError:
+        raise GenerationError(_AUTH_ERROR_MESSAGE)
+    except anthropic.APIError as e:
+        raise GenerationError(f"API error: {e}")
+
+    content = response.content[0].text
+
+    if content_length(content, config) > config.max_length:
+        try:
+            response = await _acreate(client, _shorten_prompt(content, config), platform, SHORTEN)
+            content = response.content[0].text
+        except anthropic.APIError:
+            pass
+
+    return content
+
+
+async def aregenerate_content(
+    original: ContentEntry,
+    feedback: str = "",
+    client: Optional[anthropic.AsyncAnthropic] = None,
 ) -> str:
-    config = get_platform_config(original.platform)
-    extra = ""
-    if feedback:
-        extra = f"The previous version was:\n{original.content}\n\nFeedback: {feedback}"
-    return generate_content(original.topic, original.platform, extra)
+    """Async counterpart of :func:`regenerate_content`."""
+    extra = _regenerate_extra(original, feedback)
+    return await agenerate_content(original.topic, original.platform, extra, client=client, task=REGENERATE)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from social.changes import ChangeFeed, ChangeFeedGap
+from social.models import Platform
+from social.schema import atomic_write_json
+from social.store import ContentStore
+
+
+# The lookbehind sits after the "#" so the scan can jump between "#"s
+HASHTAG_RE = re.compile(r"#(?<![\w&]#)\w+")
+
+
+def extract_hashtags(text: str) -> List[str]:
+    """Distinct hashtags in ``text``, lowercased, in order of first use."""
+    return list(dict.fromkeys(tag.lower() for tag in HASHTAG_RE.findall(text)))
+
+
+def _day(record: dict) -> str:
+    return (record.get("scheduled_date") or record["created_at"])[:10]
+
+
+@dataclass
+class TagStats:
+    tag: str
+    count: int
+    last_used: str
+
+
+@dataclass
+class HashtagReport:
+    tagged_posts: int  # posts in range that use at least one hashtag
+    frequency: List[TagStats]  # most used first
+    cooccurrence: List[Tuple[str, str, int]]  # most frequent pairs first
+    recency: List[TagStats]  # most recently used first
+
+    def to_dict(self) -> dict:
+        return {
+            "tagged_posts": self.tagged_posts,
+            "frequency": [vars(t) for t in self.frequency],
+            "cooccurrence": [{"tags": [a, b], "count": n} for a, b, n in self.cooccurrence],
+            "recency": [vars(t) for t in self.recency],
+        }
+
+
+class HashtagIndex:
+    """Per-entry hashtags kept in a sidecar file (``content.tags``).
+
+    The index follows the store's change log: each refresh applies only the
+    events written since the last one, so writers pay nothing and reads
+    never re-scan post text. It is rebuilt from the store when missing or
+    when the change feed reports a gap.
+    """
+
+    def __init__(self, store: ContentStore):
+        self.store = store
+        self.path = store.path.with_suffix(".tags")
+        self._key = None
+        self._feed: Optional[ChangeFeed] = None
+        # id -> (platform, day, tags); only entries that have hashtags
+        self._entries: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        # The same rows sorted by day, rebuilt after a refresh that changed them
+        self._rows: Optional[List[Tuple[str, str, Tuple[str, ...]]]] = None
+        self._days: List[str] = []
+
+    def _write(self) -> None:
+        data = {
+            "version": 1,
+            "feed": list(self._feed.position),
+            "entries": {k: [p, d, list(t)] for k, (p, d, t) in self._entries.items()},
+        }
+        atomic_write_json(self.path, data)
+
+    def _load(self) -> bool:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+        self._feed = ChangeFeed.resume(self.store.changes.path, tuple(data["feed"]))
+        self._entries = {k: (p, d, tuple(t)) for k, (p, d, t) in data["entries"].items()}
+        return True
+
+    def rebuild(self) -> None:
+        """Re-extract every entry's hashtags from the store."""
+        # Start the feed first: writes during the scan are re-applied afterwards
+        self._feed = ChangeFeed(self.store.changes.path)
+        self._entries = {}
+        for record in self.store.iter_raw():
+            self._index(record)
+        self._write()
+
+    def _index(self, record: dict) -> None:
+        entry_id = record["id"]
+        tags = extract_hashtags(record["content"])
+        if tags:
+            self._entries[entry_id] = (record["platform"], _day(record), tuple(tags))
+        else:
+            self._entries.pop(entry_id, None)
+
+    def _apply(self, events: List[dict]) -> None:
+        for event in events:
+            if event["op"] in ("add", "update"):
+                self._index(event["entry"])
+            else:
+                self._entries.pop(event["id"], None)
+
+    def refresh(self) -> None:
+        """Catch up with the store; a single ``stat`` when nothing changed."""
+        self.store._ensure_file()
+        key = self.store._stat_key()
+        if key == self._key:
+            return
+        if self._feed is None and not self._load():
+            self.rebuild()
+        try:
+            events = self._feed.poll()
+        except ChangeFeedGap:
+            self.rebuild()
+            events = self._feed.poll()
+        if events:
+            self._apply(events)
+            self._write()
+        self._rows = None
+        self._key = key
+
+    def tags(self, entry_id: str) -> List[str]:
+        self.refresh()
+        found = self._entries.get(entry_id)
+        return list(found[2]) if found else []
+
+    def _sorted_rows(self) -> List[Tuple[str, str, Tuple[str, ...]]]:
+        if self._rows is None:
+            self._rows = sorted(self._entries.values(), key=lambda row: row[1])
+            self._days = [row[1] for row in self._rows]
+        return self._rows
+
+    def _in_range(self, start: Optional[date], end: Optional[date], platform: Optional[Platform]):
+        rows = self._sorted_rows()
+        lo = bisect_left(self._days, start.isoformat()) if start else 0
+        hi = bisect_right(self._days, end.isoformat()) if end else len(rows)
+        if platform is None:
+            return rows[lo:hi]
+        return [row for row in rows[lo:hi] if row[0] == platform.value]
+
+    def report(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        platform: Optional[Platform] = None,
+        top: int = 10,
+    ) -> HashtagReport:
+        """Frequency, co-occurrence and recency rankings for posts dated in range."""
+        self.refresh()
+        rows = self._in_range(start, end, platform)
+        counts: Counter = Counter()
+        pairs: Counter = Counter()
+        last: Dict[str, str] = {}
+        for _, day, tags in rows:
+            counts.update(tags)
+            for tag in tags:
+                last[tag] = day  # rows are in date order
+            if len(tags) > 1:
+                pairs.update(combinations(sorted(tags), 2))
+        stats = {tag: TagStats(tag, n, last[tag]) for tag, n in counts.items()}
+        frequency = sorted(stats.values(), key=lambda t: (-t.count, t.tag))[:top]
+        recency = sorted(stats.values(), key=lambda t: (t.last_used, t.count), reverse=True)[:top]
+        cooccurrence = [(a, b, n) for (a, b), n in pairs.most_common(top)]
+        return HashtagReport(len(rows), frequency, cooccurrence, recency)
+
+    def overused(
+        self,
+        platform: Platform,
+        days: int = 30,
+        as_of: Optional[date] = None,
+        min_count: int = 3,
+        limit: int = 10,
+    ) -> List[str]:
+        """Tags used at least ``min_count`` times on ``platform`` in the last ``days``."""
+        if as_of is None:
+            as_of = date.today()
+        report = self.report(as_of - timedelta(days=days), as_of, platform, top=limit)
+        return [t.tag for t in report.frequency if t.count >= min_count]
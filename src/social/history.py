@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Store a full copy every this many revisions so rebuilding any version
+# replays a bounded number of deltas.
+KEYFRAME_INTERVAL = 20
+
+_TOKEN_RE = re.compile(r"\s+|[^\s]+")
+
+
+@dataclass
+class Revision:
+    rev: int
+    at: Optional[str]
+    content: str
+
+
+def diff(old: str, new: str) -> list:
+    """Return a delta turning ``old`` into ``new``.
+
+    The delta is a list of ``[start, end, replacement]`` edits against
+    character offsets in ``old``, computed over word/whitespace tokens so
+    typical rewrites produce a handful of small edits.
+    """
+    a = _TOKEN_RE.findall(old)
+    b = _TOKEN_RE.findall(new)
+    a_pos = [0, *accumulate(len(t) for t in a)]
+    ops = []
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            ops.append([a_pos[i1], a_pos[i2], "".join(b[j1:j2])])
+    return ops
+
+
+def patch(text: str, ops: list) -> str:
+    """Apply a delta produced by :func:`diff`."""
+    parts = []
+    pos = 0
+    for start, end, replacement in ops:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+class RevisionLog:
+    """Append-only NDJSON log of content revisions for every entry.
+
+    Each line is ``{"id": ..., "rev": n, "at": ..., "text": ...}`` for a
+    keyframe or ``{..., "delta": [...]}`` for an edit against revision
+    ``n - 1``. An in-memory index of line offsets per entry is extended
+    incrementally as the file grows, so lookups only read that entry's lines.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # entry id -> [(offset, is_keyframe), ...] in revision order
+        self._index: Dict[str, List[Tuple[int, bool]]] = {}
+        self._indexed = 0
+        self._ino = None
+
+    def _refresh(self) -> None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._index, self._indexed, self._ino = {}, 0, None
+            return
+        if st.st_ino != self._ino or st.st_size < self._indexed:
+            self._index, self._indexed, self._ino = {}, 0, st.st_ino
+        if st.st_size == self._indexed:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._indexed)
+            offset = self._indexed
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written; pick it up next time
+                record = json.loads(line)
+                self._index.setdefault(record["id"], []).append((offset, "text" in record))
+                offset += len(line)
+        self._indexed = offset
+
+    def count(self, entry_id: str) -> int:
+        self._refresh()
+        return len(self._index.get(entry_id, ()))
+
+    def _read(self, offsets: List[int]) -> List[dict]:
+        records = []
+        if not offsets:
+            return records
+        with open(self.path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                records.append(json.loads(f.readline()))
+        return records
+
+    def revisions(self, entry_id: str) -> Iterator[Revision]:
+        """Yield every recorded revision of an entry, oldest first."""
+        self._refresh()
+        content = ""
+        for record in self._read([o for o, _ in self._index.get(entry_id, ())]):
+            content = record["text"] if "text" in record else patch(content, record["delta"])
+            yield Revision(record["rev"], record.get("at"), content)
+
+    def get(self, entry_id: str, rev: int) -> Revision:
+        """Rebuild one revision from the nearest keyframe at or before it."""
+        self._refresh()
+        lines = self._index.get(entry_id, [])
+        if not 1 <= rev <= len(lines):
+            raise KeyError(f"No revision {rev} for entry {entry_id}")
+        start = rev - 1
+        while not lines[start][1]:
+            start -= 1
+        content = ""
+        for record in self._read([o for o, _ in lines[start:rev]]):
+            content = record["text"] if "text" in record else patch(content, record["delta"])
+        return Revision(rev, record.get("at"), content)
+
+    def _line(self, entry_id: str, rev: int, at: Optional[str], old: Optional[str], new: str) -> str:
+        record = {"id": entry_id, "rev": rev, "at": at}
+        if old is not None and (rev - 1) % KEYFRAME_INTERVAL:
+            delta = diff(old, new)
+            if len(json.dumps(delta)) < len(json.dumps(new)):
+                record["delta"] = delta
+                return json.dumps(record)
+        record["text"] = new
+        return json.dumps(record)
+
+    def record(self, edits: List[Tuple[dict, dict, str]]) -> None:
+        """Log content edits as ``(old_record, new_record, timestamp)`` triples.
+
+        The first edit of an entry also stores its original text as revision
+        1. If the log's latest text no longer matches ``old_record`` (the
+        content was changed without going through the log), the old text is
+        stored as a fresh keyframe so the chain stays consistent.
+        """
+        self._refresh()
+        lines = []
+        pending: Dict[str, Tuple[int, str]] = {}
+        for old, new, at in edits:
+            entry_id = old["id"]
+            if entry_id in pending:
+                rev, last = pending[entry_id]
+            else:
+                rev = self.count(entry_id)
+                last = self.get(entry_id, rev).content if rev else None
+            if last != old["content"]:
+                rev += 1
+                lines.append(self._line(entry_id, rev, old.get("created_at") if rev == 1 else None,
+                                        None, old["content"]))
+            rev += 1
+            lines.append(self._line(entry_id, rev, at, old["content"], new["content"]))
+            pending[entry_id] = (rev, new["content"])
+        if lines:
+            with open(self.path, "a") as f:
+                f.write("\n".join(lines) + "\n")
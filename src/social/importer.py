@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.platforms import get_platform_config, registry, use_platforms
+from social.store import ContentStore
+from social.validation import content_length
+
+
+_TEXT_FIELDS = ("platform", "status", "content", "topic", "scheduled_date", "id", "created_at")
+# Stored dates must sort lexicographically, so only the canonical forms are
+# accepted: a day, or a day and time as written by `series add --time`
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2})?")
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    rejected: int = 0
+
+
+def iter_rows(path: Path) -> Iterator[dict]:
+    """Stream rows from a CSV (with header) or NDJSON file."""
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="") as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    row = {"__error__": f"invalid JSON ({e.msg})"}
+                yield row if isinstance(row, dict) else {"__error__": "expected a JSON object"}
+
+
+def _valid_date(value: str) -> bool:
+    if not _DATE_RE.fullmatch(value):
+        return False
+    try:
+        datetime.strptime(value, "%Y-%m-%dT%H:%M" if "T" in value else "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
+def validate_row(row: dict) -> Tuple[Optional[dict], Optional[str]]:
+    """Check one row and return ``(entry_dict, None)`` or ``(None, error)``."""
+    if "__error__" in row:
+        return None, row["__error__"]
+    for field in _TEXT_FIELDS:
+        value = row.get(field)
+        if value is not None and not isinstance(value, str):
+            return None, f"{field} must be a string, got {type(value).__name__}"
+    try:
+        platform = Platform((row.get("platform") or "").strip().lower())
+    except ValueError:
+        return None, f"unknown platform: {row.get('platform')!r}"
+    status_value = (row.get("status") or ContentStatus.DRAFT.value).strip().lower()
+    try:
+        status = ContentStatus(status_value)
+    except ValueError:
+        return None, f"unknown status: {row.get('status')!r}"
+
+    content = row.get("content") or ""
+    topic = (row.get("topic") or "").strip()
+    if not content.strip():
+        return None, "content is empty"
+    if not topic:
+        return None, "topic is empty"
+
+    scheduled_date = (row.get("scheduled_date") or "").strip() or None
+    if scheduled_date is not None and not _valid_date(scheduled_date):
+        return None, f"invalid scheduled_date: {scheduled_date!r} (expected YYYY-MM-DD or YYYY-MM-DDTHH:MM)"
+
+    config = get_platform_config(platform)
+    length = content_length(content, config)
+    if length > config.max_length:
+        return None, f"content is {length} characters (max {config.max_length} for {platform.value})"
+
+    entry = ContentEntry.new(
+        platform=platform,
+        content=content,
+        topic=topic,
+        scheduled_date=scheduled_date,
+        status=status,
+    )
+    if row.get("id"):
+        entry.id = row["id"]
+    if row.get("created_at"):
+        entry.created_at = row["created_at"]
+    return entry.to_dict(), None
+
+
+def _validate_chunk(rows: List[Tuple[int, dict]]) -> List[Tuple[int, dict, Optional[dict], Optional[str]]]:
+    return [(n, row, *validate_row(row)) for n, row in rows]
+
+
+def _chunks(rows: Iterator[dict], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    numbered = enumerate(rows, start=1)
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def import_file(
+    store: ContentStore,
+    path: Path,
+    errors_path: Optional[Path] = None,
+    chunk_size: int = 2_000,
+    workers: Optional[int] = None,
+) -> ImportReport:
+    """Validate rows in a worker pool and add the valid ones in one store write.
+
+    Rows are read lazily and only a bounded number of chunks are in flight.
+    The store is rewritten once at the end rather than per batch, since
+    every write rewrites the whole file; an import that fails part-way
+    leaves the store untouched. Workers validate against the same platform
+    config as this process. Rejected rows, including rows whose ``id`` is
+    already stored or was seen earlier in the file, are appended to
+    ``errors_path`` as NDJSON records with their row number and error message.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    report = ImportReport()
+    pending: List[ContentEntry] = []
+    seen_ids = {e.id for e in store.list_entries()}
+    errors_file = None
+
+    def handle(results) -> None:
+        nonlocal errors_file
+        for row_number, row, entry, error in results:
+            if error is None and entry["id"] in seen_ids:
+                error = f"duplicate id: {entry['id']}"
+            if error is not None:
+                report.rejected += 1
+                if errors_path is not None:
+                    if errors_file is None:
+                        errors_file = open(errors_path, "w")
+                    errors_file.write(
+                        json.dumps({"row": row_number, "error": error, "data": row}) + "\n"
+                    )
+                continue
+            seen_ids.add(entry["id"])
+            pending.append(ContentEntry.from_dict(entry))
+
+    chunks = _chunks(iter_rows(path), chunk_size)
+    try:
+        if workers <= 1:
+            for chunk in chunks:
+                handle(_validate_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=use_platforms, initargs=(registry(),)
+            ) as pool:
+                in_flight = deque()
+                for chunk in chunks:
+                    in_flight.append(pool.submit(_validate_chunk, chunk))
+                    if len(in_flight) >= workers * 2:
+                        handle(in_flight.popleft().result())
+                while in_flight:
+                    handle(in_flight.popleft().result())
+        store.add_entries(pending)
+        report.imported = len(pending)
+    finally:
+        if errors_file is not None:
+            errors_file.close()
+    return report
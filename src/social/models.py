@@ -19,8 +19,21 @@ class ContentStatus(str, Enum):
     PUBLISHED = "published"
 
 
+# Value -> member tables: a dict hit is much cheaper than Enum.__call__,
+# which matters when decoding every entry in a large store.
+_PLATFORMS = {p.value: p for p in Platform}
+_STATUSES = {s.value: s for s in ContentStatus}
+
+
+def parse_platform(value: str) -> Platform:
+    """``Platform(value)`` through the lookup table; raises ValueError if unknown."""
+    return _PLATFORMS.get(value) or Platform(value)
+
+
 @dataclass
 class ContentEntry:
+    __slots__ = ("id", "platform", "content", "topic", "created_at", "scheduled_date", "status")
+
     id: str
     platform: Platform
     content: str
@@ -60,12 +73,14 @@ class ContentEntry:
 
     @classmethod
     def from_dict(cls, data: dict) -> ContentEntry:
+        platform = data["platform"]
+        status = data["status"]
         return cls(
-            id=data["id"],
-            platform=Platform(data["platform"]),
-            content=data["content"],
-            topic=data["topic"],
-            created_at=data["created_at"],
-            scheduled_date=data.get("scheduled_date"),
-            status=ContentStatus(data["status"]),
+            data["id"],
+            _PLATFORMS.get(platform) or Platform(platform),
+            data["content"],
+            data["topic"],
+            data["created_at"],
+            data.get("scheduled_date"),
+            _STATUSES.get(status) or ContentStatus(status),
         )
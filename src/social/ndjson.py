@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from typing import Iterable, Iterator, TextIO
+
+from social.models import ContentEntry, ContentStatus, Platform
+
+
+def write_records(records: Iterable[dict], fmt: str, stream: TextIO) -> int:
+    """Stream records as NDJSON (one object per line) or as a JSON array.
+
+    Records are written as they are produced, so nothing is buffered beyond
+    the current one. Returns the number of records written.
+    """
+    count = 0
+    if fmt == "ndjson":
+        for record in records:
+            stream.write(json.dumps(record))
+            stream.write("\n")
+            count += 1
+    elif fmt == "json":
+        stream.write("[")
+        for record in records:
+            stream.write(",\n" if count else "\n")
+            stream.write(json.dumps(record))
+            count += 1
+        stream.write("\n]\n" if count else "]\n")
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+    return count
+
+
+def read_records(stream: TextIO) -> Iterator[dict]:
+    """Yield one dict per non-blank NDJSON line."""
+    for lineno, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {lineno}: invalid JSON ({e.msg})")
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {lineno}: expected a JSON object")
+        yield record
+
+
+def entry_from_record(record: dict) -> ContentEntry:
+    """Build an entry from a possibly partial record, filling in defaults."""
+    missing = [k for k in ("platform", "content", "topic") if not record.get(k)]
+    if missing:
+        raise ValueError(f"Missing field(s): {', '.join(missing)}")
+    entry = ContentEntry.new(
+        platform=Platform(record["platform"]),
+        content=record["content"],
+        topic=record["topic"],
+        scheduled_date=record.get("scheduled_date"),
+        status=ContentStatus(record.get("status", ContentStatus.DRAFT.value)),
+    )
+    if record.get("id"):
+        entry.id = record["id"]
+    if record.get("created_at"):
+        entry.created_at = record["created_at"]
+    return entry
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+import json
+import os
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from social.models import Platform
 
 
+# Overrides are read from $SOCIAL_PLATFORMS, else the first of these that exists.
+CONFIG_ENV = "SOCIAL_PLATFORMS"
+DEFAULT_CONFIG_PATHS = (
+    Path.home() / ".social-content" / "platforms.toml",
+    Path.home() / ".social-content" / "platforms.json",
+)
+
+HASHTAG_STYLES = ("inline", "footer", "none")
+LENGTH_COUNTING = ("chars", "twitter")
+
+
+class PlatformConfigError(ValueError):
+    pass
+
+
 @dataclass(frozen=True)
 class PlatformConfig:
     name: str
@@ -15,6 +33,11 @@ class PlatformConfig:
     hashtag_style: str
     tone: str
     example_format: str
+    # "twitter" counts URLs as 23 and CJK/emoji as 2, like twitter-text
+    length_counting: str = "chars"
+    max_hashtags: Optional[int] = None
+    max_lines: Optional[int] = None
+    banned_terms: Tuple[str, ...] = ()
 
 
 PLATFORMS: Dict[Platform, PlatformConfig] = {
@@ -26,6 +49,8 @@ PLATFORMS: Dict[Platform, PlatformConfig] = {
         hashtag_style="inline",
         tone="concise and engaging, sometimes witty",
         example_format="Main point in 1-2 sentences. #Hashtag #Topic",
+        length_counting="twitter",
+        max_hashtags=3,
     ),
     Platform.INSTAGRAM: PlatformConfig(
         name="Instagram",
@@ -40,6 +65,7 @@ PLATFORMS: Dict[Platform, PlatformConfig] = {
             "Call to action\n\n"
             "#hashtag1 #hashtag2 #hashtag3"
         ),
+        max_hashtags=30,
     ),
     Platform.LINKEDIN: PlatformConfig(
         name="LinkedIn",
@@ -58,9 +84,106 @@ PLATFORMS: Dict[Platform, PlatformConfig] = {
 }
 
 
+def _check_field(platform: Platform, key: str, value):
+    names = {f.name for f in fields(PlatformConfig)}
+    where = f"{platform.value}.{key}"
+    if key not in names or key == "platform":
+        raise PlatformConfigError(f"Unknown platform setting: {where}")
+    if key in ("max_length", "max_hashtags", "max_lines"):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise PlatformConfigError(f"{where} must be a non-negative integer")
+        return value
+    if key == "banned_terms":
+        if not isinstance(value, list) or not all(isinstance(t, str) and t for t in value):
+            raise PlatformConfigError(f"{where} must be a list of non-empty strings")
+        return tuple(value)
+    if not isinstance(value, str):
+        raise PlatformConfigError(f"{where} must be a string")
+    if key == "hashtag_style" and value not in HASHTAG_STYLES:
+        raise PlatformConfigError(f"{where} must be one of {', '.join(HASHTAG_STYLES)}")
+    if key == "length_counting" and value not in LENGTH_COUNTING:
+        raise PlatformConfigError(f"{where} must be one of {', '.join(LENGTH_COUNTING)}")
+    return value
+
+
+def load_platforms(path: Path) -> Dict[Platform, PlatformConfig]:
+    """Read per-platform overrides from a TOML or JSON file.
+
+    The file has one table per platform (``[twitter]``, ``[linkedin]``, ...)
+    whose keys replace the built-in settings; platforms it leaves out keep
+    their defaults. TOML needs Python 3.11+ or the ``tomli`` package.
+    """
+    path = Path(path)
+    try:
+        if path.suffix == ".toml":
+            try:
+                import tomllib
+            except ImportError:  # Python < 3.11
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    raise PlatformConfigError(
+                        "TOML platform config needs Python 3.11+ or `pip install tomli`; "
+                        "use a .json file instead"
+                    )
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path) as f:
+                data = json.load(f)
+    except OSError as e:
+        raise PlatformConfigError(f"Cannot read platform config {path}: {e.strerror}")
+    except ValueError as e:
+        if isinstance(e, PlatformConfigError):
+            raise
+        raise PlatformConfigError(f"Invalid platform config {path}: {e}")
+    if not isinstance(data, dict):
+        raise PlatformConfigError(f"Invalid platform config {path}: expected a table per platform")
+
+    configs = dict(PLATFORMS)
+    for name, settings in data.items():
+        try:
+            platform = Platform(name)
+        except ValueError:
+            raise PlatformConfigError(f"Unknown platform in {path}: {name!r}")
+        if not isinstance(settings, dict):
+            raise PlatformConfigError(f"Invalid platform config {path}: [{name}] must be a table")
+        changes = {key: _check_field(platform, key, value) for key, value in settings.items()}
+        configs[platform] = replace(configs[platform], **changes)
+    return configs
+
+
+def _config_path() -> Optional[Path]:
+    env = os.environ.get(CONFIG_ENV)
+    if env:
+        return Path(env)
+    for path in DEFAULT_CONFIG_PATHS:
+        if path.exists():
+            return path
+    return None
+
+
+_registry: Optional[Dict[Platform, PlatformConfig]] = None
+
+
+def registry() -> Dict[Platform, PlatformConfig]:
+    """Active platform configs: the built-ins plus any config file, loaded once."""
+    global _registry
+    if _registry is None:
+        path = _config_path()
+        _registry = load_platforms(path) if path is not None else dict(PLATFORMS)
+    return _registry
+
+
+def use_platforms(configs: Optional[Dict[Platform, PlatformConfig]]) -> None:
+    """Replace the active registry; None reloads it from the config file on next use."""
+    global _registry
+    _registry = configs
+
+
 def get_platform_config(platform: Platform) -> PlatformConfig:
-    return PLATFORMS[platform]
+    return registry()[platform]
 
 
 def list_platforms() -> List[PlatformConfig]:
-    return list(PLATFORMS.values())
+    return list(registry().values())
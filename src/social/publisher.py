@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import abc
+import http.client
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore, EntryNotFoundError
+
+
+class PublishError(Exception):
+    pass
+
+
+class PlatformAdapter(abc.ABC):
+    """Delivers a single entry to a platform.
+
+    ``publish`` is called from worker threads and must be thread-safe. It
+    signals failure by raising ``PublishError``.
+    """
+
+    @abc.abstractmethod
+    def publish(self, entry: ContentEntry) -> None:
+        """Send ``entry`` to its platform."""
+
+
+class FileAdapter(PlatformAdapter):
+    """Appends published entries to ``<directory>/<platform>.ndjson``."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def publish(self, entry: ContentEntry) -> None:
+        record = dict(entry.to_dict(), published_at=datetime.now().isoformat())
+        line = json.dumps(record) + "\n"
+        path = self.directory / f"{entry.platform.value}.ndjson"
+        try:
+            with self._lock:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with open(path, "a") as f:
+                    f.write(line)
+        except OSError as e:
+            raise PublishError(f"File publish failed: {e}")
+
+
+class HTTPAdapter(PlatformAdapter):
+    """POSTs each entry as JSON to ``<base_url>/<platform>``."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def publish(self, entry: ContentEntry) -> None:
+        try:
+            # A malformed base URL raises ValueError, from here or from urlopen
+            request = urllib.request.Request(
+                f"{self.base_url}/{entry.platform.value}",
+                data=json.dumps(entry.to_dict()).encode(),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except (urllib.error.URLError, OSError, ValueError, http.client.HTTPException) as e:
+            raise PublishError(f"HTTP publish failed: {e}")
+
+
+@dataclass
+class PlatformLimits:
+    concurrency: int = 4
+    rate_per_second: float = 0.0  # 0 means unlimited
+
+
+@dataclass
+class PublishReport:
+    published: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+class _RateLimiter:
+    """Spaces calls evenly so at most ``rate`` start per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _publish_one(
+    adapter: PlatformAdapter, limiter: _RateLimiter, entry: ContentEntry
+) -> None:
+    limiter.acquire()
+    adapter.publish(entry)
+
+
+def _mark_published(store: ContentStore, pending: Dict[str, dict], report: PublishReport) -> None:
+    """Mark ``pending`` PUBLISHED in one write.
+
+    Entries deleted from the store while they were being published cannot
+    be updated; they move from ``report.published`` to ``report.failed``
+    and the rest of the batch is still written.
+    """
+    try:
+        store.update_entries(pending)
+        return
+    except EntryNotFoundError:
+        stored = {r["id"] for r in store.iter_raw()}
+    gone = {entry_id for entry_id in pending if entry_id not in stored}
+    for entry_id in gone:
+        del pending[entry_id]
+        report.failed[entry_id] = "Entry was deleted while publishing"
+    report.published = [i for i in report.published if i not in gone]
+    store.update_entries(pending)
+
+
+def publish_due(
+    store: ContentStore,
+    adapters: Dict[Platform, PlatformAdapter],
+    as_of: Optional[datetime] = None,
+    limits: Optional[Dict[Platform, PlatformLimits]] = None,
+    batch_size: int = 500,
+) -> PublishReport:
+    """Publish every due SCHEDULED entry and mark the successes PUBLISHED.
+
+    Each platform gets its own worker pool and rate limiter, so a slow or
+    throttled platform does not hold back the others. Status updates are
+    written to the store in batches of ``batch_size``.
+    """
+    limits = limits or {}
+    report = PublishReport()
+    due = store.due_entries(as_of)
+    if not due:
+        return report
+
+    pools: Dict[Platform, ThreadPoolExecutor] = {}
+    limiters: Dict[Platform, _RateLimiter] = {}
+    futures = {}
+    pending: Dict[str, dict] = {}
+    try:
+        for entry in due:
+            adapter = adapters.get(entry.platform)
+            if adapter is None:
+                report.failed[entry.id] = f"No adapter for {entry.platform.value}"
+                continue
+            if entry.platform not in pools:
+                plat_limits = limits.get(entry.platform, PlatformLimits())
+                pools[entry.platform] = ThreadPoolExecutor(
+                    max_workers=max(plat_limits.concurrency, 1),
+                    thread_name_prefix=f"publish-{entry.platform.value}",
+                )
+                limiters[entry.platform] = _RateLimiter(plat_limits.rate_per_second)
+            future = pools[entry.platform].submit(
+                _publish_one, adapter, limiters[entry.platform], entry
+            )
+            futures[future] = entry.id
+
+        for future in as_completed(futures):
+            entry_id = futures[future]
+            try:
+                future.result()
+            except PublishError as e:
+                report.failed[entry_id] = str(e)
+                continue
+            pending[entry_id] = {"status": ContentStatus.PUBLISHED}
+            report.published.append(entry_id)
+            if len(pending) >= batch_size:
+                _mark_published(store, pending, report)
+                pending = {}
+    finally:
+        if pending:
+            _mark_published(store, pending, report)
+        for pool in pools.values():
+            pool.shutdown(wait=True)
+    return report
+
+
+def publish_loop(
+    store: ContentStore,
+    adapters: Dict[Platform, PlatformAdapter],
+    interval: float = 60.0,
+    limits: Optional[Dict[Platform, PlatformLimits]] = None,
+    on_report: Optional[Callable[[PublishReport], None]] = None,
+    max_iterations: Optional[int] = None,
+) -> None:
+    """Repeatedly publish due entries, sleeping ``interval`` seconds between passes."""
+    iteration = 0
+    while max_iterations is None or iteration < max_iterations:
+        report = publish_due(store, adapters, limits=limits)
+        if on_report is not None:
+            on_report(report)
+        iteration += 1
+        if max_iterations is None or iteration < max_iterations:
+            time.sleep(interval)
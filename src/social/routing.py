@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from social import trace
+from social.models import Platform
+
+
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+FAST_MODEL = "claude-3-5-haiku-20241022"
+
+# Task types a generation call can be routed by
+DRAFT = "draft"
+SHORTEN = "shorten"
+REGENERATE = "regenerate"
+
+
+@dataclass(frozen=True)
+class Tier:
+    models: Tuple[str, ...]  # primary first, then fallbacks in order
+    latency_budget: float  # seconds; a slower primary yields to a faster fallback
+
+
+TIERS: Dict[str, Tier] = {
+    "fast": Tier((FAST_MODEL, DEFAULT_MODEL), latency_budget=5.0),
+    "quality": Tier((DEFAULT_MODEL, FAST_MODEL), latency_budget=20.0),
+}
+
+# (platform, task) -> tier; None matches any platform or task. The most
+# specific match wins, and anything unmatched uses the "quality" tier.
+ROUTES: Dict[Tuple[Optional[Platform], Optional[str]], str] = {
+    (Platform.TWITTER, None): "fast",
+    (None, SHORTEN): "fast",
+}
+
+WINDOW = 50  # calls remembered per model
+MIN_SAMPLES = 5  # before latency and error rate are trusted
+MAX_ERROR_RATE = 0.5
+OVERLOAD_COOLDOWN = 30.0  # seconds a model is skipped after an overload
+PROBE_INTERVAL = 30.0  # seconds between trial calls to a demoted primary
+
+# Statuses that mean "try another model" rather than "this request is bad"
+_FAILOVER_STATUSES = {429, 500, 502, 503, 504, 529}
+_OVERLOAD_STATUSES = {429, 503, 529}
+
+
+def should_fail_over(error: Exception) -> bool:
+    import anthropic
+
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code in _FAILOVER_STATUSES
+
+
+def _is_overload(error: Exception) -> bool:
+    return getattr(error, "status_code", None) in _OVERLOAD_STATUSES
+
+
+class ModelStats:
+    """Rolling latency and error rate for one model."""
+
+    def __init__(self):
+        self.calls: Deque[Tuple[float, bool]] = deque(maxlen=WINDOW)
+        self.overloaded_until = 0.0
+        self.probe_at = 0.0  # when a demoted primary next gets a trial call
+
+    def latency(self) -> Optional[float]:
+        """Median latency of recent successful calls, once there are enough."""
+        times = [t for t, ok in self.calls if ok]
+        return statistics.median(times) if len(times) >= MIN_SAMPLES else None
+
+    def error_rate(self) -> float:
+        if not self.calls:
+            return 0.0
+        return sum(1 for _, ok in self.calls if not ok) / len(self.calls)
+
+    def healthy(self, now: float) -> bool:
+        if now < self.overloaded_until:
+            return False
+        return len(self.calls) < MIN_SAMPLES or self.error_rate() < MAX_ERROR_RATE
+
+
+@dataclass(frozen=True)
+class Decision:
+    """One API attempt made by the router, kept for telemetry."""
+
+    at: float
+    task: str
+    platform: str
+    tier: str
+    model: str
+    reason: str  # primary, overloaded, errors, slow, probe or failover
+    latency: float
+    outcome: str  # ok, overloaded or error
+
+    def to_dict(self) -> dict:
+        return {
+            "at": self.at, "task": self.task, "platform": self.platform, "tier": self.tier,
+            "model": self.model, "reason": self.reason,
+            "latency_ms": round(self.latency * 1000, 1), "outcome": self.outcome,
+        }
+
+
+class Attempt:
+    """One routed API call; wrap the client call in ``with attempt:``.
+
+    The block is traced and timed, and its outcome is recorded with the
+    router. An error that warrants failing over is swallowed unless this
+    is the last model to try, so callers just move on to the next attempt
+    while ``ok`` is False.
+    """
+
+    def __init__(self, router: Router, platform: Platform, task: str, tier: str,
+                 model: str, reason: str, last: bool):
+        self.router = router
+        self.platform = platform
+        self.task = task
+        self.tier = tier
+        self.model = model
+        self.reason = reason
+        self.last = last
+        self.ok = False
+
+    def __enter__(self) -> Attempt:
+        self._span = trace.span(
+            "api.request", platform=self.platform.value, task=self.task,
+            model=self.model, reason=self.reason,
+        )
+        self._span.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, error, tb) -> bool:
+        latency = time.perf_counter() - self._start
+        self._span.__exit__(exc_type, error, tb)
+        if error is None:
+            self.ok = True
+        elif not isinstance(error, Exception) or not should_fail_over(error):
+            return False
+        self.router.observe(self.platform, self.task, self.tier, self.model, self.reason, latency, error)
+        return error is not None and not self.last
+
+
+class Router:
+    """Pick models per platform and task, learning from recent calls.
+
+    Each route maps to a tier of models. Within a tier the primary model is
+    used unless it is cooling down after an overload, failing too often, or
+    slower than the tier's latency budget while a fallback is not. A primary
+    demoted for errors or latency gets one probe call every PROBE_INTERVAL
+    seconds, and a successful, in-budget probe restores it.
+    Thread-safe, so one router can serve a whole process.
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, Tier]] = None,
+        routes: Optional[Dict[Tuple[Optional[Platform], Optional[str]], str]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tiers = dict(TIERS if tiers is None else tiers)
+        self.routes = dict(ROUTES if routes is None else routes)
+        self.clock = clock
+        self.stats: Dict[str, ModelStats] = {}
+        self.decisions: Deque[Decision] = deque(maxlen=200)
+        self._lock = threading.Lock()
+
+    def tier_for(self, platform: Platform, task: str) -> str:
+        for key in ((platform, task), (platform, None), (None, task)):
+            if key in self.routes:
+                return self.routes[key]
+        return "quality"
+
+    def _models(self, tier: Tier) -> List[str]:
+        # SOCIAL_MODEL pins the primary model everywhere; fallbacks still apply
+        pinned = os.environ.get("SOCIAL_MODEL")
+        if pinned:
+            return [pinned] + [m for m in tier.models if m != pinned]
+        return list(tier.models)
+
+    def plan(self, platform: Platform, task: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """Return the tier name and the ``(model, reason)`` attempts in order."""
+        name = self.tier_for(platform, task)
+        tier = self.tiers[name]
+        models = self._models(tier)
+        now = self.clock()
+        with self._lock:
+            stats = {m: self.stats.get(m) or ModelStats() for m in models}
+            primary = models[0]
+            reason = "primary"
+            if now < stats[primary].overloaded_until:
+                reason = "overloaded"
+            elif not stats[primary].healthy(now):
+                reason = "errors"
+            else:
+                latency = stats[primary].latency()
+                if latency is not None and latency > tier.latency_budget:
+                    reason = "slow"
+            if reason in ("errors", "slow") and primary in self.stats:
+                # Probing is the only way the primary's stats can refresh
+                if not stats[primary].probe_at:
+                    stats[primary].probe_at = now + PROBE_INTERVAL
+                elif now >= stats[primary].probe_at:
+                    stats[primary].probe_at = now + PROBE_INTERVAL
+                    reason = "probe"
+            elif reason == "primary":
+                stats[primary].probe_at = 0.0
+            if reason not in ("primary", "probe"):
+                for model in models[1:]:
+                    if not stats[model].healthy(now):
+                        continue
+                    latency = stats[model].latency()
+                    if reason == "slow" and latency is not None and latency > tier.latency_budget:
+                        continue
+                    models.remove(model)
+                    models.insert(0, model)
+                    break
+                else:
+                    reason = "primary"  # nothing better; keep the configured order
+        attempts = [(models[0], reason)] + [(m, "failover") for m in models[1:]]
+        return name, attempts
+
+    def attempts(self, platform: Platform, task: str) -> Iterator[Attempt]:
+        """The planned calls for a request, in order; stop at the first ``ok`` one."""
+        tier, planned = self.plan(platform, task)
+        for i, (model, reason) in enumerate(planned):
+            yield Attempt(self, platform, task, tier, model, reason, last=i + 1 == len(planned))
+
+    def observe(
+        self,
+        platform: Platform,
+        task: str,
+        tier: str,
+        model: str,
+        reason: str,
+        latency: float,
+        error: Optional[Exception] = None,
+    ) -> Decision:
+        """Record the outcome of one attempt."""
+        now = self.clock()
+        if error is None:
+            outcome = "ok"
+        elif _is_overload(error):
+            outcome = "overloaded"
+        else:
+            outcome = "error"
+        decision = Decision(time.time(), task, platform.value, tier, model, reason, latency, outcome)
+        with self._lock:
+            stats = self.stats.setdefault(model, ModelStats())
+            if reason == "probe" and error is None and latency <= self.tiers[tier].latency_budget:
+                stats.calls.clear()  # recovered; forget the calls that demoted it
+                stats.probe_at = 0.0
+            stats.calls.append((latency, error is None))
+            if outcome == "overloaded":
+                stats.overloaded_until = now + OVERLOAD_COOLDOWN
+            self.decisions.append(decision)
+        return decision
+
+    def snapshot(self) -> dict:
+        """Per-model health and the most recent decisions, for telemetry."""
+        now = self.clock()
+        with self._lock:
+            models = {
+                model: {
+                    "calls": len(s.calls),
+                    "median_latency_ms": None if s.latency() is None else round(s.latency() * 1000, 1),
+                    "error_rate": round(s.error_rate(), 3),
+                    "cooling_down": now < s.overloaded_until,
+                }
+                for model, s in self.stats.items()
+            }
+            decisions = [d.to_dict() for d in self.decisions]
+        return {"models": models, "decisions": decisions}
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+
+
+DEFAULT_DAILY_CAPS: Dict[Platform, int] = {
+    Platform.TWITTER: 3,
+    Platform.INSTAGRAM: 1,
+    Platform.LINKEDIN: 1,
+}
+
+
+@dataclass
+class ScheduleRules:
+    daily_caps: Dict[Platform, int] = field(
+        default_factory=lambda: dict(DEFAULT_DAILY_CAPS)
+    )
+    topic_spacing_days: int = 2
+    blackout_dates: FrozenSet[date] = frozenset()
+
+
+@dataclass
+class ScheduleResult:
+    assignments: Dict[str, str] = field(default_factory=dict)
+    unplaced: List[str] = field(default_factory=list)
+
+
+class _SlotTracker:
+    """Finds the next day with free capacity in amortized near-constant time.
+
+    Days are indexed from the start of the horizon. Full or blacked-out days
+    are linked to the following day (union-find with path compression), so
+    a lookup skips whole runs of unavailable days instead of probing them.
+    Index ``horizon`` is a sentinel meaning "no slot left".
+    """
+
+    def __init__(self, horizon: int, cap: int, blocked: Iterable[int]):
+        self.horizon = horizon
+        self.remaining = [cap] * horizon
+        self.parent = list(range(horizon + 1))
+        for i in blocked:
+            self.remaining[i] = 0
+        for i in range(horizon):
+            if self.remaining[i] <= 0:
+                self.parent[i] = i + 1
+
+    def find(self, i: int) -> int:
+        if i >= self.horizon:
+            return self.horizon
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def take(self, i: int) -> None:
+        self.remaining[i] -= 1
+        if self.remaining[i] <= 0:
+            self.parent[i] = i + 1
+
+
+def _topic_key(topic: str) -> str:
+    return topic.strip().casefold()
+
+
+def allocate(
+    drafts: List[ContentEntry],
+    rules: ScheduleRules,
+    start: date,
+    horizon_days: int = 365,
+    scheduled: Iterable[ContentEntry] = (),
+) -> ScheduleResult:
+    """Assign a date to each draft, in order, without breaking any rule.
+
+    ``scheduled`` entries already occupy their day's capacity and hold back
+    later posts on the same topic; only the ``YYYY-MM-DD`` part of their
+    date counts, and dates that do not parse are ignored. Drafts that cannot be placed within the
+    horizon are reported in ``ScheduleResult.unplaced``.
+    """
+    start_ord = start.toordinal()
+    blocked = [
+        d.toordinal() - start_ord
+        for d in rules.blackout_dates
+        if 0 <= d.toordinal() - start_ord < horizon_days
+    ]
+    spacing = max(rules.topic_spacing_days, 0)
+
+    trackers: Dict[Platform, _SlotTracker] = {}
+
+    def tracker_for(platform: Platform) -> _SlotTracker:
+        tracker = trackers.get(platform)
+        if tracker is None:
+            cap = rules.daily_caps.get(platform, DEFAULT_DAILY_CAPS.get(platform, 1))
+            tracker = _SlotTracker(horizon_days, cap, blocked)
+            trackers[platform] = tracker
+        return tracker
+
+    topic_next: Dict[str, int] = {}
+    for entry in scheduled:
+        if not entry.scheduled_date:
+            continue
+        try:
+            idx = date.fromisoformat(entry.scheduled_date[:10]).toordinal() - start_ord
+        except ValueError:
+            continue
+        if idx >= horizon_days:
+            continue
+        if idx >= 0:
+            tracker = tracker_for(entry.platform)
+            if tracker.remaining[idx] > 0:
+                tracker.take(idx)
+        key = _topic_key(entry.topic)
+        topic_next[key] = max(topic_next.get(key, 0), idx + spacing)
+
+    result = ScheduleResult()
+    for entry in drafts:
+        key = _topic_key(entry.topic)
+        tracker = tracker_for(entry.platform)
+        day = tracker.find(topic_next.get(key, 0))
+        if day >= horizon_days:
+            result.unplaced.append(entry.id)
+            continue
+        tracker.take(day)
+        topic_next[key] = day + spacing
+        result.assignments[entry.id] = date.fromordinal(start_ord + day).isoformat()
+    return result
+
+
+def schedule_drafts(
+    store: ContentStore,
+    rules: ScheduleRules,
+    start: Optional[date] = None,
+    horizon_days: int = 365,
+    dry_run: bool = False,
+) -> ScheduleResult:
+    """Schedule every unscheduled draft in the store with one store write.
+
+    Any entry that already has a date, including a manually dated draft,
+    takes up a slot on that day.
+    """
+    if start is None:
+        start = date.today()
+    entries = store.list_entries()
+    drafts = [
+        e for e in entries
+        if e.status == ContentStatus.DRAFT and not e.scheduled_date
+    ]
+    occupied = [e for e in entries if e.scheduled_date]
+    result = allocate(drafts, rules, start, horizon_days, scheduled=occupied)
+
+    if not dry_run and result.assignments:
+        store.update_entries({
+            entry_id: {"scheduled_date": day, "status": ContentStatus.SCHEDULED}
+            for entry_id, day in result.assignments.items()
+        })
+    return result
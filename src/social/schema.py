@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+
+CURRENT_VERSION = 2
+
+# from_version -> function upgrading one record to from_version + 1
+_MIGRATIONS: Dict[int, Callable[[dict], dict]] = {}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_VERSION_RE = re.compile(r'"version"\s*:\s*(\d+)')
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def migration(from_version: int):
+    """Register a record migration from ``from_version`` to the next version."""
+    def register(fn: Callable[[dict], dict]) -> Callable[[dict], dict]:
+        _MIGRATIONS[from_version] = fn
+        return fn
+    return register
+
+
+@migration(1)
+def _v1_to_v2(record: dict) -> dict:
+    # v2 only changes the file layout (compact, one entry per line).
+    return record
+
+
+def migrator(version: int) -> Optional[Callable[[dict], dict]]:
+    """Return a function upgrading records from ``version`` to the current one.
+
+    Returns None when records are already current. Files written by a newer
+    version are refused rather than silently rewritten in the old format.
+    """
+    if version > CURRENT_VERSION:
+        raise SchemaError(
+            f"Store schema version {version} is newer than supported ({CURRENT_VERSION}); "
+            "upgrade social-content"
+        )
+    missing = [v for v in range(version, CURRENT_VERSION) if v not in _MIGRATIONS]
+    if version < 1 or missing:
+        raise SchemaError(f"No migration path from store schema version {version}")
+    steps = [_MIGRATIONS[v] for v in range(version, CURRENT_VERSION)]
+    if not steps:
+        return None
+
+    def upgrade(record: dict) -> dict:
+        for step in steps:
+            record = step(record)
+        return record
+    return upgrade
+
+
+def open_text(path: Path) -> TextIO:
+    """Open a store file for reading, transparently decompressing gzip."""
+    with open(path, "rb") as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def load(path: Path) -> Tuple[int, List[dict]]:
+    """Parse a whole store file and return ``(file_version, current_records)``."""
+    with open_text(path) as f:
+        data = json.load(f)
+    version = data.get("version", 1)
+    entries = data.get("entries", [])
+    upgrade = migrator(version)
+    if upgrade is not None:
+        entries = [upgrade(e) for e in entries]
+    return version, entries
+
+
+def iter_records(path: Path, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Yield current-version records one at a time without parsing the whole file.
+
+    The ``entries`` array is decoded incrementally from fixed-size reads, so
+    memory use is bounded by the largest single entry. Older records are
+    migrated as they stream past.
+    """
+    decoder = json.JSONDecoder()
+    with open_text(path) as f:
+        buf = ""
+        while True:
+            idx = buf.find('"entries"')
+            bracket = buf.find("[", idx) if idx >= 0 else -1
+            if bracket >= 0:
+                pos = bracket + 1
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            buf += chunk
+
+        match = _VERSION_RE.search(buf, 0, idx)
+        upgrade = migrator(int(match.group(1)) if match else 1)
+
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf):
+                if buf[pos] == "]":
+                    return
+                try:
+                    obj, pos = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    pass  # Entry spans the buffer boundary; read more below
+                else:
+                    yield upgrade(obj) if upgrade is not None else obj
+                    continue
+            chunk = f.read(chunk_size)
+            if not chunk:
+                if pos < len(buf):
+                    raise ValueError(f"Truncated store file: {path}")
+                return
+            buf = buf[pos:] + chunk
+            pos = 0
+
+
+def dump(entries: Iterable[dict], f: TextIO) -> int:
+    """Write records in the current layout: compact JSON, one entry per line."""
+    encode = _ENCODER.encode
+    f.write(f'{{"version":{CURRENT_VERSION},"entries":[')
+    count = 0
+    for entry in entries:
+        f.write(",\n" if count else "\n")
+        f.write(encode(entry))
+        count += 1
+    f.write("\n]}\n")
+    return count
+
+
+@contextmanager
+def _replacing(path: Path, mode: str = "w") -> Iterator[IO]:
+    """Open a temp file that replaces ``path`` only if the block succeeds."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+            yield f
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_file(path: Path, entries: Iterable[dict], compress: bool = False) -> int:
+    """Atomically replace ``path`` with ``entries`` (gzip-compressed if asked)."""
+    if compress:
+        with _replacing(path, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            return dump(entries, f)
+    with _replacing(path) as f:
+        return dump(entries, f)
+
+
+def atomic_write_json(path: Path, data) -> None:
+    """Atomically replace ``path`` with ``data`` as compact JSON."""
+    with _replacing(path) as f:
+        json.dump(data, f, separators=(",", ":"))
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import os
+import time
+import uuid
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.schema import atomic_write_json
+from social.store import ContentStore, EntryNotFoundError, _filter, sort_key
+
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+DEFAULT_LEAD_DAYS = 3  # generate this long before each occurrence
+
+
+class SeriesError(ValueError):
+    pass
+
+
+def _months(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+
+def _month_day(index: int, dom: int) -> date:
+    year, month = divmod(index, 12)
+    first = date(year, month + 1, 1)
+    last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return first.replace(day=min(dom, last.day))  # the 31st falls back to month end
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    """When a series recurs: every ``interval`` days, weeks or months from ``start``.
+
+    Occurrences are numbered from 0, and the n-th one is computed directly,
+    so expanding a date range never walks the series from its start.
+    """
+
+    freq: str
+    start: date
+    interval: int = 1
+    weekdays: Tuple[int, ...] = ()  # weekly only, 0 = Monday; defaults to start's day
+    until: Optional[date] = None
+    count: Optional[int] = None
+
+    def __post_init__(self):
+        if self.freq not in FREQUENCIES:
+            raise SeriesError(f"Unknown frequency: {self.freq!r} (expected one of {', '.join(FREQUENCIES)})")
+        if self.interval < 1:
+            raise SeriesError("Interval must be at least 1")
+        if self.count is not None and self.count < 1:
+            raise SeriesError("Count must be at least 1")
+        if self.until is not None and self.until < self.start:
+            raise SeriesError("Series ends before it starts")
+        if self.freq == "weekly":
+            days = tuple(sorted(set(self.weekdays or (self.start.weekday(),))))
+            if not all(0 <= d < 7 for d in days):
+                raise SeriesError(f"Invalid weekdays: {self.weekdays!r}")
+            object.__setattr__(self, "weekdays", days)
+        elif self.weekdays:
+            raise SeriesError("Weekdays only apply to weekly series")
+
+    def nth(self, n: int) -> date:
+        if self.freq == "daily":
+            return self.start + timedelta(days=n * self.interval)
+        if self.freq == "monthly":
+            return _month_day(_months(self.start) + n * self.interval, self.start.day)
+        # Weekly: slot g is weekday g % k of the (g // k)-th active week, where
+        # active weeks are ``interval`` apart; slots before start are skipped.
+        k = len(self.weekdays)
+        block, j = divmod(n + self._skipped_slots(), k)
+        monday = self.start - timedelta(days=self.start.weekday())
+        return monday + timedelta(weeks=block * self.interval, days=self.weekdays[j])
+
+    def _skipped_slots(self) -> int:
+        return bisect_left(self.weekdays, self.start.weekday())
+
+    def index_on_or_after(self, day: date) -> int:
+        """Number of the first occurrence on or after ``day`` (ignoring the end)."""
+        if day <= self.start:
+            return 0
+        if self.freq == "daily":
+            return _ceil_div((day - self.start).days, self.interval)
+        if self.freq == "monthly":
+            diff = _months(day) - _months(self.start)
+            block = _ceil_div(diff, self.interval)
+            if block * self.interval == diff and day > _month_day(_months(day), self.start.day):
+                block += 1
+            return block
+        k = len(self.weekdays)
+        monday = self.start - timedelta(days=self.start.weekday())
+        weeks = (day - monday).days // 7
+        block = _ceil_div(weeks, self.interval)
+        slot = block * k
+        if block * self.interval == weeks:
+            slot += bisect_left(self.weekdays, day.weekday())
+        return max(0, slot - self._skipped_slots())
+
+    def between(self, start: date, end: date) -> Iterator[date]:
+        """Occurrence dates from ``start`` to ``end`` inclusive, in order."""
+        if self.until is not None:
+            end = min(end, self.until)
+        n = self.index_on_or_after(start)
+        while self.count is None or n < self.count:
+            day = self.nth(n)
+            if day > end:
+                return
+            yield day
+            n += 1
+
+    def describe(self) -> str:
+        unit = {"daily": "day", "weekly": "week", "monthly": "month"}[self.freq]
+        text = f"every {unit}" if self.interval == 1 else f"every {self.interval} {unit}s"
+        if self.freq == "weekly":
+            text += " on " + ", ".join(WEEKDAYS[d].title() for d in self.weekdays)
+        elif self.freq == "monthly":
+            text += f" on day {self.start.day}"
+        if self.until is not None:
+            text += f" until {self.until.isoformat()}"
+        elif self.count is not None:
+            text += f", {self.count} times"
+        return text
+
+    def to_dict(self) -> dict:
+        return {
+            "freq": self.freq,
+            "start": self.start.isoformat(),
+            "interval": self.interval,
+            "weekdays": [WEEKDAYS[d] for d in self.weekdays],
+            "until": self.until.isoformat() if self.until else None,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Recurrence:
+        return cls(
+            data["freq"],
+            date.fromisoformat(data["start"]),
+            data.get("interval", 1),
+            tuple(parse_weekday(d) for d in data.get("weekdays") or ()),
+            date.fromisoformat(data["until"]) if data.get("until") else None,
+            data.get("count"),
+        )
+
+
+def parse_weekday(name: str) -> int:
+    try:
+        return WEEKDAYS.index(name.strip().lower()[:3])
+    except ValueError:
+        raise SeriesError(f"Unknown weekday: {name!r}")
+
+
+@dataclass
+class Series:
+    """One recurring post, stored as a single record however often it repeats.
+
+    ``occurrences`` maps occurrence dates to the IDs of entries created for
+    them; only those dates exist in the store. ``skipped`` dates are never
+    shown or generated.
+    """
+
+    id: str
+    platform: Platform
+    topic: str
+    rule: Recurrence
+    content: str = ""  # fixed text; empty means generate from the topic
+    time: Optional[str] = None  # "HH:MM" added to each occurrence's scheduled date
+    lead_days: int = DEFAULT_LEAD_DAYS
+    created_at: str = ""
+    occurrences: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    @staticmethod
+    def new(platform: Platform, topic: str, rule: Recurrence, **kwargs) -> Series:
+        return Series(
+            id=uuid.uuid4().hex[:8], platform=platform, topic=topic, rule=rule,
+            created_at=datetime.now().isoformat(), **kwargs,
+        )
+
+    def occurrence_id(self, day: date) -> str:
+        return f"{self.id}@{day:%Y%m%d}"
+
+    def scheduled_date(self, day: date) -> str:
+        return f"{day.isoformat()}T{self.time}" if self.time else day.isoformat()
+
+    def planned(self, start: date, end: date) -> Iterator[date]:
+        """Occurrence dates in range that are neither materialized nor skipped."""
+        for day in self.rule.between(start, end):
+            iso = day.isoformat()
+            if iso not in self.occurrences and iso not in self.skipped:
+                yield day
+
+    def placeholder(self, day: date) -> ContentEntry:
+        """The not-yet-stored entry shown for a planned occurrence."""
+        return ContentEntry(
+            self.occurrence_id(day), self.platform, self.content, self.topic,
+            self.created_at, self.scheduled_date(day), ContentStatus.DRAFT,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "platform": self.platform.value,
+            "topic": self.topic,
+            "rule": self.rule.to_dict(),
+            "content": self.content,
+            "time": self.time,
+            "lead_days": self.lead_days,
+            "created_at": self.created_at,
+            "occurrences": self.occurrences,
+            "skipped": self.skipped,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Series:
+        return cls(
+            data["id"],
+            Platform(data["platform"]),
+            data["topic"],
+            Recurrence.from_dict(data["rule"]),
+            data.get("content", ""),
+            data.get("time"),
+            data.get("lead_days", DEFAULT_LEAD_DAYS),
+            data.get("created_at", ""),
+            dict(data.get("occurrences") or {}),
+            list(data.get("skipped") or []),
+        )
+
+
+class SeriesBook:
+    """Recurring series kept in a sidecar file (``content.series``).
+
+    Occurrences are expanded from the rules only for the dates being
+    viewed; an occurrence becomes a real store entry once it is generated,
+    edited or given content, and the series remembers its entry ID.
+    """
+
+    def __init__(self, store: ContentStore):
+        self.store = store
+        self.path = store.path.with_suffix(".series")
+        self._cache: Optional[Tuple[tuple, Dict[str, Series]]] = None
+
+    def _load(self) -> Dict[str, Series]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return {}
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            with open(self.path) as f:
+                data = json.load(f)
+            self._cache = (key, {s["id"]: Series.from_dict(s) for s in data["series"]})
+        return self._cache[1]
+
+    def _write(self, series: Dict[str, Series]) -> None:
+        data = {"version": 1, "series": [s.to_dict() for s in series.values()]}
+        atomic_write_json(self.path, data)
+        self._cache = None
+
+    def list(self) -> List[Series]:
+        return sorted(self._load().values(), key=lambda s: (s.rule.start, s.id))
+
+    def get(self, series_id: str) -> Optional[Series]:
+        """Find a series by ID or unique ID prefix."""
+        series = self._load()
+        if series_id in series:
+            return series[series_id]
+        matches = [s for i, s in series.items() if i.startswith(series_id)]
+        return matches[0] if len(matches) == 1 else None
+
+    def _require(self, series_id: str) -> Series:
+        found = self.get(series_id)
+        if found is None:
+            raise EntryNotFoundError(f"Series not found: {series_id}")
+        return found
+
+    def add(self, series: Series) -> Series:
+        current = dict(self._load())
+        current[series.id] = series
+        self._write(current)
+        return series
+
+    def delete(self, series_id: str) -> Series:
+        """Remove a series; entries already created for it stay in the store."""
+        found = self._require(series_id)
+        current = dict(self._load())
+        del current[found.id]
+        self._write(current)
+        return found
+
+    def skip(self, series_id: str, day: date) -> Series:
+        found = self._require(series_id)
+        if day not in found.rule.between(day, day):
+            raise SeriesError(f"{found.id} has no occurrence on {day.isoformat()}")
+        updated = replace(found, skipped=sorted(set(found.skipped) | {day.isoformat()}))
+        return self.add(updated)
+
+    def resolve(self, occurrence_id: str) -> Tuple[Series, date]:
+        """Split ``<series>@<YYYYMMDD>`` and check the date is a planned occurrence."""
+        series_id, sep, stamp = occurrence_id.partition("@")
+        try:
+            day = datetime.strptime(stamp, "%Y%m%d").date()
+        except ValueError:
+            raise EntryNotFoundError(f"Not a series occurrence: {occurrence_id}")
+        found = self._require(series_id)
+        if not any(True for _ in found.planned(day, day)):
+            raise EntryNotFoundError(f"No planned occurrence: {occurrence_id}")
+        return found, day
+
+    def placeholder(self, occurrence_id: str) -> ContentEntry:
+        series, day = self.resolve(occurrence_id)
+        return series.placeholder(day)
+
+    def expand(
+        self,
+        start: date,
+        end: date,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+    ) -> List[ContentEntry]:
+        """Placeholders for planned occurrences in range, in calendar order."""
+        streams = [
+            map(s.placeholder, s.planned(start, end))
+            for s in self._load().values()
+            if platform is None or s.platform is Platform(platform)
+        ]
+        return _filter(list(heapq.merge(*streams, key=sort_key)), None, status)
+
+    def scheduled_between(
+        self,
+        start: date,
+        end: date,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ) -> List[ContentEntry]:
+        """Like ``ContentStore.scheduled_between``, with planned occurrences merged in."""
+        stored = self.store.scheduled_between(start, end, platform, status, include_archived)
+        planned = self.expand(start, end, platform, status)
+        if not planned:
+            return stored
+        return list(heapq.merge(stored, planned, key=sort_key))
+
+    def materialize_many(self, updates: Dict[str, dict]) -> List[ContentEntry]:
+        """Store planned occurrences as entries (with field overrides) in one write."""
+        entries = []
+        links: Dict[str, Dict[str, str]] = {}
+        for occurrence_id, fields in updates.items():
+            series, day = self.resolve(occurrence_id)
+            placeholder = series.placeholder(day)
+            entry = ContentEntry.new(
+                series.platform, series.content, series.topic,
+                scheduled_date=placeholder.scheduled_date, status=ContentStatus.SCHEDULED,
+            )
+            for key, value in fields.items():
+                setattr(entry, key, value)
+            entries.append(entry)
+            links.setdefault(series.id, {})[day.isoformat()] = entry.id
+        # Entries first: a crash in between shows an occurrence twice rather than losing it
+        self.store.add_entries(entries)
+        current = dict(self._load())
+        for series_id, new in links.items():
+            current[series_id] = replace(
+                current[series_id], occurrences={**current[series_id].occurrences, **new}
+            )
+        self._write(current)
+        return entries
+
+    def materialize(self, occurrence_id: str, **fields) -> ContentEntry:
+        return self.materialize_many({occurrence_id: fields})[0]
+
+    def pending(self, as_of: Optional[date] = None) -> List[Tuple[Series, date]]:
+        """Planned occurrences from ``as_of`` up to each series' lead time."""
+        if as_of is None:
+            as_of = date.today()
+        found = [
+            (s, day)
+            for s in self._load().values()
+            for day in s.planned(as_of, as_of + timedelta(days=s.lead_days))
+        ]
+        return sorted(found, key=lambda pair: (pair[1], pair[0].id))
+
+
+@dataclass
+class GenerationReport:
+    created: List[ContentEntry] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # occurrence ID -> error
+
+
+async def agenerate_due(
+    book: SeriesBook,
+    as_of: Optional[date] = None,
+    concurrency: int = 8,
+    client=None,
+) -> GenerationReport:
+    """Create entries for occurrences coming up within their series' lead time.
+
+    Series with fixed content are stored as-is; the rest get text from the
+    API, ``concurrency`` requests at a time. Everything is stored in one write.
+    """
+    report = GenerationReport()
+    pending = book.pending(as_of)
+    if not pending:
+        return report
+    from social.generator import GenerationError, agenerate_content
+
+    limit = asyncio.Semaphore(concurrency)
+
+    async def text_for(series: Series) -> str:
+        if series.content:
+            return series.content
+        async with limit:
+            return await agenerate_content(series.topic, series.platform, client=client)
+
+    results = await asyncio.gather(*(text_for(s) for s, _ in pending), return_exceptions=True)
+    updates = {}
+    for (series, day), result in zip(pending, results):
+        if isinstance(result, GenerationError):
+            report.failed[series.occurrence_id(day)] = str(result)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            updates[series.occurrence_id(day)] = {"content": result}
+    if updates:
+        report.created = book.materialize_many(updates)
+    return report
+
+
+def generate_due(book: SeriesBook, as_of: Optional[date] = None, concurrency: int = 8) -> GenerationReport:
+    return asyncio.run(agenerate_due(book, as_of, concurrency))
+
+
+def generate_loop(
+    book: SeriesBook,
+    interval: float = 3600.0,
+    concurrency: int = 8,
+    on_report: Optional[Callable[[GenerationReport], None]] = None,
+    max_iterations: Optional[int] = None,
+) -> None:
+    """Repeatedly generate upcoming occurrences, sleeping ``interval`` seconds between passes."""
+    iteration = 0
+    while max_iterations is None or iteration < max_iterations:
+        report = generate_due(book, concurrency=concurrency)
+        if on_report is not None:
+            on_report(report)
+        iteration += 1
+        if max_iterations is None or iteration < max_iterations:
+            time.sleep(interval)
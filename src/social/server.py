@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from social import generator
+from social.exporter import in_range
+from social.models import ContentEntry, ContentStatus, Platform
+from social.ndjson import entry_from_record
+from social.store import ContentStore, calendar_order
+
+
+EDITABLE_FIELDS = ("content", "topic", "platform", "status", "scheduled_date")
+
+MAX_BODY_BYTES = 1 << 20
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _sort_key(e: dict) -> tuple:
+    return calendar_order(e.get("scheduled_date"), e["created_at"])
+
+
+class ServerState:
+    """In-memory copy of the store with coalesced write-through persistence.
+
+    Entry dicts are never mutated in place (updates replace them), so a
+    snapshot taken for a background save stays consistent while requests
+    keep modifying the live mapping. Concurrent writes that arrive while a
+    save is running are folded into the next save. If another process
+    wrote the file since the last load or save, it is re-read and the
+    pending changes are applied on top of it before saving.
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        executor: ThreadPoolExecutor,
+        entries: List[dict],
+        disk_key: Optional[tuple] = None,
+    ):
+        self.store = store
+        self.executor = executor
+        self.entries: Dict[str, dict] = {e["id"]: e for e in entries}
+        self._disk_key = disk_key
+        self._version = 0
+        self._written = 0
+        self._write_lock = asyncio.Lock()
+        self._changes: List[Tuple[str, dict]] = []
+        self._revisions: List[Tuple[dict, dict, str]] = []
+
+    async def persist(self, op: str, record: dict, previous: Optional[dict] = None) -> None:
+        self._changes.append((op, record))
+        if previous is not None and previous["content"] != record["content"]:
+            self._revisions.append((previous, record, datetime.now().isoformat()))
+        self._version += 1
+        target = self._version
+        async with self._write_lock:
+            if self._written >= target:
+                return
+            loop = asyncio.get_running_loop()
+            disk = await loop.run_in_executor(self.executor, self._reload_if_changed)
+            version = self._version
+            changes, self._changes = self._changes, []
+            revisions, self._revisions = self._revisions, []
+            if disk is not None:
+                self.entries = self._merge(disk, changes)
+            snapshot = list(self.entries.values())
+            self._disk_key = await loop.run_in_executor(
+                self.executor, self._save, snapshot, changes, revisions
+            )
+            self._written = version
+
+    def _reload_if_changed(self) -> Optional[List[dict]]:
+        """The file's entries if someone else wrote it since we last did, else None."""
+        self.store._ensure_file()
+        if self.store._stat_key() == self._disk_key:
+            return None
+        return self.store._load()
+
+    @staticmethod
+    def _merge(disk: List[dict], changes: List[Tuple[str, dict]]) -> Dict[str, dict]:
+        merged = {e["id"]: e for e in disk}
+        for op, record in changes:
+            if op == "delete":
+                merged.pop(record["id"], None)
+            else:
+                merged[record["id"]] = record
+        return merged
+
+    def _save(self, snapshot: List[dict], changes, revisions) -> tuple:
+        self.store._save(snapshot, changes, revisions)
+        return self.store._stat_key()
+
+    def find(self, entry_id: str) -> dict:
+        entry = self.entries.get(entry_id)
+        if entry is not None:
+            return entry
+        matches = [e for key, e in self.entries.items() if key.startswith(entry_id)]
+        if len(matches) != 1:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No entry found with ID: {entry_id}")
+        return matches[0]
+
+    def list(
+        self, platform: Optional[str] = None, status: Optional[str] = None
+    ) -> List[dict]:
+        entries = [
+            e for e in self.entries.values()
+            if (platform is None or e["platform"] == platform)
+            and (status is None or e["status"] == status)
+        ]
+        entries.sort(key=_sort_key)
+        return entries
+
+    async def add(self, entry: ContentEntry) -> dict:
+        record = entry.to_dict()
+        if record["id"] in self.entries:
+            raise HTTPError(HTTPStatus.CONFLICT, f"Entry ID already exists: {record['id']}")
+        self.entries[record["id"]] = record
+        await self.persist("add", record)
+        return record
+
+    async def update(self, entry_id: str, fields: dict) -> dict:
+        current = self.find(entry_id)
+        updated = dict(current)
+        updated.update(fields)
+        self.entries[current["id"]] = updated
+        await self.persist("update", updated, previous=current)
+        return updated
+
+    async def delete(self, entry_id: str) -> dict:
+        current = self.find(entry_id)
+        del self.entries[current["id"]]
+        await self.persist("delete", current)
+        return current
+
+
+class GenerationBatcher:
+    """Collects generation requests and dispatches them together.
+
+    Requests arriving within ``window`` seconds (or until ``max_batch`` are
+    queued) are sent as one batch over a shared API client. Identical
+    requests in flight at the same time share a single API call.
+    """
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        max_batch: int = 16,
+        window: float = 0.01,
+    ):
+        self.executor = executor
+        self.max_batch = max_batch
+        self.window = window
+        self.batches = 0
+        self._client = None
+        self._pending: Dict[tuple, asyncio.Future] = {}
+        self._queue: List[tuple] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _get_client(self):
+        if self._client is None:
+            import anthropic
+
+            self._client = anthropic.Anthropic()
+        return self._client
+
+    async def submit(self, topic: str, platform: Platform, extra: str = "") -> str:
+        key = (topic, platform, extra)
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._queue.append(key)
+            if len(self._queue) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        if not batch:
+            return
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        client = self._get_client()
+        for key in batch:
+            task = loop.run_in_executor(
+                self.executor, lambda k=key: generator.generate_content(*k, client=client)
+            )
+            task.add_done_callback(lambda t, k=key: self._resolve(k, t))
+
+    def _resolve(self, key: tuple, task: asyncio.Future) -> None:
+        future = self._pending.pop(key)
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+
+def _json_body(body: bytes) -> dict:
+    try:
+        data = json.loads(body or b"{}")
+    except json.JSONDecodeError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e.msg}")
+    if not isinstance(data, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Expected a JSON object")
+    return data
+
+
+def _query_date(query: dict, name: str) -> Optional[date]:
+    value = query.get(name, [None])[0]
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid date for {name}: {value}")
+
+
+def _validate_fields(data: dict) -> dict:
+    fields = {k: v for k, v in data.items() if k in EDITABLE_FIELDS}
+    try:
+        if "platform" in fields:
+            Platform(fields["platform"])
+        if "status" in fields:
+            ContentStatus(fields["status"])
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+    return fields
+
+
+class SocialServer:
+    """Minimal HTTP/1.1 JSON API over an in-memory copy of a ContentStore.
+
+    Routes:
+        GET    /entries[?platform=&status=]
+        GET    /entries/<id>
+        POST   /entries
+        PATCH  /entries/<id>
+        DELETE /entries/<id>
+        GET    /calendar[?from=YYYY-MM-DD&to=YYYY-MM-DD]
+        POST   /generate  {"topic", "platform", "extra"?, "save"?, "scheduled_date"?}
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_workers: int = 16,
+    ):
+        self.store = store
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="social-serve")
+        # Disk I/O gets its own thread so slow API calls never delay writes
+        self.io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="social-io")
+        self.state: Optional[ServerState] = None
+        self.batcher = GenerationBatcher(self.executor)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(self.io_executor, self.store._load)
+        self.state = ServerState(self.store, self.io_executor, entries, self.store._raw_cache[0])
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=True)
+        self.io_executor.shutdown(wait=True)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                raw_length = headers.get("content-length") or "0"
+                length = int(raw_length) if raw_length.isascii() and raw_length.isdigit() else -1
+                if length < 0:
+                    # The body's extent is unknown, so the connection can't be reused
+                    status, payload = HTTPStatus.BAD_REQUEST, {"error": f"Invalid Content-Length: {raw_length}"}
+                    keep_alive = False
+                elif length > MAX_BODY_BYTES:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.dispatch(method, target, body)
+                    keep_alive = (
+                        headers.get("connection", "").lower() != "close"
+                        and version == "HTTP/1.1"
+                    )
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[HTTPStatus, object]:
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split("/") if p]
+        try:
+            if parts == ["entries"]:
+                if method == "GET":
+                    return HTTPStatus.OK, self.state.list(
+                        platform=query.get("platform", [None])[0],
+                        status=query.get("status", [None])[0],
+                    )
+                if method == "POST":
+                    try:
+                        entry = entry_from_record(_json_body(body))
+                    except ValueError as e:
+                        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+                    return HTTPStatus.CREATED, await self.state.add(entry)
+            elif len(parts) == 2 and parts[0] == "entries":
+                if method == "GET":
+                    return HTTPStatus.OK, self.state.find(parts[1])
+                if method == "PATCH":
+                    fields = _validate_fields(_json_body(body))
+                    return HTTPStatus.OK, await self.state.update(parts[1], fields)
+                if method == "DELETE":
+                    return HTTPStatus.OK, await self.state.delete(parts[1])
+            elif parts == ["calendar"] and method == "GET":
+                start, end = _query_date(query, "from"), _query_date(query, "to")
+                dated = (e for e in self.state.entries.values() if e.get("scheduled_date"))
+                return HTTPStatus.OK, sorted(in_range(dated, start, end), key=_sort_key)
+            elif parts == ["generate"] and method == "POST":
+                return await self._generate(_json_body(body))
+            elif parts == ["models"] and method == "GET":
+                return HTTPStatus.OK, generator.router.snapshot()
+            else:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {url.path}")
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {url.path}")
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+
+    async def _generate(self, data: dict) -> Tuple[HTTPStatus, object]:
+        topic = data.get("topic")
+        if not topic:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Missing field: topic")
+        try:
+            platform = Platform(data.get("platform"))
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        try:
+            content = await self.batcher.submit(topic, platform, data.get("extra", ""))
+        except generator.GenerationError as e:
+            raise HTTPError(HTTPStatus.BAD_GATEWAY, str(e))
+
+        schedule = data.get("scheduled_date")
+        entry = ContentEntry.new(
+            platform=platform,
+            content=content,
+            topic=topic,
+            scheduled_date=schedule,
+            status=ContentStatus.SCHEDULED if schedule else ContentStatus.DRAFT,
+        )
+        if data.get("save", True):
+            return HTTPStatus.CREATED, await self.state.add(entry)
+        return HTTPStatus.OK, entry.to_dict()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import cmd
+import shlex
+from typing import List, Optional, Sequence
+
+import click
+
+from social import cli as cli_module
+from social.store import ContentStore
+
+
+class SocialShell(cmd.Cmd):
+    """Interactive session that runs the regular CLI commands in-process.
+
+    The store instance (and its parsed-entry cache) and the API client are
+    shared by every command in the session, so each command only pays for
+    its own work. ``root_args`` (such as ``--format json``) are passed to
+    every command, as if given before it on the command line.
+    """
+
+    intro = "Social interactive shell. Type help or ? to list commands, quit to exit."
+    prompt = "social> "
+
+    def __init__(
+        self,
+        store: Optional[ContentStore] = None,
+        stdin=None,
+        stdout=None,
+        root_args: Sequence[str] = (),
+    ):
+        super().__init__(stdin=stdin, stdout=stdout)
+        self.store = store if store is not None else ContentStore()
+        self.root_args = list(root_args)
+        cli_module.store = self.store
+
+    def _ensure_client(self) -> None:
+        if cli_module.client is None:
+            import anthropic
+
+            cli_module.client = anthropic.Anthropic()
+
+    def _run(self, command: str, line: str) -> None:
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            self.stdout.write(f"Error: {e}\n")
+            return
+        try:
+            cli_module.cli.main(
+                [*self.root_args, command, *args], prog_name="social", standalone_mode=False
+            )
+        except click.exceptions.Abort:
+            self.stdout.write("Cancelled.\n")
+        except click.ClickException as e:
+            e.show()
+        except SystemExit:
+            pass
+
+    def _complete_ids(self, text: str, line: str, begidx: int) -> List[str]:
+        if len(line[:begidx].split()) != 1:
+            return []
+        return [e.id for e in self.store.list_entries() if e.id.startswith(text)]
+
+    def do_generate(self, line: str) -> None:
+        """generate -p PLATFORM -t TOPIC [-s DATE] [--no-save]"""
+        self._ensure_client()
+        self._run("generate", line)
+
+    def do_calendar(self, line: str) -> None:
+        """calendar [-p PLATFORM] [--status STATUS] [--week | --weeks N | --month [YYYY-MM]] | calendar add ..."""
+        self._run("calendar", line)
+
+    def do_edit(self, line: str) -> None:
+        """edit ID [-c CONTENT] [-s DATE] [--status STATUS] [-r]"""
+        if {"-r", "--regenerate"} & set(line.split()):
+            self._ensure_client()
+        self._run("edit", line)
+
+    def do_delete(self, line: str) -> None:
+        """delete ID [--force]"""
+        self._run("delete", line)
+
+    def do_platforms(self, line: str) -> None:
+        """platforms"""
+        self._run("platforms", line)
+
+    def complete_edit(self, text, line, begidx, endidx):
+        return self._complete_ids(text, line, begidx)
+
+    def complete_delete(self, text, line, begidx, endidx):
+        return self._complete_ids(text, line, begidx)
+
+    def do_quit(self, line: str) -> bool:
+        """Exit the shell."""
+        return True
+
+    do_exit = do_quit
+
+    def do_EOF(self, line: str) -> bool:
+        self.stdout.write("\n")
+        return True
+
+    def emptyline(self) -> None:
+        pass
+
+    def default(self, line: str) -> None:
+        command, _, rest = line.partition(" ")
+        if command in cli_module.cli.commands and command != "shell":
+            self._run(command, rest)
+        else:
+            self.stdout.write(f"Unknown command: {command}\n")
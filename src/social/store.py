@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import heapq
 import os
-import tempfile
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from social import schema, trace
+from social.archive import Archive
+from social.changes import ChangeFeed, ChangeLog
+from social.history import Revision, RevisionLog
 from social.models import ContentEntry, ContentStatus, Platform
 
 
@@ -16,9 +24,72 @@ class EntryNotFoundError(ValueError):
     pass
 
 
+class DuplicateEntryError(ValueError):
+    pass
+
+
+def _encode_field(key: str, value):
+    if key == "platform" and isinstance(value, Platform):
+        return value.value
+    if key == "status" and isinstance(value, ContentStatus):
+        return value.value
+    return value
+
+
+def calendar_order(scheduled_date: Optional[str], created_at: str) -> tuple:
+    """Calendar order: scheduled entries by date, then unscheduled ones by creation time."""
+    if scheduled_date:
+        return (0, scheduled_date)
+    return (1, created_at)
+
+
+def sort_key(e: ContentEntry) -> tuple:
+    return calendar_order(e.scheduled_date, e.created_at)
+
+
+def _filter(
+    entries: List[ContentEntry],
+    platform: Optional[Platform],
+    status: Optional[ContentStatus],
+) -> List[ContentEntry]:
+    # Normalize once so the per-entry checks can compare members by identity
+    if platform is not None:
+        platform = Platform(platform)
+    if status is not None:
+        status = ContentStatus(status)
+    if platform is not None and status is not None:
+        return [e for e in entries if e.platform is platform and e.status is status]
+    if platform is not None:
+        return [e for e in entries if e.platform is platform]
+    if status is not None:
+        return [e for e in entries if e.status is status]
+    return list(entries)
+
+
+def _content_edits(pairs: List[Tuple[dict, dict]]) -> List[Tuple[dict, dict, str]]:
+    """Turn ``(old, new)`` record pairs into revision log edits."""
+    now = datetime.now().isoformat()
+    return [(old, new, now) for old, new in pairs if old["content"] != new["content"]]
+
+
 class ContentStore:
     def __init__(self, path: Path = DEFAULT_STORE_PATH):
         self.path = path
+        # Parsed file contents and decoded entries, keyed by the file's stat
+        # signature so repeated reads in one process skip the JSON parse.
+        self._raw_cache = None
+        self._entries_cache = None
+        self._due_cache = None
+        self.changes = ChangeLog(path.with_suffix(".changes"))
+        self.history = RevisionLog(path.with_suffix(".history"))
+        self.archive = Archive(path.with_suffix(".archive"))
+        self._archived_cache = None
+        # (sorted entries, scheduled day of each) for the hot and archived lists
+        self._days_cache: List[Tuple[List[ContentEntry], List[str]]] = []
+
+    def _stat_key(self) -> tuple:
+        st = os.stat(self.path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
 
     def _ensure_file(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -27,82 +98,420 @@ class ContentStore:
 
     def _load(self) -> List[dict]:
         self._ensure_file()
-        with open(self.path, "r") as f:
-            data = json.load(f)
-        return data.get("entries", [])
+        key = self._stat_key()
+        if self._raw_cache is not None and self._raw_cache[0] == key:
+            return self._raw_cache[1]
+        # Older files are migrated in memory and rewritten on the next save
+        with trace.span("store.parse", path=str(self.path)) as sp:
+            _, entries = schema.load(self.path)
+            sp.set(entries=len(entries))
+        self._raw_cache = (key, entries)
+        return entries
 
-    def _save(self, entries: List[dict]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        data = {"version": 1, "entries": entries}
-        # Atomic write: write to temp file then rename
-        fd, tmp_path = tempfile.mkstemp(
-            dir=str(self.path.parent), suffix=".tmp"
-        )
+    def iter_raw(self, chunk_size: int = 1 << 16, include_archived: bool = False) -> Iterator[dict]:
+        """Yield stored entry dicts one at a time without parsing the whole file.
+
+        Memory use is bounded by the largest single entry. Uses the parsed
+        cache instead when it is already current. With ``include_archived``,
+        archived entries follow the hot ones.
+        """
+        self._ensure_file()
+        if self._raw_cache is not None and self._raw_cache[0] == self._stat_key():
+            hot = iter(self._raw_cache[1])
+        else:
+            hot = schema.iter_records(self.path, chunk_size)
+        if not include_archived:
+            yield from hot
+            return
+        seen = set()
+        for record in hot:
+            seen.add(record["id"])
+            yield record
+        for record in self.archive.iter_records():
+            if record["id"] not in seen:
+                yield record
+
+    def _decoded(self) -> List[ContentEntry]:
+        """Decoded entries in calendar order, rebuilt only when the file changes."""
+        raw = self._load()
+        key = self._raw_cache[0]
+        if self._entries_cache is None or self._entries_cache[0] != key:
+            with trace.span("store.decode", entries=len(raw)):
+                entries = [ContentEntry.from_dict(e) for e in raw]
+            with trace.span("store.sort", entries=len(entries)):
+                entries.sort(key=sort_key)
+            self._entries_cache = (key, entries)
+        return self._entries_cache[1]
+
+    def _save(
+        self,
+        entries: List[dict],
+        changes: Optional[List[Tuple[str, dict]]] = None,
+        revisions: Optional[List[Tuple[dict, dict, str]]] = None,
+    ) -> None:
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(data, f, indent=2)
-            os.replace(tmp_path, str(self.path))
+            with trace.span("store.write", entries=len(entries)):
+                schema.write_file(self.path, entries, compress=self.path.suffix == ".gz")
         except Exception:
-            os.unlink(tmp_path)
+            self._raw_cache = None
             raise
+        self._raw_cache = (self._stat_key(), entries)
+        if changes:
+            with trace.span("store.changelog", events=len(changes)):
+                self.changes.append(changes)
+        if revisions:
+            with trace.span("store.history", revisions=len(revisions)):
+                self.history.record(revisions)
+
+    def change_feed(self, from_start: bool = False) -> ChangeFeed:
+        """Return a reader over add/update/delete events written after now."""
+        return ChangeFeed(self.changes.path, from_start=from_start)
+
+    def _archived_decoded(self) -> List[ContentEntry]:
+        """Decoded archived entries in calendar order, cached per archive index."""
+        index = self.archive.index()
+        if self._archived_cache is None or self._archived_cache[0] is not index:
+            hot = {e["id"] for e in self._load()}
+            with trace.span("store.archive_decode") as sp:
+                entries = [
+                    ContentEntry.from_dict(r)
+                    for r in self.archive.iter_records()
+                    if r["id"] not in hot
+                ]
+                entries.sort(key=sort_key)
+                sp.set(entries=len(entries))
+            self._archived_cache = (index, entries)
+        return self._archived_cache[1]
 
     def list_entries(
         self,
         platform: Optional[Platform] = None,
         status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
     ) -> List[ContentEntry]:
-        raw = self._load()
-        entries = [ContentEntry.from_dict(e) for e in raw]
+        entries = self._decoded()
+        if include_archived:
+            entries = list(heapq.merge(entries, self._archived_decoded(), key=sort_key))
+        return _filter(entries, platform, status)
 
-        if platform is not None:
-            entries = [e for e in entries if e.platform == platform]
-        if status is not None:
-            entries = [e for e in entries if e.status == status]
+    def _days_of(self, entries: List[ContentEntry]) -> List[str]:
+        """``YYYY-MM-DD`` of each scheduled entry at the front of a sorted list."""
+        for cached, days in self._days_cache:
+            if cached is entries:
+                return days
+        days = []
+        for e in entries:
+            if not e.scheduled_date:
+                break  # unscheduled entries sort after every scheduled one
+            days.append(e.scheduled_date[:10])
+        self._days_cache = [(entries, days)] + self._days_cache[:1]
+        return days
 
-        # Sort: scheduled entries first (by date), then unscheduled (by created_at)
-        def sort_key(e: ContentEntry):
-            if e.scheduled_date:
-                return (0, e.scheduled_date)
-            return (1, e.created_at)
+    def scheduled_between(
+        self,
+        start: date,
+        end: date,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ) -> List[ContentEntry]:
+        """Entries scheduled from ``start`` to ``end`` inclusive, in calendar order.
 
-        entries.sort(key=sort_key)
-        return entries
+        The range is bisected out of the cached sorted entries, so a month
+        view of a large store only touches that month's entries.
+        """
+        lo, hi = start.isoformat(), end.isoformat()
+        sources = [self._decoded()]
+        if include_archived:
+            sources.append(self._archived_decoded())
+        slices = []
+        for entries in sources:
+            days = self._days_of(entries)
+            slices.append(entries[bisect_left(days, lo):bisect_right(days, hi)])
+        found = slices[0] if len(slices) == 1 else list(heapq.merge(*slices, key=sort_key))
+        return _filter(found, platform, status)
+
+    def search(
+        self,
+        query: str,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ) -> List[ContentEntry]:
+        """Entries whose topic or content contains every word of ``query`` (case-insensitive)."""
+        terms = query.lower().split()
+        entries = self.list_entries(platform, status, include_archived)
+        if not terms:
+            return entries
+        matches = []
+        for e in entries:
+            text = f"{e.topic}\n{e.content}".lower()
+            if all(term in text for term in terms):
+                matches.append(e)
+        return matches
+
+    def _due_index(self) -> tuple:
+        """Scheduled entries sorted by date, rebuilt only when the file changes."""
+        self._ensure_file()
+        key = self._stat_key()
+        if self._due_cache is None or self._due_cache[0] != key:
+            scheduled = {
+                e["id"]: e
+                for e in self._load()
+                if e["status"] == ContentStatus.SCHEDULED.value and e.get("scheduled_date")
+            }
+            index = sorted((e["scheduled_date"], e["id"]) for e in scheduled.values())
+            self._due_cache = (key, index, scheduled)
+        return self._due_cache
+
+    def due_entries(self, as_of: Optional[datetime] = None) -> List[ContentEntry]:
+        """Return SCHEDULED entries whose scheduled date is at or before ``as_of``."""
+        if as_of is None:
+            as_of = datetime.now()
+        _, index, scheduled = self._due_index()
+        end = bisect_right(index, (as_of.isoformat(), "\uffff"))
+        return [ContentEntry.from_dict(scheduled[entry_id]) for _, entry_id in index[:end]]
 
-    def get_entry(self, entry_id: str) -> Optional[ContentEntry]:
+    def get_entry(self, entry_id: str, include_archived: bool = True) -> Optional[ContentEntry]:
+        """Find an entry by ID or unique ID prefix.
+
+        Archived entries are found through the archive index; they are
+        read-only, so mutators only see the hot store.
+        """
         raw = self._load()
-        matches = [
-            e for e in raw if e["id"] == entry_id or e["id"].startswith(entry_id)
-        ]
+        matches = {
+            e["id"]: e for e in raw if e["id"] == entry_id or e["id"].startswith(entry_id)
+        }
+        if include_archived and entry_id not in matches:
+            for record in self.archive.find(entry_id):
+                matches.setdefault(record["id"], record)
         if len(matches) == 1:
-            return ContentEntry.from_dict(matches[0])
+            return ContentEntry.from_dict(next(iter(matches.values())))
         return None
 
+    def archive_published(self, older_than_days: int = 90, as_of: Optional[date] = None) -> int:
+        """Move PUBLISHED entries dated before the cutoff into a new archive segment.
+
+        The entry's scheduled date (or creation time, if unscheduled) is
+        compared against ``as_of - older_than_days``. Returns the number of
+        entries moved out of the hot store.
+        """
+        if as_of is None:
+            as_of = date.today()
+        cutoff = (as_of - timedelta(days=older_than_days)).isoformat()
+        published = ContentStatus.PUBLISHED.value
+        kept, moved = [], []
+        for e in self._load():
+            day = (e.get("scheduled_date") or e["created_at"])[:10]
+            (moved if e["status"] == published and day < cutoff else kept).append(e)
+        if not moved:
+            return 0
+        # Segment first, then the hot store: an interrupted run leaves entries
+        # in both places, and the next run only drops them from the hot store.
+        already = self.archive.index()
+        fresh = [e for e in moved if e["id"] not in already]
+        if fresh:
+            self.archive.append(fresh)
+        self._save(kept, [("archive", e) for e in moved])
+        return len(moved)
+
     def add_entry(self, entry: ContentEntry) -> ContentEntry:
         raw = self._load()
-        raw.append(entry.to_dict())
-        self._save(raw)
+        record = entry.to_dict()
+        raw.append(record)
+        self._save(raw, [("add", record)])
         return entry
 
+    def add_entries(self, entries: List[ContentEntry]) -> List[ContentEntry]:
+        """Append many entries in a single write.
+
+        Raises DuplicateEntryError, without writing anything, if an ID is
+        already stored or appears twice in ``entries``.
+        """
+        if not entries:
+            return entries
+        raw = self._load()
+        records = [e.to_dict() for e in entries]
+        taken = {r["id"] for r in raw}
+        duplicates = []
+        for record in records:
+            if record["id"] in taken:
+                duplicates.append(record["id"])
+            taken.add(record["id"])
+        if duplicates:
+            raise DuplicateEntryError(f"Entry ID already exists: {', '.join(duplicates)}")
+        raw.extend(records)
+        self._save(raw, [("add", r) for r in records])
+        return entries
+
     def update_entry(self, entry_id: str, **kwargs) -> ContentEntry:
         raw = self._load()
         for i, e in enumerate(raw):
             if e["id"] == entry_id or e["id"].startswith(entry_id):
+                old = dict(e)
                 for key, value in kwargs.items():
-                    if key == "platform" and isinstance(value, Platform):
-                        e[key] = value.value
-                    elif key == "status" and isinstance(value, ContentStatus):
-                        e[key] = value.value
-                    else:
-                        e[key] = value
-                self._save(raw)
+                    e[key] = _encode_field(key, value)
+                self._save(raw, [("update", e)], _content_edits([(old, e)]))
                 return ContentEntry.from_dict(e)
         raise EntryNotFoundError(f"No entry found with ID: {entry_id}")
 
+    def update_entries(self, updates: Dict[str, dict]) -> List[ContentEntry]:
+        """Apply field updates to many entries (by exact ID) in a single write."""
+        if not updates:
+            return []
+        raw = self._load()
+        updated = [e for e in raw if e["id"] in updates]
+        missing = set(updates) - {e["id"] for e in updated}
+        if missing:
+            raise EntryNotFoundError(
+                f"No entry found with ID: {', '.join(sorted(missing))}"
+            )
+        pairs = []
+        for e in updated:
+            old = dict(e)
+            for key, value in updates[e["id"]].items():
+                e[key] = _encode_field(key, value)
+            pairs.append((old, e))
+        self._save(raw, [("update", e) for e in updated], _content_edits(pairs))
+        return [ContentEntry.from_dict(e) for e in updated]
+
+    def revisions(self, entry_id: str) -> List[Revision]:
+        """Return an entry's content revisions, oldest first.
+
+        Entries that were never edited report their current text as
+        revision 1.
+        """
+        entry = self.get_entry(entry_id)
+        if entry is None:
+            raise EntryNotFoundError(f"No entry found with ID: {entry_id}")
+        revisions = list(self.history.revisions(entry.id))
+        if not revisions:
+            revisions = [Revision(1, entry.created_at, entry.content)]
+        return revisions
+
+    def revert_entry(self, entry_id: str, rev: int) -> ContentEntry:
+        """Restore the content of revision ``rev``, recorded as a new revision."""
+        entry = self.get_entry(entry_id)
+        if entry is None:
+            raise EntryNotFoundError(f"No entry found with ID: {entry_id}")
+        if rev == 1 and not self.history.count(entry.id):
+            return entry
+        content = self.history.get(entry.id, rev).content
+        return self.update_entry(entry.id, content=content)
+
     def delete_entry(self, entry_id: str) -> ContentEntry:
         raw = self._load()
         for i, e in enumerate(raw):
             if e["id"] == entry_id or e["id"].startswith(entry_id):
-                deleted = ContentEntry.from_dict(raw.pop(i))
-                self._save(raw)
-                return deleted
+                record = raw.pop(i)
+                self._save(raw, [("delete", record)])
+                return ContentEntry.from_dict(record)
         raise EntryNotFoundError(f"No entry found with ID: {entry_id}")
+
+    def delete_entries(self, entry_ids: List[str]) -> List[ContentEntry]:
+        """Delete many entries (by exact ID) in a single write."""
+        if not entry_ids:
+            return []
+        wanted = set(entry_ids)
+        raw = self._load()
+        found = {e["id"] for e in raw if e["id"] in wanted}
+        missing = wanted - found
+        if missing:
+            raise EntryNotFoundError(
+                f"No entry found with ID: {', '.join(sorted(missing))}"
+            )
+        kept, deleted = [], []
+        for e in raw:
+            (deleted if e["id"] in wanted else kept).append(e)
+        self._save(kept, [("delete", e) for e in deleted])
+        return [ContentEntry.from_dict(e) for e in deleted]
+
+
+class AsyncContentStore:
+    """Asyncio facade over :class:`ContentStore`.
+
+    Every call runs on a private single-worker executor, so disk I/O never
+    blocks the event loop and calls keep ContentStore's single-threaded
+    semantics, executing in the order they were awaited. Errors are the same
+    as the synchronous store's (e.g. EntryNotFoundError).
+    """
+
+    def __init__(self, path: Path = DEFAULT_STORE_PATH, store: Optional[ContentStore] = None):
+        self.store = store if store is not None else ContentStore(path)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="social-store")
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def list_entries(
+        self,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ) -> List[ContentEntry]:
+        return await self._run(self.store.list_entries, platform, status, include_archived)
+
+    async def scheduled_between(
+        self,
+        start: date,
+        end: date,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ) -> List[ContentEntry]:
+        return await self._run(
+            self.store.scheduled_between, start, end, platform, status, include_archived
+        )
+
+    async def search(
+        self,
+        query: str,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+        include_archived: bool = False,
+    ) -> List[ContentEntry]:
+        return await self._run(self.store.search, query, platform, status, include_archived)
+
+    async def get_entry(self, entry_id: str, include_archived: bool = True) -> Optional[ContentEntry]:
+        return await self._run(self.store.get_entry, entry_id, include_archived)
+
+    async def due_entries(self, as_of: Optional[datetime] = None) -> List[ContentEntry]:
+        return await self._run(self.store.due_entries, as_of)
+
+    async def add_entry(self, entry: ContentEntry) -> ContentEntry:
+        return await self._run(self.store.add_entry, entry)
+
+    async def add_entries(self, entries: List[ContentEntry]) -> List[ContentEntry]:
+        return await self._run(self.store.add_entries, entries)
+
+    async def update_entry(self, entry_id: str, **kwargs) -> ContentEntry:
+        return await self._run(self.store.update_entry, entry_id, **kwargs)
+
+    async def update_entries(self, updates: Dict[str, dict]) -> List[ContentEntry]:
+        return await self._run(self.store.update_entries, updates)
+
+    async def delete_entry(self, entry_id: str) -> ContentEntry:
+        return await self._run(self.store.delete_entry, entry_id)
+
+    async def delete_entries(self, entry_ids: List[str]) -> List[ContentEntry]:
+        return await self._run(self.store.delete_entries, entry_ids)
+
+    async def revisions(self, entry_id: str) -> List[Revision]:
+        return await self._run(self.store.revisions, entry_id)
+
+    async def revert_entry(self, entry_id: str, rev: int) -> ContentEntry:
+        return await self._run(self.store.revert_entry, entry_id, rev)
+
+    async def archive_published(self, older_than_days: int = 90, as_of: Optional[date] = None) -> int:
+        return await self._run(self.store.archive_published, older_than_days, as_of)
+
+    async def close(self) -> None:
+        """Wait for queued calls to finish and release the worker thread."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def __aenter__(self) -> AsyncContentStore:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
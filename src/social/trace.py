@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List, Optional
+
+
+DEFAULT_TRACE_PATH = "social-trace.json"
+
+
+class _NullSpan:
+    """Shared no-op span returned while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer: Tracer, name: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.events.append(
+            (self.name, self.start, perf_counter_ns(), threading.get_ident(), self.args)
+        )
+        return False
+
+    def set(self, **args) -> None:
+        """Attach extra arguments (e.g. result sizes) to the span."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects timed spans and writes them as Chrome trace-event JSON.
+
+    Open the output in chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.origin = perf_counter_ns()
+        # (name, start_ns, end_ns, thread_id, args); list.append is thread-safe
+        self.events: List[tuple] = []
+
+    def span(self, name: str, **args) -> _Span:
+        return _Span(self, name, args)
+
+    def chrome_events(self) -> List[dict]:
+        pid = os.getpid()
+        return [
+            {
+                "name": name,
+                "cat": name.partition(".")[0],
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            }
+            for name, start, end, tid, args in self.events
+        ]
+
+    def write(self, path: Optional[Path] = None) -> Path:
+        path = Path(path or self.path or DEFAULT_TRACE_PATH)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.chrome_events(), "displayTimeUnit": "ms"}, f)
+        return path
+
+    def summary(self) -> List[Dict]:
+        """Per-span totals in milliseconds, slowest total first."""
+        totals: Dict[str, list] = {}
+        for name, start, end, _, _ in self.events:
+            row = totals.setdefault(name, [0, 0, 0])
+            elapsed = end - start
+            row[0] += 1
+            row[1] += elapsed
+            row[2] = max(row[2], elapsed)
+        rows = [
+            {"span": name, "calls": calls, "total_ms": total / 1e6,
+             "mean_ms": total / calls / 1e6, "max_ms": longest / 1e6}
+            for name, (calls, total, longest) in totals.items()
+        ]
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows
+
+
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str, **args):
+    """Time a block as ``name``; returns a shared no-op span when tracing is off."""
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, args)
+
+
+def active() -> Optional[Tracer]:
+    return _tracer
+
+
+def enable(path: Optional[Path] = None) -> Tracer:
+    """Start collecting spans, keeping the current tracer if there is one."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path)
+    elif path is not None:
+        _tracer.path = path
+    return _tracer
+
+
+def finish() -> Optional[Tracer]:
+    """Stop tracing and write the trace file. Returns the finished tracer."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.write()
+    return tracer
+
+
+def _enable_from_env() -> None:
+    value = os.environ.get("SOCIAL_TRACE")
+    if value:
+        enable(Path(DEFAULT_TRACE_PATH if value == "1" else value))
+        atexit.register(finish)
+
+
+_enable_from_env()
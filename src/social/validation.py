@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from social.hashtags import HASHTAG_RE
+from social.models import Platform, parse_platform
+from social.platforms import PlatformConfig, registry
+
+
+# twitter-text v3: URLs count as a t.co link, code points in these ranges
+# weigh 1 and everything else (CJK, emoji, ...) weighs 2.
+TWITTER_URL_LENGTH = 23
+_LIGHT_RANGES = ((0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037))
+_URL_RE = re.compile(
+    r"https?://\S+|\b(?:www\.)?[a-z0-9-]+(?:\.[a-z0-9-]+)*\.(?:com|org|net|io|co|dev|ai)\b(?:/\S*)?",
+    re.I,
+)
+# Cheap pre-check so most posts skip the full URL scan
+_URL_HINT_RE = re.compile(r"[:.](?://|(?:com|org|net|io|co|dev|ai)\b)", re.I)
+# An emoji with its modifiers and ZWJ-joined parts counts once
+_EMOJI_RE = re.compile(
+    "[\U0001F000-\U0001FAFF\u2600-\u27BF]"
+    "(?:[\uFE0F\U0001F3FB-\U0001F3FF]|\u200D[\u2600-\u27BF\U0001F000-\U0001FAFF])*"
+)
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _light(cp: int) -> bool:
+    return cp <= 0x10FF or any(low <= cp <= high for low, high in _LIGHT_RANGES)
+
+
+def weighted_length(text: str) -> int:
+    """Length of ``text`` as Twitter counts it against the 280 limit."""
+    if not _URL_HINT_RE.search(text):
+        return _plain_weight(text)
+    length = 0
+    pos = 0
+    for match in _URL_RE.finditer(text):
+        length += _plain_weight(text[pos:match.start()]) + TWITTER_URL_LENGTH
+        pos = match.end()
+    return length + _plain_weight(text[pos:])
+
+
+def _plain_weight(text: str) -> int:
+    if not _NON_ASCII_RE.search(text):
+        return len(text)
+    length = 0
+    pos = 0
+    for match in _EMOJI_RE.finditer(text):
+        length += _code_point_weight(text[pos:match.start()]) + 2
+        pos = match.end()
+    return length + _code_point_weight(text[pos:])
+
+
+def _code_point_weight(text: str) -> int:
+    return sum(1 if _light(ord(ch)) else 2 for ch in text)
+
+
+def content_length(text: str, config: PlatformConfig) -> int:
+    """Length of ``text`` under the platform's counting rules."""
+    if config.length_counting == "twitter":
+        return weighted_length(text)
+    return len(text)
+
+
+@dataclass(frozen=True)
+class Violation:
+    entry_id: str
+    platform: Platform
+    rule: str
+    message: str
+
+    def to_dict(self) -> dict:
+        return {"id": self.entry_id, "platform": self.platform.value,
+                "rule": self.rule, "message": self.message}
+
+
+# A rule takes post content and returns (rule name, message) or None
+Rule = Callable[[str], Optional[Tuple[str, str]]]
+
+
+def _length_rule(config: PlatformConfig) -> Rule:
+    measure = weighted_length if config.length_counting == "twitter" else len
+    limit = config.max_length
+    unit = "weighted characters" if config.length_counting == "twitter" else "characters"
+
+    def check(content: str):
+        length = measure(content)
+        if length > limit:
+            return "length", f"{length} {unit} (max {limit})"
+        return None
+    return check
+
+
+def _hashtag_rule(config: PlatformConfig) -> Optional[Rule]:
+    style, limit = config.hashtag_style, config.max_hashtags
+    if style != "none" and style != "footer" and limit is None:
+        return None
+
+    def check(content: str):
+        tags = HASHTAG_RE.findall(content)
+        if not tags:
+            return None
+        if style == "none":
+            return "hashtags", f"{config.name} posts should not use hashtags"
+        if limit is not None and len(tags) > limit:
+            return "hashtags", f"{len(tags)} hashtags (max {limit})"
+        if style == "footer":
+            # Every hashtag belongs in the closing paragraph
+            body, _, _ = content.rstrip().rpartition("\n\n")
+            if body and HASHTAG_RE.search(body):
+                return "hashtag_position", "hashtags must be in the closing paragraph"
+        return None
+    return check
+
+
+def _lines_rule(config: PlatformConfig) -> Optional[Rule]:
+    limit = config.max_lines
+    if limit is None:
+        return None
+
+    def check(content: str):
+        lines = content.count("\n") + 1
+        if lines > limit:
+            return "lines", f"{lines} lines (max {limit})"
+        return None
+    return check
+
+
+def _banned_rule(config: PlatformConfig) -> Optional[Rule]:
+    if not config.banned_terms:
+        return None
+    pattern = re.compile(
+        r"(?<!\w)(?:" + "|".join(re.escape(t) for t in config.banned_terms) + r")(?!\w)", re.I
+    )
+
+    def check(content: str):
+        found = sorted({m.group(0).lower() for m in pattern.finditer(content)})
+        if found:
+            return "banned_terms", f"contains banned term(s): {', '.join(found)}"
+        return None
+    return check
+
+
+@lru_cache(maxsize=None)
+def compile_rules(config: PlatformConfig) -> Tuple[Rule, ...]:
+    """Build the platform's checks once; configs are frozen, so this is cached."""
+    rules = [_length_rule(config), _hashtag_rule(config), _lines_rule(config), _banned_rule(config)]
+    return tuple(rule for rule in rules if rule is not None)
+
+
+def check_content(content: str, config: PlatformConfig) -> List[Tuple[str, str]]:
+    """``(rule, message)`` pairs for every rule ``content`` breaks."""
+    return [v for v in (rule(content) for rule in compile_rules(config)) if v is not None]
+
+
+def validate_records(
+    records: Iterable[dict],
+    configs: Optional[Dict[Platform, PlatformConfig]] = None,
+) -> Iterator[Violation]:
+    """Check stored entry dicts in one pass, yielding every violation.
+
+    Works on raw records (e.g. ``ContentStore.iter_raw()``) so large stores
+    are validated without decoding entries.
+    """
+    if configs is None:
+        configs = registry()
+    rules = {p: compile_rules(c) for p, c in configs.items()}
+    for record in records:
+        platform = parse_platform(record["platform"])
+        content = record["content"]
+        for rule in rules[platform]:
+            result = rule(content)
+            if result is not None:
+                yield Violation(record["id"], platform, result[0], result[1])
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from social.calendar import calendar_row, new_calendar_table
+from social.changes import ChangeFeedGap
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore, sort_key
+
+
+class CalendarWatcher:
+    """Live calendar model patched from the store's change feed.
+
+    Formatted rows are cached per entry and only rebuilt for entries named in
+    a change event; the sort order is only recomputed after a change.
+    """
+
+    def __init__(
+        self,
+        store: ContentStore,
+        platform: Optional[Platform] = None,
+        status: Optional[ContentStatus] = None,
+    ):
+        self.store = store
+        self.platform = platform
+        self.status = status
+        self.feed = store.change_feed()
+        self.entries: Dict[str, ContentEntry] = {}
+        self._rows: Dict[str, tuple] = {}
+        self._order: List[str] = []
+        self.reload()
+
+    def _matches(self, entry: ContentEntry) -> bool:
+        return (self.platform is None or entry.platform == self.platform) and (
+            self.status is None or entry.status == self.status
+        )
+
+    def reload(self) -> None:
+        entries = self.store.list_entries(platform=self.platform, status=self.status)
+        self.entries = {e.id: e for e in entries}
+        self._rows = {}
+        self._order = [e.id for e in entries]
+
+    def apply(self, events: List[dict]) -> bool:
+        """Apply change events; return True if the visible calendar changed."""
+        changed = False
+        for event in events:
+            entry_id = event["id"]
+            if event["op"] == "delete" or event["entry"] is None:
+                changed |= self.entries.pop(entry_id, None) is not None
+                self._rows.pop(entry_id, None)
+                continue
+            entry = ContentEntry.from_dict(event["entry"])
+            self._rows.pop(entry_id, None)
+            if self._matches(entry):
+                self.entries[entry_id] = entry
+                changed = True
+            else:
+                changed |= self.entries.pop(entry_id, None) is not None
+        if changed:
+            self._order = [e.id for e in sorted(self.entries.values(), key=sort_key)]
+        return changed
+
+    def poll(self) -> bool:
+        """Check the feed once; return True if the calendar needs redrawing."""
+        try:
+            events = self.feed.poll()
+        except ChangeFeedGap:
+            self.reload()
+            return True
+        return self.apply(events) if events else False
+
+    def render(self) -> Table:
+        table = new_calendar_table("Content Calendar (watching)")
+        for entry_id in self._order:
+            row = self._rows.get(entry_id)
+            if row is None:
+                row = self._rows[entry_id] = calendar_row(self.entries[entry_id])
+            table.add_row(*row)
+        return table
+
+
+def watch_calendar(
+    store: ContentStore,
+    platform: Optional[Platform] = None,
+    status: Optional[ContentStatus] = None,
+    console: Optional[Console] = None,
+    interval: float = 1.0,
+    max_polls: Optional[int] = None,
+) -> None:
+    """Show the calendar and redraw it whenever the store changes."""
+    if console is None:
+        console = Console()
+    watcher = CalendarWatcher(store, platform=platform, status=status)
+    polls = 0
+    with Live(watcher.render(), console=console, auto_refresh=False) as live:
+        while max_polls is None or polls < max_polls:
+            time.sleep(interval)
+            polls += 1
+            if watcher.poll():
+                live.update(watcher.render(), refresh=True)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import heapq
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import DEFAULT_STORE_PATH, ContentStore, sort_key
+
+
+DEFAULT_WORKSPACE = "default"
+# The default workspace keeps the original store location; named ones live here.
+WORKSPACES_DIR = DEFAULT_STORE_PATH.parent / "workspaces"
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+class WorkspaceError(ValueError):
+    pass
+
+
+def workspace_path(name: Optional[str] = None) -> Path:
+    """Store file for workspace ``name`` (None means the default workspace)."""
+    if name is None or name == DEFAULT_WORKSPACE:
+        return DEFAULT_STORE_PATH
+    if not _NAME_RE.match(name):
+        raise WorkspaceError(
+            f"Invalid workspace name: {name!r} (letters, digits, '.', '_' and '-')"
+        )
+    return WORKSPACES_DIR / name / "content.json"
+
+
+def list_workspaces() -> List[str]:
+    """The default workspace followed by every named one, sorted."""
+    names = []
+    if WORKSPACES_DIR.is_dir():
+        names = sorted(
+            p.name for p in WORKSPACES_DIR.iterdir()
+            if _NAME_RE.match(p.name) and (p / "content.json").exists()
+        )
+    return [DEFAULT_WORKSPACE] + names
+
+
+def require_workspace(name: Optional[str]) -> Path:
+    """Path of an existing workspace, so a typo never starts an empty store."""
+    path = workspace_path(name)
+    if path != DEFAULT_STORE_PATH and not path.exists():
+        raise WorkspaceError(f"No workspace named {name!r} (create it with `social workspace create {name}`)")
+    return path
+
+
+def create_workspace(name: str) -> Path:
+    path = workspace_path(name)
+    if path == DEFAULT_STORE_PATH or path.exists():
+        raise WorkspaceError(f"Workspace {name!r} already exists")
+    ContentStore(path)._ensure_file()
+    return path
+
+
+# Worker functions run in child processes, so they take plain paths and
+# return entries already filtered and in calendar order.
+
+def _list_worker(
+    path: str,
+    platform: Optional[Platform],
+    status: Optional[ContentStatus],
+    include_archived: bool,
+) -> List[ContentEntry]:
+    return ContentStore(Path(path)).list_entries(platform, status, include_archived)
+
+
+def _search_worker(
+    path: str,
+    query: str,
+    platform: Optional[Platform],
+    status: Optional[ContentStatus],
+    include_archived: bool,
+) -> List[ContentEntry]:
+    return ContentStore(Path(path)).search(query, platform, status, include_archived)
+
+
+def _run(
+    names: List[str], worker: Callable, args: tuple, workers: Optional[int]
+) -> List[Tuple[str, ContentEntry]]:
+    paths = [str(require_workspace(name)) for name in names]
+    if workers is None:
+        workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1 or len(paths) <= 1:
+        results = [worker(path, *args) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(worker, path, *args) for path in paths]
+            results = [f.result() for f in futures]
+    streams = [[(name, e) for e in entries] for name, entries in zip(names, results)]
+    return list(heapq.merge(*streams, key=lambda pair: sort_key(pair[1])))
+
+
+def list_across(
+    names: List[str],
+    platform: Optional[Platform] = None,
+    status: Optional[ContentStatus] = None,
+    include_archived: bool = False,
+    workers: Optional[int] = None,
+) -> List[Tuple[str, ContentEntry]]:
+    """``(workspace, entry)`` pairs from every named workspace in calendar order.
+
+    Each workspace is loaded and filtered in its own process; the sorted
+    results are merged without re-sorting.
+    """
+    return _run(names, _list_worker, (platform, status, include_archived), workers)
+
+
+def search_across(
+    names: List[str],
+    query: str,
+    platform: Optional[Platform] = None,
+    status: Optional[ContentStatus] = None,
+    include_archived: bool = False,
+    workers: Optional[int] = None,
+) -> List[Tuple[str, ContentEntry]]:
+    """Like :func:`list_across`, for entries matching ``query`` (see ContentStore.search)."""
+    return _run(names, _search_worker, (query, platform, status, include_archived), workers)
@@ -0,0 +1,86 @@
+import json
+from datetime import date
+
+import pytest
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+
+
+TODAY = date(2026, 6, 1)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _add(store, status=ContentStatus.PUBLISHED, scheduled="2026-01-10", **kwargs):
+    entry = ContentEntry.new(
+        platform=kwargs.pop("platform", Platform.TWITTER),
+        content=kwargs.pop("content", "Hello"),
+        topic="t",
+        scheduled_date=scheduled,
+        status=status,
+    )
+    return store.add_entry(entry)
+
+
+def test_archive_moves_only_old_published(store):
+    old = _add(store)
+    recent = _add(store, scheduled="2026-05-20")
+    draft = _add(store, status=ContentStatus.DRAFT, scheduled=None)
+    scheduled = _add(store, status=ContentStatus.SCHEDULED, scheduled="2026-01-01")
+
+    assert store.archive_published(older_than_days=30, as_of=TODAY) == 1
+    assert {e.id for e in store.list_entries()} == {recent.id, draft.id, scheduled.id}
+    assert store.archive.index() == {old.id: 1}
+    assert store.archive.segment_path(1).read_bytes()[:2] == b"\x1f\x8b"
+    assert store.archive_published(older_than_days=30, as_of=TODAY) == 0
+
+
+def test_archived_entries_remain_reachable(store):
+    old = _add(store, content="From the archive")
+    hot = _add(store, status=ContentStatus.DRAFT, scheduled=None)
+    store.archive_published(older_than_days=30, as_of=TODAY)
+
+    fresh = ContentStore(path=store.path)
+    assert fresh.get_entry(old.id).content == "From the archive"
+    assert fresh.get_entry(old.id[:5]).id == old.id
+    assert fresh.get_entry(old.id, include_archived=False) is None
+    assert [e.id for e in fresh.list_entries(include_archived=True)] == [old.id, hot.id]
+    assert [r["id"] for r in fresh.iter_raw(include_archived=True)] == [hot.id, old.id]
+    assert [e.id for e in fresh.list_entries(status=ContentStatus.PUBLISHED, include_archived=True)] == [old.id]
+
+
+def test_segments_are_append_only(store):
+    first = _add(store, scheduled="2026-01-01")
+    store.archive_published(older_than_days=30, as_of=TODAY)
+    segment = store.archive.segment_path(1).read_bytes()
+    second = _add(store, scheduled="2026-02-01")
+    store.archive_published(older_than_days=30, as_of=TODAY)
+    assert store.archive.segment_path(1).read_bytes() == segment
+    assert store.archive.index() == {first.id: 1, second.id: 2}
+    assert {e.id for e in store.list_entries(include_archived=True)} == {first.id, second.id}
+
+
+def test_interrupted_archive_is_completed_without_duplicates(store, mocker):
+    old = _add(store)
+    mocker.patch.object(store, "_save", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        store.archive_published(older_than_days=30, as_of=TODAY)
+    mocker.stopall()
+    assert [r["id"] for r in store.iter_raw(include_archived=True)] == [old.id]
+    assert store.archive_published(older_than_days=30, as_of=TODAY) == 1
+    assert store.archive.segments() == [1]
+    assert [e.id for e in store.list_entries(include_archived=True)] == [old.id]
+
+
+def test_archive_is_logged_as_removal(store):
+    old = _add(store)
+    feed = store.change_feed()
+    store.archive_published(older_than_days=30, as_of=TODAY)
+    events = feed.poll()
+    assert [(e["op"], e["id"], e["entry"]) for e in events] == [("archive", old.id, None)]
+    index = json.loads(store.archive.index_path.read_text())
+    assert index["ids"] == {old.id: 1}
@@ -1,12 +1,18 @@
+from datetime import date
 from io import StringIO
 
 from rich.console import Console
 
 from social.calendar import (
+    GridPager,
+    ListPager,
+    Period,
+    RowCache,
     display_calendar,
     display_entry_detail,
     render_calendar_table,
     render_week_view,
+    render_weeks_view,
 )
 from social.models import ContentEntry, ContentStatus, Platform
 from social.store import ContentStore
@@ -39,8 +45,6 @@ def test_render_calendar_table_empty():
 
 
 def test_render_week_view():
-    from datetime import date
-
     entry = _make_entry(scheduled_date="2026-02-09")
     table = render_week_view([entry], start_date=date(2026, 2, 9))
     assert len(table.columns) == 7
@@ -64,3 +68,105 @@ def test_display_calendar_with_entries(tmp_path):
     store.add_entry(_make_entry(topic="Python tips"))
     output = _capture_output(display_calendar, store)
     assert "Python tips" in output
+
+
+def test_periods():
+    month = Period.for_month(date(2026, 3, 17))
+    assert (month.start, month.end, month.weeks) == (date(2026, 2, 23), date(2026, 4, 5), 6)
+    assert month.title == "March 2026"
+    assert month.shift(-3).month == date(2025, 12, 1)
+    weeks = Period.for_weeks(date(2026, 3, 4), 2)
+    assert (weeks.start, weeks.end) == (date(2026, 3, 2), date(2026, 3, 15))
+    assert weeks.shift(1).start == date(2026, 3, 16)
+
+
+def test_render_weeks_view_limits_entries_per_day():
+    entries = [_make_entry(topic=f"t{i}", scheduled_date="2026-03-03") for i in range(5)]
+    entries.append(_make_entry(topic="outside", scheduled_date="2026-04-20"))
+    table = render_weeks_view(entries, Period.for_month(date(2026, 3, 1)), per_day=2)
+    assert table.row_count == 6
+    tuesday = table.columns[1]._cells[1]
+    assert "t0" in tuesday and "t1" in tuesday and "t2" not in tuesday
+    assert "+3 more" in tuesday
+    assert not any("outside" in cell for col in table.columns for cell in col._cells)
+
+
+def test_row_cache_reuses_rows_until_entry_changes():
+    calls = []
+    cache = RowCache(lambda e: calls.append(e.id) or (e.topic,))
+    entry = _make_entry(topic="one")
+    assert cache.get(entry) == ("one",)
+    assert cache.get(_make_entry(topic="x")) == ("x",)
+    assert cache.get(entry) == ("one",)
+    assert len(calls) == 2
+    entry.topic = "two"
+    assert cache.get(entry) == ("two",)
+    assert len(calls) == 3
+
+
+def _pager_console(height):
+    return Console(file=StringIO(), force_terminal=True, width=120, height=height)
+
+
+def test_list_pager_pages_by_terminal_height(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entries([_make_entry(topic=f"t{i:02}", scheduled_date=f"2026-03-{i + 1:02}") for i in range(25)])
+    pager = ListPager(store, _pager_console(17))
+    seen = []
+    keys = iter(["n", "n", "n", "p", "q"])
+
+    def read_key():
+        seen.append(pager.render())
+        return next(keys)
+
+    pager.run(read_key)
+    assert [t.row_count for t in seen] == [10, 10, 5, 5, 10]
+    assert "page 3/3" in seen[2].title
+
+
+def test_pager_only_when_output_does_not_fit(tmp_path, monkeypatch):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entries([_make_entry(topic=f"t{i:02}", scheduled_date=f"2026-03-{i + 1:02}") for i in range(5)])
+    runs = []
+    monkeypatch.setattr(ListPager, "run", lambda self: runs.append("list"))
+    monkeypatch.setattr(GridPager, "run", lambda self: runs.append("grid"))
+    march = Period.for_month(date(2026, 3, 1))
+    short = _pager_console(17)
+    display_calendar(store, console=short, pager=True)
+    display_calendar(store, console=short, pager=True, period=Period.for_weeks(date(2026, 3, 2)))
+    assert runs == []
+    assert "t04" in short.file.getvalue() and "Week of 2026-03-02" in short.file.getvalue()
+    display_calendar(store, console=_pager_console(8), pager=True)
+    display_calendar(store, console=short, pager=True, period=march)
+    assert runs == ["list", "grid"]
+    assert ListPager(store, _pager_console(12)).fits()
+    assert GridPager(store, _pager_console(40), march).fits()
+
+
+def test_grid_pager_fits_ignores_unparseable_dates(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entries([
+        _make_entry(scheduled_date="2026-03-03T09:00"),
+        _make_entry(scheduled_date="2026-03-03x"),
+        _make_entry(scheduled_date="2026-03-99"),
+    ])
+    assert GridPager(store, _pager_console(40), Period.for_month(date(2026, 3, 1))).fits()
+
+
+def test_grid_pager_queries_one_period(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entries([_make_entry(scheduled_date="2026-03-03"), _make_entry(scheduled_date="2026-04-14")])
+    pager = GridPager(store, _pager_console(40), Period.for_month(date(2026, 3, 1)))
+    ranges = []
+    original = store.scheduled_between
+    store.scheduled_between = lambda start, end, *a: ranges.append((start, end)) or original(start, end, *a)
+    pager.run(iter(["\x1b[C", "q"]).__next__)
+    assert ranges == [(date(2026, 2, 23), date(2026, 4, 5)), (date(2026, 3, 30), date(2026, 5, 3))]
+
+
+def test_display_calendar_month(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entry(_make_entry(topic="In March", scheduled_date="2026-03-10"))
+    store.add_entry(_make_entry(topic="In May", scheduled_date="2026-05-10"))
+    output = _capture_output(display_calendar, store, period=Period.for_month(date(2026, 3, 1)))
+    assert "March 2026" in output and "In March" in output and "In May" not in output
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from social import changes as changes_mod
+from social.changes import ChangeFeed, ChangeFeedGap, ChangeLog
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _make_entry(**kwargs):
+    defaults = dict(platform=Platform.TWITTER, content="Hello", topic="test")
+    defaults.update(kwargs)
+    return ContentEntry.new(**defaults)
+
+
+def test_store_writes_numbered_events(store):
+    entry = store.add_entry(_make_entry())
+    store.update_entry(entry.id, status=ContentStatus.SCHEDULED)
+    store.delete_entry(entry.id)
+    lines = [json.loads(l) for l in store.changes.path.read_text().splitlines()]
+    assert [(e["seq"], e["op"]) for e in lines] == [(1, "add"), (2, "update"), (3, "delete")]
+    assert lines[1]["entry"]["status"] == "scheduled"
+    assert lines[2]["entry"] is None
+
+
+def test_feed_starts_at_end_and_reads_new_events(store):
+    store.add_entry(_make_entry(content="before"))
+    feed = store.change_feed()
+    assert feed.poll() == []
+    entry = store.add_entry(_make_entry(content="after"))
+    events = feed.poll()
+    assert [(e["op"], e["id"]) for e in events] == [("add", entry.id)]
+    assert feed.poll() == []
+
+
+def test_feed_from_start(store):
+    store.add_entry(_make_entry())
+    store.add_entry(_make_entry())
+    assert [e["seq"] for e in store.change_feed(from_start=True).poll()] == [1, 2]
+
+
+def test_idle_poll_only_stats(store, mocker):
+    store.add_entry(_make_entry())
+    feed = store.change_feed()
+    mocker.patch("social.changes.open", side_effect=AssertionError, create=True)
+    for _ in range(5):
+        assert feed.poll() == []
+
+
+def test_last_seq_survives_new_instances(store):
+    store.add_entry(_make_entry())
+    store.add_entry(_make_entry())
+    other = ContentStore(path=store.path)
+    other.add_entry(_make_entry())
+    assert other.changes.last_seq() == 3
+
+
+def test_large_commit_logs_reset(store, monkeypatch):
+    monkeypatch.setattr(changes_mod, "MAX_EVENTS_PER_COMMIT", 2)
+    feed = store.change_feed()
+    store.add_entries([_make_entry() for _ in range(3)])
+    with pytest.raises(ChangeFeedGap):
+        feed.poll()
+
+
+def test_rotation_is_detected_as_gap(store, monkeypatch):
+    store.add_entry(_make_entry())
+    feed = store.change_feed(from_start=True)
+    assert [e["seq"] for e in feed.poll()] == [1]
+    monkeypatch.setattr(changes_mod, "MAX_LOG_BYTES", 1)
+    store.add_entry(_make_entry())  # rotates: the file now holds only seq 2
+    assert [e["seq"] for e in feed.poll()] == [2]
+    lagging = ChangeFeed(store.changes.path, from_start=True)
+    lagging.seq = 2
+    store.add_entry(_make_entry())
+    store.add_entry(_make_entry())  # rotates again, dropping seq 3
+    with pytest.raises(ChangeFeedGap):
+        lagging.poll()
+
+
+def test_partial_line_is_left_for_next_poll(tmp_path):
+    path = tmp_path / "log.changes"
+    ChangeLog(path).append([("add", {"id": "a"})])
+    feed = ChangeFeed(path)
+    with open(path, "a") as f:
+        f.write('{"seq": 2, "op": "add", "id": "b", ')
+    assert feed.poll() == []
+    with open(path, "a") as f:
+        f.write('"entry": {"id": "b"}}\n')
+    assert [e["id"] for e in feed.poll()] == ["b"]
@@ -1,3 +1,5 @@
+import json
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
@@ -55,7 +57,7 @@ def test_generate_command(mock_store):
     mock_store.add_entry.side_effect = lambda e: e
 
     runner = CliRunner()
-    with patch("social.cli.generate_content", return_value="AI generated tweet!"):
+    with patch("social.generator.generate_content", return_value="AI generated tweet!"):
         result = runner.invoke(
             cli,
             ["generate", "-p", "twitter", "-t", "Python tips"],
@@ -69,7 +71,7 @@ def test_generate_command(mock_store):
 @patch("social.cli.store")
 def test_generate_no_save(mock_store):
     runner = CliRunner()
-    with patch("social.cli.generate_content", return_value="Content"):
+    with patch("social.generator.generate_content", return_value="Content"):
         result = runner.invoke(
             cli,
             ["generate", "-p", "twitter", "-t", "test", "--no-save"],
@@ -133,3 +135,320 @@ def test_version():
     result = runner.invoke(cli, ["--version"])
     assert result.exit_code == 0
     assert "0.1.0" in result.output
+
+
+@patch("social.scheduler.schedule_drafts")
+@patch("social.cli.store")
+def test_schedule_auto(mock_store, mock_schedule):
+    from social.scheduler import ScheduleResult
+
+    mock_schedule.return_value = ScheduleResult(assignments={"abc": "2026-03-02"})
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["schedule", "auto", "--start", "2026-03-02", "--cap", "twitter=5"]
+    )
+    assert result.exit_code == 0
+    assert "Scheduled" in result.output
+    rules = mock_schedule.call_args.args[1]
+    assert rules.daily_caps[Platform.TWITTER] == 5
+
+
+@patch("social.cli.store")
+def test_schedule_auto_bad_cap(mock_store):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["schedule", "auto", "--cap", "myspace=1"])
+    assert result.exit_code != 0
+
+
+@patch("social.publisher.publish_due")
+@patch("social.cli.store")
+def test_publish_due_command(mock_store, mock_publish, tmp_path):
+    from social.publisher import PublishReport
+
+    mock_publish.return_value = PublishReport(published=["abc"])
+    runner = CliRunner()
+    result = runner.invoke(
+        cli, ["publish", "--due", "--out", str(tmp_path), "--concurrency", "twitter=8"]
+    )
+    assert result.exit_code == 0
+    assert "Published" in result.output
+    limits = mock_publish.call_args.kwargs["limits"]
+    assert limits[Platform.TWITTER].concurrency == 8
+
+
+def test_publish_requires_mode():
+    runner = CliRunner()
+    result = runner.invoke(cli, ["publish"])
+    assert result.exit_code != 0
+
+
+def _real_store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def test_calendar_ndjson_output(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "One", "a"))
+    store.add_entry(ContentEntry.new(Platform.LINKEDIN, "Two", "b"))
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["--format", "ndjson", "calendar"])
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert {r["content"] for r in records} == {"One", "Two"}
+
+
+def test_calendar_month_and_weeks(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "One", "a", scheduled_date="2026-03-02"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Two", "b", scheduled_date="2026-03-20"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Three", "c"))
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        month = runner.invoke(cli, ["--format", "ndjson", "calendar", "--month", "2026-03"])
+        weeks = runner.invoke(cli, ["--format", "ndjson", "calendar", "--weeks", "2", "--from", "2026-03-04"])
+        grid = runner.invoke(cli, ["calendar", "--weeks", "3", "--from", "2026-03-02"])
+        both = runner.invoke(cli, ["calendar", "--week", "--month"])
+    assert [json.loads(line)["content"] for line in month.output.splitlines()] == ["One", "Two"]
+    assert [json.loads(line)["content"] for line in weeks.output.splitlines()] == ["One"]
+    assert grid.exit_code == 0 and "2026-03-02 to 2026-03-22" in grid.output
+    assert both.exit_code == 2 and "only one of" in both.output
+
+
+def test_platforms_json_output():
+    result = CliRunner().invoke(cli, ["--format", "json", "platforms"])
+    assert result.exit_code == 0
+    assert len(json.loads(result.output)) == 3
+
+
+def test_calendar_add_from_stdin(tmp_path):
+    store = _real_store(tmp_path)
+    lines = "\n".join(
+        json.dumps({"platform": "twitter", "content": f"post {i}", "topic": "t"})
+        for i in range(3)
+    )
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["calendar", "add", "--stdin"], input=lines)
+    assert result.exit_code == 0
+    assert len(store.list_entries()) == 3
+
+
+def test_calendar_add_from_stdin_rejects_existing_ids(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "A", "t"))
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        listed = runner.invoke(cli, ["--format", "ndjson", "calendar"]).output
+        result = runner.invoke(cli, ["calendar", "add", "--stdin"], input=listed)
+    assert result.exit_code == 2
+    assert "already exists" in result.output
+    assert len(store.list_entries()) == 1
+
+
+def test_ndjson_pipeline_edit_and_delete(tmp_path):
+    store = _real_store(tmp_path)
+    a = store.add_entry(ContentEntry.new(Platform.TWITTER, "A", "t"))
+    b = store.add_entry(ContentEntry.new(Platform.TWITTER, "B", "t"))
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        listed = runner.invoke(cli, ["--format", "ndjson", "calendar"]).output
+        records = [dict(json.loads(l), status="scheduled") for l in listed.splitlines()]
+        result = runner.invoke(
+            cli, ["edit", "-"], input="\n".join(json.dumps(r) for r in records)
+        )
+        assert result.exit_code == 0
+        assert store.get_entry(a.id).status == ContentStatus.SCHEDULED
+
+        result = runner.invoke(cli, ["delete", "-", "--force"], input=json.dumps({"id": b.id}))
+    assert result.exit_code == 0
+    assert [e.id for e in store.list_entries()] == [a.id]
+
+
+def test_delete_stdin_requires_force(tmp_path):
+    with patch("social.cli.store", _real_store(tmp_path)):
+        result = CliRunner().invoke(cli, ["delete", "-"], input="")
+    assert result.exit_code != 0
+
+
+def test_import_command(tmp_path):
+    store = _real_store(tmp_path)
+    path = tmp_path / "rows.ndjson"
+    path.write_text(
+        json.dumps({"platform": "twitter", "content": "ok", "topic": "t"}) + "\n"
+        + json.dumps({"platform": "nope", "content": "bad", "topic": "t"}) + "\n"
+    )
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["import", str(path), "--workers", "1"])
+    assert result.exit_code == 0
+    assert "Imported" in result.output
+    assert "Rejected" in result.output
+    assert (tmp_path / "rows.ndjson.errors.ndjson").exists()
+
+
+def test_export_csv_to_stdout(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Hi", "exported"))
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["export", "-f", "csv"])
+    assert result.exit_code == 0
+    assert "exported" in result.output
+
+
+def test_export_to_file_machine_summary(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Hi", "exported"))
+    out = tmp_path / "out.csv"
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["--format", "json", "export", "--file-format", "csv", "-o", str(out)])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [{"count": 1, "output": str(out)}]
+    assert "exported" in out.read_text()
+
+
+def test_export_columnar_requires_output(tmp_path):
+    with patch("social.cli.store", _real_store(tmp_path)):
+        result = CliRunner().invoke(cli, ["export", "-f", "columnar"])
+    assert result.exit_code != 0
+
+
+def test_calendar_watch_stops_on_interrupt(tmp_path):
+    store = _real_store(tmp_path)
+    with patch("social.cli.store", store), \
+         patch("social.watch.watch_calendar", side_effect=KeyboardInterrupt) as watch:
+        result = CliRunner().invoke(cli, ["calendar", "--watch", "--interval", "0.5"])
+    assert result.exit_code == 0
+    assert watch.call_args.kwargs["interval"] == 0.5
+
+
+def test_history_list_show_and_rollback(tmp_path):
+    store = _real_store(tmp_path)
+    entry = store.add_entry(ContentEntry.new(Platform.TWITTER, "First take", "a"))
+    store.update_entry(entry.id, content="Second take")
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        listed = runner.invoke(cli, ["history", entry.id])
+        shown = runner.invoke(cli, ["history", entry.id, "--show", "1"])
+        rolled = runner.invoke(cli, ["history", entry.id, "--rollback", "1"])
+        records = runner.invoke(cli, ["--format", "ndjson", "history", entry.id])
+        missing = runner.invoke(cli, ["history", entry.id, "--show", "9"])
+    assert listed.exit_code == 0 and "Second take" in listed.output
+    assert shown.output.strip() == "First take"
+    assert "Restored" in rolled.output
+    assert [json.loads(l)["content"] for l in records.output.splitlines()] == [
+        "First take", "Second take", "First take",
+    ]
+    assert missing.exit_code == 1
+    assert store.get_entry(entry.id).content == "First take"
+
+
+def test_generate_check_duplicates_skips_api(tmp_path):
+    store = _real_store(tmp_path)
+    existing = store.add_entry(ContentEntry.new(Platform.TWITTER, "Already written", "AI trends 2026"))
+    with patch("social.cli.store", store), \
+         patch("social.generator.generate_content") as gen:
+        result = CliRunner().invoke(
+            cli, ["--format", "json", "generate", "-p", "twitter", "-t", "ai trends 2026", "--check-duplicates"]
+        )
+    assert result.exit_code == 0
+    assert json.loads(result.output)[0]["id"] == existing.id
+    gen.assert_not_called()
+
+
+def test_dedupe_reports_clusters(tmp_path):
+    store = _real_store(tmp_path)
+    text = "Our new feature ships today with faster sync and a cleaner editor for everyone"
+    a = store.add_entry(ContentEntry.new(Platform.TWITTER, text, "launch"))
+    b = store.add_entry(ContentEntry.new(Platform.TWITTER, text + "!", "launch"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Something unrelated", "other"))
+    with patch("social.cli.store", store):
+        table = CliRunner().invoke(cli, ["dedupe"])
+        records = CliRunner().invoke(cli, ["--format", "ndjson", "dedupe"])
+    assert table.exit_code == 0 and "1 near-duplicate cluster" in table.output
+    rows = [json.loads(l) for l in records.output.splitlines()]
+    assert {(r["cluster"], r["id"]) for r in rows} == {(1, a.id), (1, b.id)}
+
+
+def test_archive_and_include_archived(tmp_path):
+    store = _real_store(tmp_path)
+    old = store.add_entry(ContentEntry.new(
+        Platform.TWITTER, "Old news", "a", scheduled_date="2020-01-01", status=ContentStatus.PUBLISHED,
+    ))
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        archived = runner.invoke(cli, ["archive", "--older-than", "30"])
+        hot = runner.invoke(cli, ["--format", "ndjson", "calendar"])
+        full = runner.invoke(cli, ["--format", "ndjson", "calendar", "--include-archived"])
+        exported = runner.invoke(cli, ["export", "--include-archived"])
+        edit = runner.invoke(cli, ["edit", old.id, "-c", "new"])
+    assert "Archived 1" in archived.output
+    assert hot.output == ""
+    assert json.loads(full.output)["id"] == old.id
+    assert "Old news" in exported.output
+    assert edit.exit_code == 1
+
+
+def test_validate_reports_violations(tmp_path):
+    store = _real_store(tmp_path)
+    ok = store.add_entry(ContentEntry.new(Platform.TWITTER, "Fine #one", "a"))
+    bad = store.add_entry(ContentEntry.new(Platform.TWITTER, "Too many #a #b #c #d", "b"))
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["--format", "ndjson", "validate"])
+    assert result.exit_code == 1
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [(r["id"], r["rule"]) for r in records] == [(bad.id, "hashtags")]
+    assert ok.id not in result.output
+
+
+def test_validate_with_config_file(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.LINKEDIN, "We guarantee results", "a"))
+    config = tmp_path / "platforms.json"
+    config.write_text(json.dumps({"linkedin": {"banned_terms": ["guarantee"]}}))
+    with patch("social.cli.store", store):
+        clean = CliRunner().invoke(cli, ["validate"])
+        flagged = CliRunner().invoke(cli, ["validate", "--config", str(config)])
+    assert clean.exit_code == 0
+    assert "All posts pass" in clean.output
+    assert flagged.exit_code == 1
+    assert "banned" in flagged.output
+
+
+def test_models_command_lists_routes():
+    result = CliRunner().invoke(cli, ["--format", "json", "models"])
+    assert result.exit_code == 0
+    (report,) = json.loads(result.output)
+    tiers = {(r["platform"], r["task"]): r["tier"] for r in report["routes"]}
+    assert tiers[("twitter", "draft")] == "fast"
+    assert tiers[("linkedin", "draft")] == "quality"
+    assert "decisions" in report
+
+
+def test_hashtags_report(tmp_path):
+    store = _real_store(tmp_path)
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "A #ai #ml", "a", scheduled_date="2026-03-01"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "B #ai", "b", scheduled_date="2026-04-01"))
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["--format", "json", "hashtags", "--to", "2026-03-31"])
+        table = CliRunner().invoke(cli, ["hashtags"])
+    assert result.exit_code == 0
+    (report,) = json.loads(result.output)
+    assert report["frequency"] == [
+        {"tag": "#ai", "count": 1, "last_used": "2026-03-01"},
+        {"tag": "#ml", "count": 1, "last_used": "2026-03-01"},
+    ]
+    assert report["cooccurrence"] == [{"tags": ["#ai", "#ml"], "count": 1}]
+    assert table.exit_code == 0
+    assert "#ai" in table.output
+
+
+def test_generate_avoid_overused_passes_tags(tmp_path):
+    store = _real_store(tmp_path)
+    today = date.today().isoformat()
+    for _ in range(3):
+        store.add_entry(ContentEntry.new(Platform.TWITTER, "Post #ai", "a", scheduled_date=today))
+    with patch("social.cli.store", store), \
+            patch("social.generator.generate_content", return_value="New #fresh") as gen:
+        result = CliRunner().invoke(
+            cli, ["--format", "json", "generate", "-p", "twitter", "-t", "AI", "--avoid-overused"]
+        )
+    assert result.exit_code == 0
+    assert gen.call_args.kwargs["avoid_tags"] == ["#ai"]
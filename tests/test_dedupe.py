@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from social.dedupe import DuplicateIndex, estimate, minhash, shingles
+from social.models import ContentEntry, Platform
+from social.store import ContentStore
+
+
+POST = (
+    "Big news: our spring collection is live! Fresh colours, lighter fabrics "
+    "and a few surprises for long weekends outdoors. Tap the link to explore #spring"
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _add(store, content, topic="Spring launch", platform=Platform.INSTAGRAM):
+    return store.add_entry(ContentEntry.new(platform=platform, content=content, topic=topic))
+
+
+def test_signature_similarity_tracks_overlap():
+    a = minhash(shingles(POST))
+    assert estimate(a, minhash(shingles(POST))) == 1.0
+    near = minhash(shingles(POST.replace("Tap the link", "Tap our link")))
+    far = minhash(shingles("Quarterly earnings call moved to Thursday afternoon"))
+    assert estimate(a, near) > estimate(a, far)
+    assert estimate(a, far) < 0.2
+
+
+def test_similar_topics_respects_platform(store):
+    existing = _add(store, POST, topic="Spring collection launch")
+    _add(store, "Unrelated", topic="Hiring a data engineer")
+    index = DuplicateIndex(store)
+    matches = index.similar_topics("spring collection launch!", Platform.INSTAGRAM)
+    assert [m.entry.id for m in matches] == [existing.id]
+    assert matches[0].similarity == 1.0
+    assert index.similar_topics("Spring collection launch", Platform.TWITTER) == []
+    assert index.similar_topics("Autumn hiring push", Platform.INSTAGRAM) == []
+
+
+def test_similar_content(store):
+    existing = _add(store, POST)
+    index = DuplicateIndex(store)
+    assert [m.entry.id for m in index.similar_content(POST + " ", Platform.INSTAGRAM)] == [existing.id]
+    assert index.similar_content("Completely different words here today", Platform.INSTAGRAM) == []
+
+
+def test_clusters_group_near_duplicates(store):
+    a = _add(store, POST)
+    b = _add(store, POST.replace("#spring", "#spring #style"))
+    c = _add(store, POST + " Limited stock.")
+    _add(store, POST, platform=Platform.TWITTER)  # other platform: not clustered with these
+    _add(store, "Meet the team behind our new warehouse in Leeds", topic="Team")
+    clusters = DuplicateIndex(store).clusters(threshold=0.6)
+    assert len(clusters) == 1
+    assert {e.id for e in clusters[0]} == {a.id, b.id, c.id}
+
+
+def test_index_cache_is_reused_and_refreshed(store, mocker):
+    entry = _add(store, POST)
+    DuplicateIndex(store).refresh()
+    cached = json.loads(store.path.with_suffix(".simindex").read_text())["entries"]
+    assert list(cached) == [entry.id]
+
+    spy = mocker.patch("social.dedupe.minhash", wraps=__import__("social.dedupe", fromlist=["x"]).minhash)
+    index = DuplicateIndex(store)
+    index.refresh()
+    assert spy.call_count == 0  # signatures came from the sidecar
+
+    store.update_entry(entry.id, content="Something else entirely now", topic="Other")
+    index.refresh()
+    assert spy.call_count == 2
+    assert index.similar_topics("Spring launch", Platform.INSTAGRAM) == []
+    store.delete_entry(entry.id)
+    index.refresh()
+    assert json.loads(store.path.with_suffix(".simindex").read_text())["entries"] == {}
@@ -0,0 +1,99 @@
+import csv
+import io
+from datetime import date
+
+import pytest
+
+from social.exporter import (
+    export_columnar,
+    export_csv,
+    export_ics,
+    in_range,
+    read_columnar,
+)
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entries([
+        ContentEntry.new(Platform.TWITTER, "Draft, no date", "a"),
+        ContentEntry.new(
+            Platform.LINKEDIN, "Line one\nLine two; with, punctuation", "b",
+            scheduled_date="2026-03-01", status=ContentStatus.SCHEDULED,
+        ),
+        ContentEntry.new(
+            Platform.INSTAGRAM, "Published ✨", "c",
+            scheduled_date="2026-04-15", status=ContentStatus.PUBLISHED,
+        ),
+    ])
+    return store
+
+
+def test_iter_raw_streams_from_file(store):
+    fresh = ContentStore(path=store.path)  # no parsed cache
+    records = list(fresh.iter_raw(chunk_size=16))
+    assert [r["topic"] for r in records] == ["a", "b", "c"]
+
+
+def test_iter_raw_empty_store(tmp_path):
+    assert list(ContentStore(path=tmp_path / "content.json").iter_raw()) == []
+
+
+def test_in_range_filters_scheduled_dates(store):
+    records = list(in_range(store.iter_raw(), start=date(2026, 3, 1), end=date(2026, 3, 31)))
+    assert [r["topic"] for r in records] == ["b"]
+    assert len(list(in_range(store.iter_raw()))) == 3
+
+
+def test_export_csv(store):
+    buf = io.StringIO()
+    assert export_csv(store.iter_raw(), buf) == 3
+    rows = list(csv.DictReader(io.StringIO(buf.getvalue())))
+    assert rows[1]["content"] == "Line one\nLine two; with, punctuation"
+
+
+def test_export_ics_only_dated_non_drafts(store):
+    buf = io.StringIO()
+    assert export_ics(store.iter_raw(), buf) == 2
+    text = buf.getvalue()
+    assert text.startswith("BEGIN:VCALENDAR\r\n")
+    assert "DTSTART;VALUE=DATE:20260301" in text
+    assert "DTEND;VALUE=DATE:20260302" in text
+    assert r"Line one\nLine two\; with\, punctuation" in text
+    assert all(len(line.encode()) <= 75 for line in text.split("\r\n"))
+
+
+def test_export_ics_folds_long_lines():
+    record = ContentEntry.new(
+        Platform.TWITTER, "é" * 200, "t",
+        scheduled_date="2026-03-01", status=ContentStatus.SCHEDULED,
+    ).to_dict()
+    buf = io.StringIO()
+    export_ics([record], buf)
+    lines = buf.getvalue().split("\r\n")
+    assert all(len(line.encode()) <= 75 for line in lines)
+    unfolded = buf.getvalue().replace("\r\n ", "")
+    assert "é" * 200 in unfolded
+
+
+def test_columnar_round_trip(store, tmp_path):
+    path = tmp_path / "out.col"
+    with open(path, "wb") as f:
+        assert export_columnar(store.iter_raw(), f) == 3
+    columns = read_columnar(path)
+    assert columns["topic"] == ["a", "b", "c"]
+    assert columns["platform"] == ["twitter", "linkedin", "instagram"]
+    assert columns["scheduled_date"] == [None, "2026-03-01", "2026-04-15"]
+    assert columns["content"][2] == "Published ✨"
+
+
+def test_columnar_reads_selected_columns(store, tmp_path):
+    path = tmp_path / "out.col"
+    with open(path, "wb") as f:
+        export_columnar(store.iter_raw(), f)
+    assert list(read_columnar(path, ["status"])) == ["status"]
+    with pytest.raises(KeyError):
+        read_columnar(path, ["nope"])
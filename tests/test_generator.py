@@ -1,9 +1,14 @@
-from unittest.mock import MagicMock
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
 
+import anthropic
 import pytest
 
 from social.generator import (
     GenerationError,
+    agenerate_content,
+    aregenerate_content,
     build_prompt,
     generate_content,
     regenerate_content,
@@ -95,3 +100,119 @@ def test_regenerate_content_includes_feedback(mocker):
     user_msg = call_kwargs["messages"][0]["content"]
     assert "Make it funnier" in user_msg
     assert "Old tweet" in user_msg
+
+
+def _async_client(*responses, delay=0.0):
+    async def create(**kwargs):
+        await asyncio.sleep(delay)
+        return next(queue)
+
+    queue = iter(responses)
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=create)
+    return client
+
+
+def test_agenerate_content_retries_on_length():
+    client = _async_client(_mock_response("x" * 300), _mock_response("Short tweet!"))
+    result = asyncio.run(agenerate_content("Python tips", Platform.TWITTER, client=client))
+    assert result == "Short tweet!"
+    assert client.messages.create.call_count == 2
+
+
+def test_agenerate_content_maps_api_errors():
+    client = MagicMock()
+    client.messages.create = AsyncMock(side_effect=anthropic.APIConnectionError(request=MagicMock()))
+    with pytest.raises(GenerationError, match="API error"):
+        asyncio.run(agenerate_content("Python tips", Platform.TWITTER, client=client))
+
+
+def test_aregenerate_content_includes_feedback():
+    client = _async_client(_mock_response("Funnier"))
+    entry = ContentEntry.new(Platform.TWITTER, "Original", "Python")
+    result = asyncio.run(aregenerate_content(entry, "Make it funnier", client=client))
+    assert result == "Funnier"
+    prompt = client.messages.create.call_args.kwargs["messages"][0]["content"]
+    assert "Original" in prompt and "Make it funnier" in prompt
+
+
+def test_agenerate_content_runs_hundreds_concurrently(mocker):
+    client = MagicMock()
+
+    async def create(**kwargs):
+        await asyncio.sleep(0.05)
+        return _mock_response("ok")
+
+    client.messages.create = AsyncMock(side_effect=create)
+    factory = mocker.patch("social.generator.anthropic.AsyncAnthropic", return_value=client)
+
+    async def main():
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(agenerate_content(f"topic {i}", Platform.LINKEDIN) for i in range(300))
+        )
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(main())
+    assert results == ["ok"] * 300
+    assert elapsed < 2.0  # 300 sequential calls would take 15s
+    factory.assert_called_once()  # one shared client per event loop
+
+
+def test_generate_content_fails_over_on_overload(mocker, monkeypatch):
+    from social import generator
+    from social.routing import DEFAULT_MODEL, FAST_MODEL, Router
+
+    mocker.patch.object(generator, "router", Router())
+    monkeypatch.delenv("SOCIAL_MODEL", raising=False)
+    overloaded = anthropic.APIStatusError("Overloaded", response=MagicMock(status_code=529), body=None)
+    client = MagicMock()
+    client.messages.create.side_effect = [overloaded, _mock_response("From the fallback")]
+
+    assert generate_content("AI", Platform.LINKEDIN, client=client) == "From the fallback"
+    models = [c.kwargs["model"] for c in client.messages.create.call_args_list]
+    assert models == [DEFAULT_MODEL, FAST_MODEL]
+    decisions = generator.router.snapshot()["decisions"]
+    assert [(d["model"], d["reason"], d["outcome"]) for d in decisions] == [
+        (DEFAULT_MODEL, "primary", "overloaded"),
+        (FAST_MODEL, "failover", "ok"),
+    ]
+    # The next call starts on the fallback while the primary cools down
+    client.messages.create.side_effect = None
+    client.messages.create.return_value = _mock_response("again")
+    generate_content("AI", Platform.LINKEDIN, client=client)
+    assert client.messages.create.call_args.kwargs["model"] == FAST_MODEL
+
+
+def test_regenerate_and_shorten_use_their_routes(mocker):
+    from social import generator
+    from social.routing import Router
+
+    mocker.patch.object(generator, "router", Router())
+    client = MagicMock()
+    client.messages.create.side_effect = [_mock_response("x" * 3500), _mock_response("short")]
+    entry = ContentEntry.new(Platform.LINKEDIN, "Old", "AI")
+    assert regenerate_content(entry, "shorter", client=client) == "short"
+    tasks = [d["task"] for d in generator.router.snapshot()["decisions"]]
+    assert tasks == ["regenerate", "shorten"]
+
+
+def test_generate_content_does_not_fail_over_on_bad_request(mocker):
+    from social import generator
+    from social.routing import Router
+
+    mocker.patch.object(generator, "router", Router())
+    client = MagicMock()
+    client.messages.create.side_effect = anthropic.BadRequestError(
+        "bad", response=MagicMock(status_code=400), body=None
+    )
+    with pytest.raises(GenerationError, match="API error"):
+        generate_content("AI", Platform.TWITTER, client=client)
+    assert client.messages.create.call_count == 1
+
+
+def test_build_prompt_lists_tags_to_avoid():
+    config = get_platform_config(Platform.TWITTER)
+    prompt = build_prompt("AI", config, avoid_tags=["#ai", "ml"])
+    assert "Avoid these recently overused hashtags: #ai, #ml" in prompt
+    assert "overused" not in build_prompt("AI", config)
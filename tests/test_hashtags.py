@@ -0,0 +1,80 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from social.hashtags import HashtagIndex, extract_hashtags
+from social.models import ContentEntry, Platform
+from social.store import ContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _add(store, platform, content, day):
+    return store.add_entry(ContentEntry.new(platform, content, "t", scheduled_date=day))
+
+
+def test_extract_hashtags():
+    assert extract_hashtags("Ship it #AI #ai #Dev, see&#35; and a#b") == ["#ai", "#dev"]
+
+
+def test_report_rankings(store):
+    _add(store, Platform.TWITTER, "One #ai #ml", "2026-03-01")
+    _add(store, Platform.TWITTER, "Two #ai #ml", "2026-03-05")
+    _add(store, Platform.TWITTER, "Three #ai #launch", "2026-03-09")
+    _add(store, Platform.LINKEDIN, "Four\n\n#ml", "2026-03-10")
+    _add(store, Platform.TWITTER, "No tags", "2026-03-11")
+
+    report = HashtagIndex(store).report()
+    assert report.tagged_posts == 4
+    assert [(t.tag, t.count) for t in report.frequency] == [("#ai", 3), ("#ml", 3), ("#launch", 1)]
+    assert report.cooccurrence[0] == ("#ai", "#ml", 2)
+    assert [(t.tag, t.last_used) for t in report.recency] == [
+        ("#ml", "2026-03-10"), ("#ai", "2026-03-09"), ("#launch", "2026-03-09"),
+    ]
+
+    ranged = HashtagIndex(store).report(date(2026, 3, 4), date(2026, 3, 9), Platform.TWITTER)
+    assert {t.tag: t.count for t in ranged.frequency} == {"#ai": 2, "#ml": 1, "#launch": 1}
+
+
+def test_index_follows_change_log_without_rescanning(store):
+    first = _add(store, Platform.TWITTER, "Hello #one", "2026-03-01")
+    index = HashtagIndex(store)
+    assert index.tags(first.id) == ["#one"]
+    assert index.path.exists()
+
+    second = _add(store, Platform.TWITTER, "Hi #two", "2026-03-02")
+    store.update_entry(first.id, content="Hello #uno")
+    with patch.object(store, "iter_raw", side_effect=AssertionError("full scan")):
+        assert index.tags(second.id) == ["#two"]
+        assert index.tags(first.id) == ["#uno"]
+        store.delete_entry(second.id)
+        assert index.tags(second.id) == []
+        # A fresh index resumes from the sidecar's change-log position
+        assert HashtagIndex(store).tags(first.id) == ["#uno"]
+
+
+def test_index_rebuilds_after_change_feed_gap(store):
+    entry = _add(store, Platform.TWITTER, "Hello #one", "2026-03-01")
+    index = HashtagIndex(store)
+    index.refresh()
+    store.changes.path.unlink()  # e.g. the log was rotated away
+    store.update_entry(entry.id, content="Hello #two")
+    store.changes.append([("reset", {"id": None})])
+    store.update_entry(entry.id, content="Hello #three")
+    assert index.tags(entry.id) == ["#three"]
+
+
+def test_overused(store):
+    for day in ("2026-03-02", "2026-03-05", "2026-03-08"):
+        _add(store, Platform.TWITTER, "Post #ai #rare", day)
+    _add(store, Platform.TWITTER, "Post #ai", "2026-03-09")
+    _add(store, Platform.LINKEDIN, "Post\n\n#rare", "2026-03-09")
+    _add(store, Platform.TWITTER, "Old #old #old2", "2025-01-01")
+    index = HashtagIndex(store)
+    assert index.overused(Platform.TWITTER, as_of=date(2026, 3, 10)) == ["#ai", "#rare"]
+    assert index.overused(Platform.TWITTER, as_of=date(2026, 3, 10), min_count=4) == ["#ai"]
+    assert index.overused(Platform.LINKEDIN, as_of=date(2026, 3, 10)) == []
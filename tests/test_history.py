@@ -0,0 +1,114 @@
+import json
+import random
+
+import pytest
+
+from social import history as history_mod
+from social.history import RevisionLog, diff, patch
+from social.models import ContentEntry, Platform
+from social.store import ContentStore, EntryNotFoundError
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _make_entry(content="Hello world"):
+    return ContentEntry.new(platform=Platform.TWITTER, content=content, topic="test")
+
+
+@pytest.mark.parametrize("old,new", [
+    ("", "Fresh text"),
+    ("Some text", ""),
+    ("The quick brown fox", "The quick red fox jumps"),
+    ("line one\nline two\n", "line one\nline 2\n\nline three"),
+    ("Émojis 🚀 stay intact", "Émojis 🎉 stay intact!"),
+])
+def test_diff_patch_round_trip(old, new):
+    assert patch(old, diff(old, new)) == new
+
+
+def test_diff_patch_random_edits():
+    rng = random.Random(7)
+    words = ["alpha", "beta", "gamma", "delta", "#ai", "\n", "🚀"]
+    text = " ".join(rng.choice(words) for _ in range(60))
+    for _ in range(50):
+        tokens = text.split(" ")
+        i = rng.randrange(len(tokens))
+        tokens[i:i + rng.randrange(3)] = [rng.choice(words) for _ in range(rng.randrange(3))]
+        new = " ".join(tokens)
+        assert patch(text, diff(text, new)) == new
+        text = new
+
+
+def test_small_edit_is_small_delta():
+    old = "Launching our new product today. " * 10
+    new = old.replace("today", "tomorrow", 1)
+    assert diff(old, new) == [[26, 32, "tomorrow."]]
+
+
+def test_update_records_revisions(store):
+    entry = store.add_entry(_make_entry("v1"))
+    assert [r.content for r in store.revisions(entry.id)] == ["v1"]
+    store.update_entry(entry.id, content="v2")
+    store.update_entry(entry.id, status="scheduled")  # no content change
+    store.update_entries({entry.id: {"content": "v3"}})
+    revisions = store.revisions(entry.id[:4])
+    assert [(r.rev, r.content) for r in revisions] == [(1, "v1"), (2, "v2"), (3, "v3")]
+    assert revisions[0].at == entry.created_at
+
+
+def test_revert_is_a_new_revision(store):
+    entry = store.add_entry(_make_entry("original"))
+    store.update_entry(entry.id, content="rewritten")
+    restored = store.revert_entry(entry.id, 1)
+    assert restored.content == "original"
+    assert [r.content for r in store.revisions(entry.id)] == ["original", "rewritten", "original"]
+    assert store.get_entry(entry.id).content == "original"
+
+
+def test_revert_errors(store):
+    entry = store.add_entry(_make_entry())
+    assert store.revert_entry(entry.id, 1).content == "Hello world"
+    store.update_entry(entry.id, content="changed")
+    with pytest.raises(KeyError):
+        store.revert_entry(entry.id, 5)
+    with pytest.raises(EntryNotFoundError):
+        store.revisions("nope")
+
+
+def test_keyframes_bound_replay_and_get_matches(store, monkeypatch):
+    monkeypatch.setattr(history_mod, "KEYFRAME_INTERVAL", 5)
+    entry = store.add_entry(_make_entry("draft 0 of a longer post about product launches"))
+    for i in range(1, 12):
+        store.update_entry(entry.id, content=f"draft {i} of a longer post about product launches")
+    lines = [json.loads(l) for l in store.history.path.read_text().splitlines()]
+    assert [l["rev"] for l in lines if "text" in l] == [1, 6, 11]
+    fresh = RevisionLog(store.history.path)
+    for r in store.revisions(entry.id):
+        assert fresh.get(entry.id, r.rev).content == r.content
+
+
+def test_out_of_band_edit_is_resynced(store):
+    entry = store.add_entry(_make_entry("one"))
+    store.update_entry(entry.id, content="two")
+    raw = store._load()
+    raw[0]["content"] = "edited elsewhere"
+    store._save(raw)
+    store.update_entry(entry.id, content="three")
+    assert [r.content for r in store.revisions(entry.id)] == ["one", "two", "edited elsewhere", "three"]
+
+
+def test_many_revisions_stay_compact(store):
+    base = ("We're excited to share our latest release, packed with improvements "
+            "for teams of every size. Performance is up, setup is simpler, and the "
+            "new dashboard makes planning a breeze. ") * 4
+    entry = store.add_entry(_make_entry(base))
+    text = base
+    for i in range(50):
+        text = text.replace("latest", f"latest (v{i})", 1) if i % 2 else text + f" #{i}"
+        store.update_entry(entry.id, content=text)
+    full_copies = sum(len(json.dumps(r.content)) for r in store.revisions(entry.id))
+    assert store.history.path.stat().st_size < full_copies / 5
+    assert store.revisions(entry.id)[-1].content == text
@@ -0,0 +1,134 @@
+import csv
+import json
+from dataclasses import replace
+
+import pytest
+
+from social import platforms
+from social.importer import import_file, iter_rows, validate_row
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["platform", "content", "topic", "scheduled_date", "status"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_validate_row_accepts_valid_row():
+    entry, error = validate_row(
+        {"platform": "Twitter", "content": "Hi", "topic": "t", "scheduled_date": "2026-03-01", "status": "scheduled"}
+    )
+    assert error is None
+    assert entry["platform"] == "twitter"
+    assert entry["status"] == "scheduled"
+
+
+@pytest.mark.parametrize(
+    "row, message",
+    [
+        ({"platform": "myspace", "content": "x", "topic": "t"}, "unknown platform"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "status": "live"}, "unknown status"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "scheduled_date": "03/01/2026"}, "invalid scheduled_date"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "scheduled_date": "20261019"}, "invalid scheduled_date"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "scheduled_date": "2026-W42-1"}, "invalid scheduled_date"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "scheduled_date": "2026-02-30"}, "invalid scheduled_date"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "scheduled_date": "2026-03-01T25:00"}, "invalid scheduled_date"),
+        ({"platform": "twitter", "content": "x", "topic": "t", "scheduled_date": "2026-03-01T09:00:00"}, "invalid scheduled_date"),
+        ({"platform": "twitter", "content": "x" * 281, "topic": "t"}, "max 280"),
+        ({"platform": "twitter", "content": " ", "topic": "t"}, "content is empty"),
+        ({"platform": "twitter", "content": 5, "topic": "t"}, "content must be a string, got int"),
+    ],
+)
+def test_validate_row_rejects(row, message):
+    entry, error = validate_row(row)
+    assert entry is None
+    assert message in error
+
+
+def test_iter_rows_ndjson_reports_bad_lines(tmp_path):
+    path = tmp_path / "in.ndjson"
+    path.write_text('{"platform": "twitter"}\nnope\n')
+    rows = list(iter_rows(path))
+    assert rows[0] == {"platform": "twitter"}
+    assert "__error__" in rows[1]
+
+
+def test_import_csv_writes_store_once(store, tmp_path, mocker):
+    path = tmp_path / "in.csv"
+    _write_csv(path, [
+        {"platform": "twitter", "content": f"post {i}", "topic": "t", "scheduled_date": "", "status": ""}
+        for i in range(5)
+    ])
+    store.list_entries()  # creates the empty file
+    save = mocker.spy(store, "_save")
+    report = import_file(store, path, chunk_size=2, workers=1)
+    assert report.imported == 5
+    assert save.call_count == 1
+    assert len(store.list_entries()) == 5
+    assert all(e.status == ContentStatus.DRAFT for e in store.list_entries())
+
+
+def test_import_writes_error_file(store, tmp_path):
+    path = tmp_path / "in.ndjson"
+    path.write_text("\n".join([
+        json.dumps({"platform": "linkedin", "content": "ok", "topic": "t"}),
+        json.dumps({"platform": "twitter", "content": "x" * 300, "topic": "t"}),
+    ]))
+    errors = tmp_path / "errors.ndjson"
+    report = import_file(store, path, errors_path=errors, workers=1)
+    assert (report.imported, report.rejected) == (1, 1)
+    record = json.loads(errors.read_text().splitlines()[0])
+    assert record["row"] == 2
+    assert "max 280" in record["error"]
+    assert store.list_entries()[0].platform == Platform.LINKEDIN
+
+
+def test_import_rejects_bad_types_and_duplicate_ids(store, tmp_path):
+    stored = store.add_entry(ContentEntry.new(Platform.TWITTER, "old", "t"))
+    path = tmp_path / "in.ndjson"
+    path.write_text("\n".join(json.dumps(row) for row in [
+        {"platform": "twitter", "content": "first", "topic": "t", "id": "new1"},
+        {"platform": "twitter", "content": 5, "topic": "t"},
+        {"platform": "twitter", "content": "again", "topic": "t", "id": "new1"},
+        {"platform": "twitter", "content": "copy", "topic": "t", "id": stored.id},
+    ]))
+    errors = tmp_path / "errors.ndjson"
+    report = import_file(store, path, errors_path=errors, chunk_size=1, workers=1)
+    assert (report.imported, report.rejected) == (1, 3)
+    assert [json.loads(line)["row"] for line in errors.read_text().splitlines()] == [2, 3, 4]
+    assert sorted(e.id for e in store.list_entries()) == sorted([stored.id, "new1"])
+
+
+def test_import_with_process_pool(store, tmp_path):
+    path = tmp_path / "in.ndjson"
+    path.write_text("\n".join(
+        json.dumps({"platform": "twitter", "content": f"post {i}", "topic": "t"})
+        for i in range(500)
+    ))
+    report = import_file(store, path, chunk_size=50, workers=2)
+    assert report.imported == 500
+    assert len(store.list_entries()) == 500
+
+
+def test_import_workers_use_the_active_platform_config(store, tmp_path):
+    configs = dict(platforms.PLATFORMS)
+    configs[Platform.TWITTER] = replace(configs[Platform.TWITTER], max_length=10)
+    platforms.use_platforms(configs)
+    path = tmp_path / "in.ndjson"
+    path.write_text("\n".join(
+        json.dumps({"platform": "twitter", "content": "x" * (5 + 10 * (i % 2)), "topic": "t"})
+        for i in range(20)
+    ))
+    try:
+        report = import_file(store, path, chunk_size=5, workers=2)
+    finally:
+        platforms.use_platforms(None)
+    assert (report.imported, report.rejected) == (10, 10)
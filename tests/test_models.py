@@ -1,4 +1,6 @@
-from social.models import ContentEntry, ContentStatus, Platform
+import pytest
+
+from social.models import ContentEntry, ContentStatus, Platform, parse_platform
 
 
 def test_platform_values():
@@ -71,3 +73,27 @@ def test_to_dict_uses_string_values():
     assert data["platform"] == "twitter"
     assert data["status"] == "draft"
     assert isinstance(data["id"], str)
+
+
+def test_content_entry_is_slotted():
+    entry = ContentEntry.new(Platform.TWITTER, "test", "topic")
+    assert not hasattr(entry, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.extra = 1
+
+
+def test_from_dict_reuses_enum_members_and_rejects_unknown():
+    data = ContentEntry.new(Platform.LINKEDIN, "x", "t", status=ContentStatus.SCHEDULED).to_dict()
+    restored = ContentEntry.from_dict(data)
+    assert restored.platform is Platform.LINKEDIN
+    assert restored.status is ContentStatus.SCHEDULED
+    with pytest.raises(ValueError):
+        ContentEntry.from_dict({**data, "platform": "myspace"})
+    with pytest.raises(ValueError):
+        ContentEntry.from_dict({**data, "status": "archived?"})
+
+
+def test_parse_platform():
+    assert parse_platform("twitter") is Platform.TWITTER
+    with pytest.raises(ValueError):
+        parse_platform("myspace")
@@ -0,0 +1,56 @@
+import json
+from io import StringIO
+
+import pytest
+
+from social.models import ContentStatus, Platform
+from social.ndjson import entry_from_record, read_records, write_records
+
+
+def test_write_ndjson_one_record_per_line():
+    buf = StringIO()
+    count = write_records(iter([{"a": 1}, {"b": 2}]), "ndjson", buf)
+    assert count == 2
+    assert [json.loads(l) for l in buf.getvalue().splitlines()] == [{"a": 1}, {"b": 2}]
+
+
+def test_write_json_array():
+    buf = StringIO()
+    write_records([{"a": 1}, {"b": 2}], "json", buf)
+    assert json.loads(buf.getvalue()) == [{"a": 1}, {"b": 2}]
+
+
+def test_write_json_empty_array():
+    buf = StringIO()
+    write_records([], "json", buf)
+    assert json.loads(buf.getvalue()) == []
+
+
+def test_read_records_skips_blank_lines():
+    records = list(read_records(StringIO('{"id": "a"}\n\n{"id": "b"}\n')))
+    assert records == [{"id": "a"}, {"id": "b"}]
+
+
+def test_read_records_reports_line_number():
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_records(StringIO('{"id": "a"}\nnot json\n')))
+
+
+def test_entry_from_record_defaults():
+    entry = entry_from_record({"platform": "linkedin", "content": "Hi", "topic": "t"})
+    assert entry.platform == Platform.LINKEDIN
+    assert entry.status == ContentStatus.DRAFT
+    assert len(entry.id) == 8
+
+
+def test_entry_from_record_keeps_id():
+    entry = entry_from_record(
+        {"id": "abc12345", "platform": "twitter", "content": "Hi", "topic": "t", "status": "scheduled"}
+    )
+    assert entry.id == "abc12345"
+    assert entry.status == ContentStatus.SCHEDULED
+
+
+def test_entry_from_record_missing_fields():
+    with pytest.raises(ValueError, match="content"):
+        entry_from_record({"platform": "twitter", "topic": "t"})
@@ -1,7 +1,13 @@
+import json
+from unittest.mock import patch
+
 import pytest
+from click.testing import CliRunner
 
-from social.models import Platform
+from social.cli import cli
+from social.models import ContentEntry, Platform
 from social.platforms import PLATFORMS, get_platform_config, list_platforms
+from social.store import ContentStore
 
 
 def test_all_platforms_defined():
@@ -42,3 +48,73 @@ def test_platform_config_is_frozen():
     config = get_platform_config(Platform.TWITTER)
     with pytest.raises(AttributeError):
         config.max_length = 500
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    from social import platforms
+
+    monkeypatch.setattr(platforms, "_registry", None)
+    yield
+    platforms.use_platforms(None)
+
+
+def test_load_platforms_json_overrides(tmp_path):
+    from social.platforms import load_platforms
+
+    path = tmp_path / "platforms.json"
+    path.write_text(json.dumps({"twitter": {"max_hashtags": 1, "banned_terms": ["crypto"]}}))
+    configs = load_platforms(path)
+    assert configs[Platform.TWITTER].max_hashtags == 1
+    assert configs[Platform.TWITTER].banned_terms == ("crypto",)
+    assert configs[Platform.TWITTER].max_length == 280
+    assert configs[Platform.LINKEDIN] == PLATFORMS[Platform.LINKEDIN]
+
+
+def test_load_platforms_toml(tmp_path):
+    pytest.importorskip("tomllib")
+    from social.platforms import load_platforms
+
+    path = tmp_path / "platforms.toml"
+    path.write_text('[linkedin]\nmax_lines = 20\nhashtag_style = "none"\n')
+    config = load_platforms(path)[Platform.LINKEDIN]
+    assert config.max_lines == 20
+    assert config.hashtag_style == "none"
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"mastodon": {}}, "Unknown platform"),
+    ({"twitter": {"colour": "blue"}}, "Unknown platform setting"),
+    ({"twitter": {"max_length": "long"}}, "non-negative integer"),
+    ({"twitter": {"hashtag_style": "sideways"}}, "must be one of"),
+    ({"twitter": {"banned_terms": "crypto"}}, "list of non-empty strings"),
+])
+def test_load_platforms_rejects_bad_config(tmp_path, data, message):
+    from social.platforms import PlatformConfigError, load_platforms
+
+    path = tmp_path / "platforms.json"
+    path.write_text(json.dumps(data))
+    with pytest.raises(PlatformConfigError, match=message):
+        load_platforms(path)
+
+
+def test_registry_reads_env_config(tmp_path, monkeypatch, fresh_registry):
+    path = tmp_path / "platforms.json"
+    path.write_text(json.dumps({"instagram": {"max_length": 500}}))
+    monkeypatch.setenv("SOCIAL_PLATFORMS", str(path))
+    assert get_platform_config(Platform.INSTAGRAM).max_length == 500
+    assert len(list_platforms()) == 3
+
+
+@pytest.mark.parametrize("args", [["platforms"], ["validate"]])
+def test_cli_reports_broken_config_file(tmp_path, monkeypatch, fresh_registry, args):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Hi", "t"))
+    path = tmp_path / "platforms.json"
+    path.write_text("{not json")
+    monkeypatch.setenv("SOCIAL_PLATFORMS", str(path))
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 1
+    assert "Invalid platform config" in result.output
+    assert not isinstance(result.exception, ValueError)
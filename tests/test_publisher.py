@@ -0,0 +1,165 @@
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.publisher import (
+    FileAdapter,
+    HTTPAdapter,
+    PlatformAdapter,
+    PlatformLimits,
+    PublishError,
+    publish_due,
+    publish_loop,
+)
+from social.store import ContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _scheduled(day, **kwargs):
+    defaults = dict(
+        platform=Platform.TWITTER,
+        content="Hello",
+        topic="test",
+        scheduled_date=day,
+        status=ContentStatus.SCHEDULED,
+    )
+    defaults.update(kwargs)
+    return ContentEntry.new(**defaults)
+
+
+class RecordingAdapter(PlatformAdapter):
+    def __init__(self, fail_ids=()):
+        self.published = []
+        self.fail_ids = set(fail_ids)
+        self._lock = threading.Lock()
+
+    def publish(self, entry):
+        if entry.id in self.fail_ids:
+            raise PublishError("boom")
+        with self._lock:
+            self.published.append(entry.id)
+
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+def test_due_entries_uses_scheduled_date(store):
+    past = store.add_entry(_scheduled("2026-03-01"))
+    today = store.add_entry(_scheduled("2026-03-10"))
+    store.add_entry(_scheduled("2026-04-01"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "draft", "t", scheduled_date="2026-03-01"))
+    due = store.due_entries(NOW)
+    assert [e.id for e in due] == [past.id, today.id]
+
+
+def test_due_index_refreshes_after_write(store):
+    store.add_entry(_scheduled("2026-03-01"))
+    assert len(store.due_entries(NOW)) == 1
+    store.add_entry(_scheduled("2026-03-02"))
+    assert len(store.due_entries(NOW)) == 2
+
+
+def test_publish_due_marks_published(store):
+    a = store.add_entry(_scheduled("2026-03-01"))
+    b = store.add_entry(_scheduled("2026-03-02", platform=Platform.LINKEDIN))
+    future = store.add_entry(_scheduled("2026-05-01"))
+    adapter = RecordingAdapter()
+    report = publish_due(store, {p: adapter for p in Platform}, as_of=NOW)
+    assert sorted(report.published) == sorted([a.id, b.id])
+    assert store.get_entry(a.id).status == ContentStatus.PUBLISHED
+    assert store.get_entry(b.id).status == ContentStatus.PUBLISHED
+    assert store.get_entry(future.id).status == ContentStatus.SCHEDULED
+
+
+def test_publish_due_keeps_failures_scheduled(store):
+    ok = store.add_entry(_scheduled("2026-03-01"))
+    bad = store.add_entry(_scheduled("2026-03-01"))
+    adapter = RecordingAdapter(fail_ids=[bad.id])
+    report = publish_due(store, {Platform.TWITTER: adapter}, as_of=NOW)
+    assert report.published == [ok.id]
+    assert report.failed == {bad.id: "boom"}
+    assert store.get_entry(bad.id).status == ContentStatus.SCHEDULED
+
+
+def test_publish_due_missing_adapter(store):
+    entry = store.add_entry(_scheduled("2026-03-01", platform=Platform.INSTAGRAM))
+    report = publish_due(store, {Platform.TWITTER: RecordingAdapter()}, as_of=NOW)
+    assert entry.id in report.failed
+
+
+def test_publish_due_batches_writes(store, mocker):
+    entries = [_scheduled("2026-03-01") for _ in range(7)]
+    store._save([e.to_dict() for e in entries])
+    spy = mocker.spy(store, "update_entries")
+    limits = {Platform.TWITTER: PlatformLimits(concurrency=3)}
+    report = publish_due(
+        store, {Platform.TWITTER: RecordingAdapter()}, as_of=NOW, limits=limits, batch_size=3
+    )
+    assert len(report.published) == 7
+    assert spy.call_count == 3
+    assert all(e.status == ContentStatus.PUBLISHED for e in store.list_entries())
+
+
+def test_publish_due_keeps_batch_when_an_entry_is_deleted(store):
+    entries = store.add_entries([_scheduled("2026-03-01") for _ in range(4)])
+    victim = entries[1].id
+
+    class DeletingAdapter(RecordingAdapter):
+        def publish(self, entry):
+            super().publish(entry)
+            if entry.id == victim:  # e.g. `social delete` in another process
+                ContentStore(path=store.path).delete_entry(victim)
+
+    report = publish_due(store, {Platform.TWITTER: DeletingAdapter()}, as_of=NOW, batch_size=10)
+    assert list(report.failed) == [victim]
+    assert sorted(report.published) == sorted(e.id for e in entries if e.id != victim)
+    assert [e.status for e in store.list_entries()] == [ContentStatus.PUBLISHED] * 3
+
+
+def test_platform_adapter_is_abstract():
+    with pytest.raises(TypeError):
+        PlatformAdapter()
+
+
+def test_file_adapter_writes_ndjson(tmp_path):
+    adapter = FileAdapter(tmp_path / "out")
+    entry = _scheduled("2026-03-01")
+    adapter.publish(entry)
+    lines = (tmp_path / "out" / "twitter.ndjson").read_text().splitlines()
+    record = json.loads(lines[0])
+    assert record["id"] == entry.id
+    assert "published_at" in record
+
+
+def test_adapter_io_failures_raise_publish_error(store, tmp_path):
+    (tmp_path / "blocked").write_text("")  # a file where the directory should be
+    entry = store.add_entry(_scheduled("2026-03-01"))
+    with pytest.raises(PublishError, match="File publish failed"):
+        FileAdapter(tmp_path / "blocked").publish(entry)
+    with pytest.raises(PublishError, match="HTTP publish failed"):
+        HTTPAdapter("not a url").publish(entry)
+    report = publish_due(store, {Platform.TWITTER: FileAdapter(tmp_path / "blocked")}, as_of=NOW)
+    assert list(report.failed) == [entry.id]
+    assert store.get_entry(entry.id).status == ContentStatus.SCHEDULED
+
+
+def test_publish_loop_runs_iterations(store):
+    store.add_entry(_scheduled("2026-03-01"))
+    reports = []
+    publish_loop(
+        store,
+        {Platform.TWITTER: RecordingAdapter()},
+        interval=0,
+        on_report=reports.append,
+        max_iterations=2,
+    )
+    assert len(reports) == 2
+    assert len(reports[0].published) == 1
+    assert reports[1].published == []
@@ -0,0 +1,144 @@
+from unittest.mock import MagicMock
+
+import anthropic
+import pytest
+
+from social.models import Platform
+from social.routing import (
+    DEFAULT_MODEL,
+    DRAFT,
+    FAST_MODEL,
+    MIN_SAMPLES,
+    OVERLOAD_COOLDOWN,
+    PROBE_INTERVAL,
+    REGENERATE,
+    SHORTEN,
+    Router,
+    should_fail_over,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _status_error(status):
+    return anthropic.APIStatusError("boom", response=MagicMock(status_code=status), body=None)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def router(clock, monkeypatch):
+    monkeypatch.delenv("SOCIAL_MODEL", raising=False)
+    return Router(clock=clock)
+
+
+def test_routes_by_platform_and_task(router):
+    assert router.plan(Platform.TWITTER, DRAFT) == ("fast", [(FAST_MODEL, "primary"), (DEFAULT_MODEL, "failover")])
+    assert router.plan(Platform.LINKEDIN, DRAFT)[0] == "quality"
+    assert router.plan(Platform.LINKEDIN, REGENERATE)[0] == "quality"
+    assert router.plan(Platform.LINKEDIN, SHORTEN)[0] == "fast"
+
+
+def test_social_model_pins_primary(router, monkeypatch):
+    monkeypatch.setenv("SOCIAL_MODEL", "claude-custom")
+    _, attempts = router.plan(Platform.TWITTER, DRAFT)
+    assert [m for m, _ in attempts] == ["claude-custom", FAST_MODEL, DEFAULT_MODEL]
+
+
+def test_overload_sends_traffic_to_fallback_until_cooldown_ends(router, clock):
+    router.observe(Platform.LINKEDIN, DRAFT, "quality", DEFAULT_MODEL, "primary", 1.0, _status_error(529))
+    _, attempts = router.plan(Platform.LINKEDIN, DRAFT)
+    assert attempts[0] == (FAST_MODEL, "overloaded")
+    assert attempts[1] == (DEFAULT_MODEL, "failover")
+    clock.now += OVERLOAD_COOLDOWN + 1
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (DEFAULT_MODEL, "primary")
+
+
+def test_high_error_rate_demotes_primary(router):
+    for _ in range(MIN_SAMPLES):
+        router.observe(Platform.LINKEDIN, DRAFT, "quality", DEFAULT_MODEL, "primary", 1.0, _status_error(500))
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (FAST_MODEL, "errors")
+
+
+def test_demoted_primary_is_probed_and_recovers(router, clock):
+    for _ in range(MIN_SAMPLES):
+        router.observe(Platform.LINKEDIN, DRAFT, "quality", DEFAULT_MODEL, "primary", 1.0, _status_error(500))
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (FAST_MODEL, "errors")
+    clock.now += PROBE_INTERVAL
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (DEFAULT_MODEL, "probe")
+    # Only one probe per interval; a failed probe keeps the primary demoted
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (FAST_MODEL, "errors")
+    router.observe(Platform.LINKEDIN, DRAFT, "quality", DEFAULT_MODEL, "probe", 1.0, _status_error(500))
+    clock.now += PROBE_INTERVAL
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (DEFAULT_MODEL, "probe")
+    router.observe(Platform.LINKEDIN, DRAFT, "quality", DEFAULT_MODEL, "probe", 1.0)
+    assert router.plan(Platform.LINKEDIN, DRAFT)[1][0] == (DEFAULT_MODEL, "primary")
+
+
+def test_slow_primary_recovers_after_fast_probe(router, clock):
+    for _ in range(MIN_SAMPLES):
+        router.observe(Platform.TWITTER, DRAFT, "fast", FAST_MODEL, "primary", 9.0)
+    assert router.plan(Platform.TWITTER, DRAFT)[1][0] == (DEFAULT_MODEL, "slow")
+    clock.now += PROBE_INTERVAL
+    assert router.plan(Platform.TWITTER, DRAFT)[1][0] == (FAST_MODEL, "probe")
+    router.observe(Platform.TWITTER, DRAFT, "fast", FAST_MODEL, "probe", 0.5)
+    assert router.plan(Platform.TWITTER, DRAFT)[1][0] == (FAST_MODEL, "primary")
+
+
+def test_slow_primary_yields_to_faster_fallback(router):
+    for _ in range(MIN_SAMPLES):
+        router.observe(Platform.TWITTER, DRAFT, "fast", FAST_MODEL, "primary", 9.0)
+    assert router.plan(Platform.TWITTER, DRAFT)[1][0] == (DEFAULT_MODEL, "slow")
+    for _ in range(MIN_SAMPLES):
+        router.observe(Platform.TWITTER, DRAFT, "fast", DEFAULT_MODEL, "slow", 12.0)
+    # Both over budget: keep the configured order
+    assert router.plan(Platform.TWITTER, DRAFT)[1][0] == (FAST_MODEL, "primary")
+
+
+def test_attempts_fail_over_and_record_outcomes(router):
+    calls = []
+    for attempt in router.attempts(Platform.LINKEDIN, DRAFT):
+        with attempt:
+            calls.append(attempt.model)
+            if attempt.model == DEFAULT_MODEL:
+                raise _status_error(529)
+        if attempt.ok:
+            break
+    assert calls == [DEFAULT_MODEL, FAST_MODEL]
+    assert [d["outcome"] for d in router.snapshot()["decisions"]] == ["overloaded", "ok"]
+    # Errors that are the request's fault, and failures of the last model, propagate
+    with pytest.raises(anthropic.APIStatusError):
+        for attempt in router.attempts(Platform.TWITTER, DRAFT):
+            with attempt:
+                raise _status_error(400)
+    with pytest.raises(anthropic.APIStatusError):
+        for attempt in router.attempts(Platform.TWITTER, DRAFT):
+            with attempt:
+                raise _status_error(500)
+    assert len(router.snapshot()["decisions"]) == 4
+
+
+def test_snapshot_reports_stats_and_decisions(router):
+    router.observe(Platform.TWITTER, DRAFT, "fast", FAST_MODEL, "primary", 0.25)
+    router.observe(Platform.TWITTER, DRAFT, "fast", FAST_MODEL, "primary", 0.5, _status_error(529))
+    snapshot = router.snapshot()
+    assert snapshot["models"][FAST_MODEL]["calls"] == 2
+    assert snapshot["models"][FAST_MODEL]["error_rate"] == 0.5
+    assert snapshot["models"][FAST_MODEL]["cooling_down"] is True
+    assert [d["outcome"] for d in snapshot["decisions"]] == ["ok", "overloaded"]
+    assert snapshot["decisions"][0]["latency_ms"] == 250.0
+
+
+def test_should_fail_over():
+    assert should_fail_over(_status_error(529))
+    assert should_fail_over(anthropic.APIConnectionError(request=MagicMock()))
+    assert not should_fail_over(_status_error(400))
@@ -0,0 +1,122 @@
+import time
+from datetime import date
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.scheduler import ScheduleRules, allocate, schedule_drafts
+from social.store import ContentStore
+
+
+def _make_entry(**kwargs):
+    defaults = dict(platform=Platform.TWITTER, content="Hello", topic="test")
+    defaults.update(kwargs)
+    return ContentEntry.new(**defaults)
+
+
+START = date(2026, 3, 2)
+
+
+def test_allocate_respects_daily_cap():
+    drafts = [_make_entry(topic=f"t{i}") for i in range(5)]
+    rules = ScheduleRules(daily_caps={Platform.TWITTER: 2}, topic_spacing_days=0)
+    result = allocate(drafts, rules, START, horizon_days=10)
+    days = list(result.assignments.values())
+    assert days.count("2026-03-02") == 2
+    assert days.count("2026-03-03") == 2
+    assert days.count("2026-03-04") == 1
+
+
+def test_allocate_caps_are_per_platform():
+    drafts = [
+        _make_entry(platform=Platform.TWITTER, topic="a"),
+        _make_entry(platform=Platform.LINKEDIN, topic="b"),
+    ]
+    rules = ScheduleRules(
+        daily_caps={Platform.TWITTER: 1, Platform.LINKEDIN: 1}, topic_spacing_days=0
+    )
+    result = allocate(drafts, rules, START, horizon_days=10)
+    assert set(result.assignments.values()) == {"2026-03-02"}
+
+
+def test_allocate_topic_spacing():
+    drafts = [_make_entry(topic="Python"), _make_entry(topic="python ")]
+    rules = ScheduleRules(daily_caps={Platform.TWITTER: 5}, topic_spacing_days=3)
+    result = allocate(drafts, rules, START, horizon_days=10)
+    assert result.assignments[drafts[0].id] == "2026-03-02"
+    assert result.assignments[drafts[1].id] == "2026-03-05"
+
+
+def test_allocate_skips_blackout_dates():
+    drafts = [_make_entry(topic="a")]
+    rules = ScheduleRules(
+        daily_caps={Platform.TWITTER: 1},
+        blackout_dates=frozenset({date(2026, 3, 2), date(2026, 3, 3)}),
+    )
+    result = allocate(drafts, rules, START, horizon_days=10)
+    assert result.assignments[drafts[0].id] == "2026-03-04"
+
+
+def test_allocate_counts_existing_scheduled_entries():
+    existing = _make_entry(
+        topic="a", scheduled_date="2026-03-02", status=ContentStatus.SCHEDULED
+    )
+    drafts = [_make_entry(topic="a")]
+    rules = ScheduleRules(daily_caps={Platform.TWITTER: 1}, topic_spacing_days=2)
+    result = allocate(drafts, rules, START, horizon_days=10, scheduled=[existing])
+    assert result.assignments[drafts[0].id] == "2026-03-04"
+
+
+def test_allocate_reports_unplaced():
+    drafts = [_make_entry(topic=f"t{i}") for i in range(3)]
+    rules = ScheduleRules(daily_caps={Platform.TWITTER: 1}, topic_spacing_days=0)
+    result = allocate(drafts, rules, START, horizon_days=2)
+    assert len(result.assignments) == 2
+    assert result.unplaced == [drafts[2].id]
+
+
+def test_allocate_large_backlog_is_fast():
+    drafts = []
+    for i in range(50_000):
+        entry = _make_entry(platform=list(Platform)[i % 3], topic=f"topic {i % 500}")
+        entry.id = f"{i:08x}"  # random 8-char IDs can collide at this scale
+        drafts.append(entry)
+    rules = ScheduleRules(
+        daily_caps={Platform.TWITTER: 60, Platform.INSTAGRAM: 50, Platform.LINKEDIN: 50},
+        topic_spacing_days=1,
+    )
+    timings = []
+    for _ in range(3):
+        t0 = time.perf_counter()
+        result = allocate(drafts, rules, START, horizon_days=365)
+        timings.append(time.perf_counter() - t0)
+    assert min(timings) < 1.0
+    assert len(result.assignments) + len(result.unplaced) == 50_000
+
+
+def test_schedule_drafts_updates_store(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    draft = store.add_entry(_make_entry(topic="a"))
+    store.add_entry(_make_entry(topic="b", status=ContentStatus.PUBLISHED))
+    result = schedule_drafts(store, ScheduleRules(), start=START)
+    assert result.assignments == {draft.id: "2026-03-02"}
+    fetched = store.get_entry(draft.id)
+    assert fetched.status == ContentStatus.SCHEDULED
+    assert fetched.scheduled_date == "2026-03-02"
+
+
+def test_schedule_drafts_counts_timed_and_dated_entries(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entry(_make_entry(topic="a", scheduled_date="2026-03-02T09:00", status=ContentStatus.SCHEDULED))
+    store.add_entry(_make_entry(topic="b", scheduled_date="2026-03-03"))  # a dated draft
+    store.add_entry(_make_entry(topic="c", scheduled_date="not a date", status=ContentStatus.SCHEDULED))
+    draft = store.add_entry(_make_entry(topic="d"))
+    rules = ScheduleRules(daily_caps={Platform.TWITTER: 1})
+    result = schedule_drafts(store, rules, start=START)
+    assert result.assignments == {draft.id: "2026-03-04"}
+
+
+def test_schedule_drafts_dry_run(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    draft = store.add_entry(_make_entry())
+    result = schedule_drafts(store, ScheduleRules(), start=START, dry_run=True)
+    assert draft.id in result.assignments
+    assert store.get_entry(draft.id).status == ContentStatus.DRAFT
@@ -0,0 +1,102 @@
+import gzip
+import json
+
+import pytest
+
+from social import schema
+from social.models import ContentEntry, Platform
+from social.schema import SchemaError
+from social.store import ContentStore
+
+
+def _records(n):
+    return [
+        ContentEntry.new(Platform.TWITTER, f"Post {i} 🚀 with \"quotes\"", f"topic {i}").to_dict()
+        for i in range(n)
+    ]
+
+
+def _write_v1(path, records):
+    path.write_text(json.dumps({"version": 1, "entries": records}, indent=2))
+
+
+def test_v2_layout_is_compact_one_entry_per_line(tmp_path):
+    path = tmp_path / "content.json"
+    records = _records(3)
+    schema.write_file(path, records)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == '{"version":2,"entries":['
+    assert [json.loads(l.rstrip(",")) for l in lines[1:-1]] == records
+    assert json.loads(path.read_text(encoding="utf-8")) == {"version": 2, "entries": records}
+    legacy = tmp_path / "legacy.json"
+    _write_v1(legacy, records)
+    assert path.stat().st_size < legacy.stat().st_size * 0.8
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_load_and_stream_round_trip(tmp_path, compress):
+    path = tmp_path / "content.json"
+    records = _records(50)
+    schema.write_file(path, records, compress=compress)
+    assert (path.read_bytes()[:2] == b"\x1f\x8b") is compress
+    assert schema.load(path) == (2, records)
+    assert list(schema.iter_records(path, chunk_size=17)) == records
+
+
+def test_empty_file_round_trip(tmp_path):
+    path = tmp_path / "content.json"
+    schema.write_file(path, [])
+    assert schema.load(path) == (2, [])
+    assert list(schema.iter_records(path)) == []
+
+
+def test_v1_store_upgrades_on_first_write(tmp_path):
+    path = tmp_path / "content.json"
+    records = _records(3)
+    _write_v1(path, records)
+    store = ContentStore(path=path)
+    assert [e["id"] for e in store.iter_raw(chunk_size=64)] == [r["id"] for r in records]
+    assert len(store.list_entries()) == 3
+    assert json.loads(path.read_text())["version"] == 1  # reads never rewrite
+
+    store.update_entry(records[0]["id"], topic="changed")
+    assert schema.load(path)[0] == 2
+    assert ContentStore(path=path).get_entry(records[0]["id"]).topic == "changed"
+
+
+def test_migrations_run_in_order_while_streaming(tmp_path, monkeypatch):
+    monkeypatch.setattr(schema, "CURRENT_VERSION", 3)
+    monkeypatch.setitem(schema._MIGRATIONS, 2, lambda r: {**r, "topic": r["topic"].upper()})
+    path = tmp_path / "content.json"
+    _write_v1(path, _records(2))
+    assert [r["topic"] for r in schema.iter_records(path)] == ["TOPIC 0", "TOPIC 1"]
+    assert [r["topic"] for r in schema.load(path)[1]] == ["TOPIC 0", "TOPIC 1"]
+
+
+def test_newer_or_unknown_versions_are_refused(tmp_path):
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps({"version": 99, "entries": []}))
+    with pytest.raises(SchemaError, match="newer"):
+        ContentStore(path=path).list_entries()
+    with pytest.raises(SchemaError):
+        list(schema.iter_records(path))
+    path.write_text(json.dumps({"version": 0, "entries": []}))
+    with pytest.raises(SchemaError, match="No migration path"):
+        schema.load(path)
+
+
+def test_gz_store_path_writes_compressed(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json.gz")
+    entry = store.add_entry(ContentEntry.new(Platform.LINKEDIN, "Hello", "t"))
+    with gzip.open(store.path, "rt", encoding="utf-8") as f:
+        assert json.load(f)["entries"][0]["id"] == entry.id
+    assert ContentStore(path=store.path).get_entry(entry.id).content == "Hello"
+
+
+def test_atomic_write_json_keeps_old_file_on_failure(tmp_path):
+    path = tmp_path / "sub" / "cache.json"
+    schema.atomic_write_json(path, {"version": 1})
+    with pytest.raises(TypeError):
+        schema.atomic_write_json(path, {"version": 2, "bad": object()})
+    assert json.loads(path.read_text()) == {"version": 1}
+    assert [p.name for p in path.parent.iterdir()] == ["cache.json"]
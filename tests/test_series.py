@@ -0,0 +1,168 @@
+import asyncio
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from social.cli import cli
+from social.generator import GenerationError
+from social.models import ContentEntry, ContentStatus, Platform
+from social.series import Recurrence, Series, SeriesBook, SeriesError, agenerate_due
+from social.store import ContentStore, EntryNotFoundError
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+@pytest.fixture
+def book(store):
+    return SeriesBook(store)
+
+
+def _tips(**kwargs):
+    rule = Recurrence("weekly", date(2026, 3, 3), until=date(2027, 3, 2))
+    return Series.new(Platform.TWITTER, "Tip Tuesday", rule, **kwargs)
+
+
+def test_weekly_rule_expands_only_the_requested_range():
+    rule = Recurrence("weekly", date(2026, 3, 4), interval=2, weekdays=(0, 2, 4))
+    assert list(rule.between(date(2026, 3, 1), date(2026, 3, 22))) == [
+        date(2026, 3, 4), date(2026, 3, 6), date(2026, 3, 16), date(2026, 3, 18), date(2026, 3, 20),
+    ]
+    # Far-off ranges are computed directly rather than walked to
+    assert next(rule.between(date(2126, 1, 1), date(2126, 1, 31))).year == 2126
+
+
+def test_monthly_and_count_rules():
+    rule = Recurrence("monthly", date(2026, 1, 31), count=3)
+    assert list(rule.between(date(2026, 1, 1), date(2026, 12, 31))) == [
+        date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31),
+    ]
+    assert list(Recurrence("daily", date(2026, 3, 1), interval=3).between(date(2026, 3, 2), date(2026, 3, 8))) == [
+        date(2026, 3, 4), date(2026, 3, 7),
+    ]
+    with pytest.raises(SeriesError):
+        Recurrence("daily", date(2026, 3, 1), weekdays=(1,))
+
+
+def test_series_round_trips_through_sidecar(book):
+    series = book.add(_tips(time="09:00"))
+    fresh = SeriesBook(book.store)
+    assert fresh.get(series.id[:4]) == series
+    assert book.path.name == "content.series"
+    assert book.store.list_entries() == []  # nothing stored per occurrence
+
+
+def test_scheduled_between_merges_placeholders(book, store):
+    series = book.add(_tips(time="09:00"))
+    entries = book.scheduled_between(date(2026, 3, 1), date(2026, 3, 15))
+    assert [e.id for e in entries] == [f"{series.id}@20260303", f"{series.id}@20260310"]
+    assert entries[0].scheduled_date == "2026-03-03T09:00"
+    assert entries[0].status is ContentStatus.DRAFT
+    assert book.scheduled_between(date(2026, 3, 1), date(2026, 3, 15), platform=Platform.LINKEDIN) == []
+
+
+def test_materialize_and_skip(book, store):
+    series = book.add(_tips())
+    entry = book.materialize(f"{series.id}@20260310", content="Edited")
+    book.skip(series.id, date(2026, 3, 17))
+    assert store.get_entry(entry.id).status is ContentStatus.SCHEDULED
+    ids = [e.id for e in book.scheduled_between(date(2026, 3, 9), date(2026, 3, 24))]
+    assert ids == [entry.id, f"{series.id}@20260324"]
+    with pytest.raises(EntryNotFoundError):
+        book.materialize(f"{series.id}@20260310")  # already stored
+    with pytest.raises(EntryNotFoundError):
+        book.materialize(f"{series.id}@20260311")  # not an occurrence
+    with pytest.raises(SeriesError):
+        book.skip(series.id, date(2026, 3, 18))
+
+
+def test_generate_due_creates_posts_within_lead_time(book, store):
+    fixed = book.add(_tips(content="Tip of the week", lead_days=7))
+    daily = Recurrence("daily", date(2026, 3, 1))
+    book.add(Series.new(Platform.LINKEDIN, "Daily note", daily, lead_days=1))
+    broken = book.add(Series.new(Platform.LINKEDIN, "Broken", daily, lead_days=0))
+
+    async def fake_generate(topic, platform, client=None):
+        if topic == "Broken":
+            raise GenerationError("overloaded")
+        return f"About {topic}"
+
+    with patch("social.generator.agenerate_content", fake_generate):
+        report = asyncio.run(agenerate_due(book, as_of=date(2026, 3, 9)))
+        again = asyncio.run(agenerate_due(book, as_of=date(2026, 3, 9)))
+    assert sorted((e.scheduled_date, e.content) for e in report.created) == [
+        ("2026-03-09", "About Daily note"),
+        ("2026-03-10", "About Daily note"),
+        ("2026-03-10", "Tip of the week"),
+    ]
+    assert report.failed == {f"{broken.id}@20260309": "overloaded"}
+    assert len(store.list_entries(status=ContentStatus.SCHEDULED)) == 3
+    assert book.get(fixed.id).occurrences["2026-03-10"] in {e.id for e in report.created}
+    # Stored occurrences are not generated twice; the failed one is retried
+    assert again.created == [] and list(again.failed) == [f"{broken.id}@20260309"]
+
+
+def test_cli_series_add_show_and_edit_occurrence(store):
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        added = runner.invoke(cli, [
+            "--format", "ndjson", "series", "add", "-p", "twitter", "-t", "Tip Tuesday",
+            "--every", "week", "--on", "tue", "--start", "2026-03-03", "--count", "10",
+        ])
+        series_id = json.loads(added.output)["id"]
+        edited = runner.invoke(cli, ["--format", "ndjson", "edit", f"{series_id}@20260310", "-c", "Hi"])
+        shown = runner.invoke(cli, [
+            "--format", "ndjson", "series", "show", series_id, "--from", "2026-03-01", "--to", "2026-03-17",
+        ])
+        month = runner.invoke(cli, ["--format", "ndjson", "calendar", "--month", "2026-03"])
+    assert added.exit_code == 0 and edited.exit_code == 0
+    entry_id = json.loads(edited.output)["id"]
+    assert [(r["state"], r["entry"]) for r in map(json.loads, shown.output.splitlines())] == [
+        ("planned", None), ("stored", entry_id), ("planned", None),
+    ]
+    assert [json.loads(line)["id"] for line in month.output.splitlines()] == [
+        f"{series_id}@20260303", entry_id, f"{series_id}@20260317",
+        f"{series_id}@20260324", f"{series_id}@20260331",
+    ]
+
+
+def test_cli_series_skip_and_delete_machine_output(store, book):
+    series = book.add(_tips())
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        skipped = runner.invoke(cli, ["--format", "ndjson", "series", "skip", series.id, "2026-03-10"])
+        deleted = runner.invoke(cli, ["--format", "json", "series", "delete", series.id, "--force"])
+    assert json.loads(skipped.output) == {"series": series.id, "skipped": "2026-03-10"}
+    assert json.loads(deleted.output)[0]["id"] == series.id
+    assert book.list() == []
+
+
+def test_timed_occurrences_work_with_schedule_export_and_import(store, book, tmp_path):
+    series = book.add(_tips(time="09:00"))
+    entry = book.materialize(f"{series.id}@20260310", content="Tip")
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Draft", "other"))
+    runner = CliRunner()
+    with patch("social.cli.store", store):
+        scheduled = runner.invoke(cli, ["schedule", "auto", "--start", "2026-03-09"])
+        exported = runner.invoke(cli, ["export", "-f", "csv", "-o", str(tmp_path / "out.csv")])
+    assert scheduled.exit_code == 0 and exported.exit_code == 0
+    copy = ContentStore(path=tmp_path / "copy.json")
+    with patch("social.cli.store", copy):
+        imported = runner.invoke(cli, ["--format", "ndjson", "import", str(tmp_path / "out.csv"), "--workers", "1"])
+    assert json.loads(imported.output) == {"imported": 2, "rejected": 0}
+    assert copy.get_entry(entry.id).scheduled_date == "2026-03-10T09:00"
+
+
+def test_cli_delete_planned_occurrence_skips_it(store, book):
+    series = book.add(_tips())
+    with patch("social.cli.store", store):
+        result = CliRunner().invoke(cli, ["delete", f"{series.id}@20260310", "--force"])
+    assert result.exit_code == 0
+    assert book.get(series.id).skipped == ["2026-03-10"]
+    ids = [e.id for e in book.scheduled_between(date(2026, 3, 9), date(2026, 3, 17))]
+    assert ids == [f"{series.id}@20260317"]
@@ -0,0 +1,227 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from social.generator import GenerationError
+from social.models import ContentEntry, ContentStatus, Platform
+from social.server import SocialServer
+from social.store import ContentStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+async def _request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + data
+    )
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(payload)
+
+
+def _run(store, scenario):
+    async def main():
+        server = SocialServer(store, port=0, max_workers=4)
+        await server.start()
+        try:
+            return await scenario(server.port, server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_crud_round_trip_persists(store):
+    async def scenario(port, server):
+        status, created = await _request(
+            port, "POST", "/entries", {"platform": "twitter", "content": "Hi", "topic": "t"}
+        )
+        assert status == 201
+        status, fetched = await _request(port, "GET", f"/entries/{created['id'][:4]}")
+        assert (status, fetched["content"]) == (200, "Hi")
+        status, updated = await _request(
+            port, "PATCH", f"/entries/{created['id']}", {"status": "scheduled", "scheduled_date": "2026-03-01"}
+        )
+        assert updated["status"] == "scheduled"
+        return created["id"]
+
+    entry_id = _run(store, scenario)
+    reloaded = ContentStore(path=store.path).get_entry(entry_id)
+    assert reloaded.status == ContentStatus.SCHEDULED
+
+
+def test_writes_keep_entries_added_by_other_processes(store):
+    async def scenario(port, server):
+        status, first = await _request(
+            port, "POST", "/entries", {"platform": "twitter", "content": "Served", "topic": "t"}
+        )
+        # e.g. `social calendar add` while the server is running
+        outside = ContentStore(path=store.path).add_entry(
+            ContentEntry.new(Platform.LINKEDIN, "From the CLI", "cli")
+        )
+        status, second = await _request(
+            port, "POST", "/entries", {"platform": "twitter", "content": "Served again", "topic": "t"}
+        )
+        assert status == 201
+        status, listed = await _request(port, "GET", "/entries")
+        assert outside.id in {e["id"] for e in listed}
+        return {first["id"], second["id"], outside.id}
+
+    ids = _run(store, scenario)
+    assert {e.id for e in ContentStore(path=store.path).list_entries()} == ids
+
+
+def test_patch_content_records_revision(store):
+    entry = store.add_entry(ContentEntry.new(Platform.TWITTER, "First draft", "t"))
+
+    async def scenario(port, server):
+        await _request(port, "PATCH", f"/entries/{entry.id}", {"content": "Second draft"})
+        await _request(port, "PATCH", f"/entries/{entry.id}", {"status": "scheduled"})
+
+    _run(store, scenario)
+    assert [r.content for r in store.revisions(entry.id)] == ["First draft", "Second draft"]
+
+
+def test_list_filters_and_delete(store):
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "a", "t"))
+    keep = store.add_entry(ContentEntry.new(Platform.LINKEDIN, "b", "t"))
+
+    async def scenario(port, server):
+        status, entries = await _request(port, "GET", "/entries?platform=linkedin")
+        assert [e["id"] for e in entries] == [keep.id]
+        status, _ = await _request(port, "DELETE", f"/entries/{keep.id}")
+        assert status == 200
+        status, _ = await _request(port, "GET", f"/entries/{keep.id}")
+        assert status == 404
+
+    _run(store, scenario)
+    assert len(ContentStore(path=store.path).list_entries()) == 1
+
+
+def test_calendar_range(store):
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "in", "t", scheduled_date="2026-03-05"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "out", "t", scheduled_date="2026-04-05"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "none", "t"))
+
+    async def scenario(port, server):
+        return await _request(port, "GET", "/calendar?from=2026-03-01&to=2026-03-31")
+
+    status, entries = _run(store, scenario)
+    assert [e["content"] for e in entries] == ["in"]
+
+
+def test_bad_requests(store):
+    async def scenario(port, server):
+        results = [
+            await _request(port, "POST", "/entries", {"platform": "myspace", "content": "x", "topic": "t"}),
+            await _request(port, "GET", "/calendar?from=yesterday"),
+            await _request(port, "GET", "/nope"),
+            await _request(port, "PUT", "/entries"),
+        ]
+        return [status for status, _ in results]
+
+    assert _run(store, scenario) == [400, 400, 404, 405]
+
+
+def test_post_with_existing_id_conflicts(store):
+    existing = store.add_entry(ContentEntry.new(Platform.TWITTER, "Original", "t"))
+
+    async def scenario(port, server):
+        return await _request(
+            port, "POST", "/entries",
+            {"id": existing.id, "platform": "twitter", "content": "Replacement", "topic": "t"},
+        )
+
+    status, payload = _run(store, scenario)
+    assert status == 409 and "already exists" in payload["error"]
+    assert ContentStore(path=store.path).get_entry(existing.id).content == "Original"
+
+
+@pytest.mark.parametrize("length", ["abc", "-5", "1_0", "\u00b2"])
+def test_bad_content_length_is_rejected(store, length):
+    async def scenario(port, server):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"POST /entries HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}".encode())
+        await writer.drain()
+        raw = await reader.read()  # returns once the server closes the connection
+        writer.close()
+        return raw
+
+    raw = _run(store, scenario)
+    assert raw.startswith(b"HTTP/1.1 400 ")
+    assert b"Connection: close" in raw and b"Invalid Content-Length" in raw
+
+
+def test_concurrent_writes_are_all_persisted(store):
+    async def scenario(port, server):
+        await asyncio.gather(*[
+            _request(port, "POST", "/entries", {"platform": "twitter", "content": str(i), "topic": "t"})
+            for i in range(30)
+        ])
+
+    _run(store, scenario)
+    assert len(ContentStore(path=store.path).list_entries()) == 30
+
+
+def test_generate_batches_and_dedupes(store):
+    calls = []
+
+    def fake_generate(topic, platform, extra="", client=None):
+        calls.append(topic)
+        return f"Post about {topic}"
+
+    async def scenario(port, server):
+        server.batcher.window = 0.05
+        return await asyncio.gather(
+            _request(port, "POST", "/generate", {"topic": "a", "platform": "twitter"}),
+            _request(port, "POST", "/generate", {"topic": "a", "platform": "twitter", "save": False}),
+            _request(port, "POST", "/generate", {"topic": "b", "platform": "twitter"}),
+        ), server.batcher.batches
+
+    with patch("social.generator.generate_content", side_effect=fake_generate), patch(
+        "anthropic.Anthropic"
+    ):
+        responses, batches = _run(store, scenario)
+    assert sorted(calls) == ["a", "b"]
+    assert batches == 1
+    assert [status for status, _ in responses] == [201, 200, 201]
+    assert len(ContentStore(path=store.path).list_entries()) == 2
+
+
+def test_generate_error_maps_to_502(store):
+    async def scenario(port, server):
+        return await _request(port, "POST", "/generate", {"topic": "a", "platform": "twitter"})
+
+    with patch("social.generator.generate_content", side_effect=GenerationError("down")), patch(
+        "anthropic.Anthropic"
+    ):
+        status, payload = _run(store, scenario)
+    assert status == 502
+    assert payload["error"] == "down"
+
+
+def test_models_endpoint_reports_routing(store):
+    from social.routing import FAST_MODEL, Router
+
+    router = Router()
+    router.observe(Platform.TWITTER, "draft", "fast", FAST_MODEL, "primary", 0.2)
+
+    async def scenario(port, server):
+        return await _request(port, "GET", "/models")
+
+    with patch("social.generator.router", router):
+        status, body = _run(store, scenario)
+    assert status == 200
+    assert body["models"][FAST_MODEL]["calls"] == 1
+    assert body["decisions"][0]["model"] == FAST_MODEL
@@ -0,0 +1,83 @@
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from social import cli as cli_module
+from social import workspaces
+from social.models import ContentEntry, Platform
+from social.shell import SocialShell
+from social.store import ContentStore
+
+
+@pytest.fixture
+def shell(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli_module, "store", None)
+    monkeypatch.setattr(cli_module, "client", None)
+    store = ContentStore(path=tmp_path / "content.json")
+    return SocialShell(store=store, stdout=StringIO())
+
+
+def test_shell_shares_store_with_cli(shell):
+    assert cli_module.store is shell.store
+
+
+def test_calendar_command(shell, capsys):
+    shell.store.add_entry(ContentEntry.new(Platform.TWITTER, "Hi", "Shell topic"))
+    shell.onecmd("calendar")
+    assert "Shell topic" in capsys.readouterr().out
+
+
+def test_root_options_reach_shell_commands(tmp_path, monkeypatch):
+    monkeypatch.setattr(workspaces, "DEFAULT_STORE_PATH", tmp_path / "content.json")
+    monkeypatch.setattr(workspaces, "WORKSPACES_DIR", tmp_path / "workspaces")
+    monkeypatch.setattr(cli_module, "store", None)
+    monkeypatch.delenv("SOCIAL_WORKSPACE", raising=False)
+    workspaces.create_workspace("acme")
+    ContentStore(workspaces.workspace_path("acme")).add_entry(
+        ContentEntry.new(Platform.TWITTER, "Hi", "acme topic")
+    )
+    result = CliRunner().invoke(
+        cli_module.cli, ["--workspace", "acme", "--format", "ndjson", "shell"],
+        input="calendar\nquit\n",
+    )
+    # The workspace's entry, printed as NDJSON after the prompt
+    line = result.output.splitlines()[1]
+    assert json.loads(line.removeprefix("social> "))["topic"] == "acme topic"
+
+
+def test_delete_command(shell):
+    entry = shell.store.add_entry(ContentEntry.new(Platform.TWITTER, "Bye", "t"))
+    shell.onecmd(f"delete {entry.id} --force")
+    assert shell.store.get_entry(entry.id) is None
+
+
+def test_error_does_not_exit_shell(shell, capsys):
+    assert not shell.onecmd("edit missing -c x")
+    assert "not found" in capsys.readouterr().out
+
+
+def test_generate_reuses_one_client(shell):
+    with patch("anthropic.Anthropic") as mock_client_cls, patch(
+        "social.generator.generate_content", return_value="Generated!"
+    ) as mock_generate, patch("click.confirm", return_value=False):
+        shell.onecmd("generate -p twitter -t one --no-save")
+        shell.onecmd("generate -p twitter -t two --no-save")
+    assert mock_client_cls.call_count == 1
+    clients = {c.kwargs["client"] for c in mock_generate.call_args_list}
+    assert clients == {mock_client_cls.return_value}
+
+
+def test_complete_entry_ids(shell):
+    entry = shell.store.add_entry(ContentEntry.new(Platform.TWITTER, "x", "t"))
+    prefix = entry.id[:3]
+    line = f"edit {prefix}"
+    assert shell.complete_edit(prefix, line, 5, len(line)) == [entry.id]
+    line = f"edit {entry.id} {prefix}"
+    assert shell.complete_edit(prefix, line, len(line) - 3, len(line)) == []
+
+
+def test_quit(shell):
+    assert shell.onecmd("quit") is True
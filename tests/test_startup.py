@@ -0,0 +1,71 @@
+"""Import-time regression checks for the CLI.
+
+Each check runs in a fresh interpreter so module caching in the test
+process does not hide import costs. Budgets can be relaxed on slow
+machines with SOCIAL_STARTUP_BUDGET (seconds).
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+STARTUP_BUDGET = float(os.environ.get("SOCIAL_STARTUP_BUDGET", "0.3"))
+
+HEAVY_MODULES = ("anthropic", "httpx", "rich")
+
+
+def _run(code, tmp_path):
+    env = dict(os.environ, HOME=str(tmp_path), USERPROFILE=str(tmp_path))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules(tmp_path):
+    code = (
+        "import json, sys\n"
+        "import social.cli\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    assert _run(code, tmp_path) == []
+
+
+def test_import_does_not_create_store(tmp_path):
+    code = (
+        "import json, social.cli\n"
+        "print(json.dumps([social.cli.store is None, social.cli.console is None]))\n"
+    )
+    assert _run(code, tmp_path) == [True, True]
+    assert not (tmp_path / ".social-content").exists()
+
+
+@pytest.mark.parametrize("args", [["platforms"], ["calendar"], ["calendar", "--week"]])
+def test_non_generation_commands_skip_anthropic(tmp_path, args):
+    code = (
+        "import json, sys\n"
+        "from social.cli import cli\n"
+        "try:\n"
+        f"    cli({args!r}, standalone_mode=False)\n"
+        "finally:\n"
+        "    print(json.dumps('anthropic' in sys.modules))\n"
+    )
+    assert _run(code, tmp_path) is False
+
+
+def test_import_time_budget(tmp_path):
+    code = (
+        "import json, time\n"
+        "t0 = time.perf_counter()\n"
+        "import social.cli\n"
+        "print(json.dumps(time.perf_counter() - t0))\n"
+    )
+    best = min(_run(code, tmp_path) for _ in range(3))
+    assert best < STARTUP_BUDGET, f"import social.cli took {best:.3f}s"
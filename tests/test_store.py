@@ -1,9 +1,11 @@
+import asyncio
 import json
+import time
 
 import pytest
 
 from social.models import ContentEntry, ContentStatus, Platform
-from social.store import ContentStore, EntryNotFoundError
+from social.store import AsyncContentStore, ContentStore, DuplicateEntryError, EntryNotFoundError
 
 
 @pytest.fixture
@@ -52,6 +54,16 @@ def test_list_filter_by_status(store):
     assert results[0].status == ContentStatus.DRAFT
 
 
+def test_list_order_and_combined_filters(store):
+    late = store.add_entry(_make_entry(scheduled_date="2026-05-01", status=ContentStatus.SCHEDULED))
+    draft = store.add_entry(_make_entry())
+    early = store.add_entry(_make_entry(scheduled_date="2026-04-01", status=ContentStatus.SCHEDULED))
+    store.add_entry(_make_entry(platform=Platform.LINKEDIN, scheduled_date="2026-01-01",
+                                status=ContentStatus.SCHEDULED))
+    assert [e.id for e in store.list_entries(platform=Platform.TWITTER)] == [early.id, late.id, draft.id]
+    assert [e.id for e in store.list_entries(platform="twitter", status="scheduled")] == [early.id, late.id]
+
+
 def test_update_entry(store):
     entry = _make_entry()
     store.add_entry(entry)
@@ -95,7 +107,7 @@ def test_json_file_format(store, tmp_path):
     store.add_entry(entry)
     with open(tmp_path / "content.json") as f:
         data = json.load(f)
-    assert data["version"] == 1
+    assert data["version"] == 2
     assert len(data["entries"]) == 1
     assert data["entries"][0]["id"] == entry.id
 
@@ -108,3 +120,117 @@ def test_sorted_by_scheduled_date(store):
     assert results[0].content == "sooner"
     assert results[1].content == "later"
     assert results[2].content == "no date"
+
+
+def test_scheduled_between(store):
+    from datetime import date
+
+    store.add_entry(_make_entry(content="no date"))
+    store.add_entry(_make_entry(content="feb", scheduled_date="2026-02-28T09:00"))
+    store.add_entry(_make_entry(content="mar1", scheduled_date="2026-03-01"))
+    store.add_entry(_make_entry(content="mar31", scheduled_date="2026-03-31T18:30", platform=Platform.LINKEDIN))
+    store.add_entry(_make_entry(content="apr", scheduled_date="2026-04-01"))
+    found = store.scheduled_between(date(2026, 3, 1), date(2026, 3, 31))
+    assert [e.content for e in found] == ["mar1", "mar31"]
+    assert [e.content for e in store.scheduled_between(
+        date(2026, 2, 1), date(2026, 3, 31), platform=Platform.TWITTER
+    )] == ["feb", "mar1"]
+    store.update_entry(found[0].id, scheduled_date="2026-04-02")
+    assert [e.content for e in store.scheduled_between(date(2026, 4, 1), date(2026, 4, 30))] == ["apr", "mar1"]
+
+
+def test_update_entries_single_write(store):
+    a = store.add_entry(_make_entry(content="a"))
+    b = store.add_entry(_make_entry(content="b"))
+    updated = store.update_entries({
+        a.id: {"status": ContentStatus.SCHEDULED},
+        b.id: {"content": "B!"},
+    })
+    assert len(updated) == 2
+    assert store.get_entry(a.id).status == ContentStatus.SCHEDULED
+    assert store.get_entry(b.id).content == "B!"
+
+
+def test_update_entries_missing_raises(store):
+    store.add_entry(_make_entry())
+    with pytest.raises(EntryNotFoundError):
+        store.update_entries({"missing": {"content": "x"}})
+
+
+def test_reads_are_cached_until_file_changes(store, mocker):
+    store.add_entry(_make_entry(content="a"))
+    store.list_entries()
+    spy = mocker.spy(json, "load")
+    store.list_entries()
+    store.get_entry("x")
+    assert spy.call_count == 0
+
+    # An external writer replacing the file invalidates the cache
+    other = ContentStore(path=store.path)
+    other.add_entry(_make_entry(content="b"))
+    assert len(store.list_entries()) == 2
+
+
+def test_add_entries_and_delete_entries(store):
+    entries = [_make_entry(content=str(i)) for i in range(3)]
+    store.add_entries(entries)
+    assert len(store.list_entries()) == 3
+    deleted = store.delete_entries([entries[0].id, entries[2].id])
+    assert {e.id for e in deleted} == {entries[0].id, entries[2].id}
+    assert [e.id for e in store.list_entries()] == [entries[1].id]
+
+
+def test_add_entries_rejects_duplicate_ids(store):
+    stored = store.add_entry(_make_entry(content="a"))
+    fresh = _make_entry(content="b")
+    with pytest.raises(DuplicateEntryError, match=stored.id):
+        store.add_entries([fresh, ContentEntry.from_dict(stored.to_dict())])
+    with pytest.raises(DuplicateEntryError, match=fresh.id):
+        store.add_entries([fresh, fresh])
+    assert [e.id for e in store.list_entries()] == [stored.id]
+
+
+def test_delete_entries_missing_raises(store):
+    store.add_entry(_make_entry())
+    with pytest.raises(EntryNotFoundError):
+        store.delete_entries(["missing"])
+
+
+def test_async_store_round_trip(tmp_path):
+    async def main():
+        async with AsyncContentStore(path=tmp_path / "content.json") as astore:
+            added = await asyncio.gather(
+                *(astore.add_entry(_make_entry(content=f"post {i}")) for i in range(20))
+            )
+            await astore.update_entry(added[0].id, content="edited")
+            assert (await astore.get_entry(added[0].id)).content == "edited"
+            await astore.delete_entry(added[1].id)
+            with pytest.raises(EntryNotFoundError):
+                await astore.delete_entry(added[1].id)
+            return await astore.list_entries(platform=Platform.TWITTER)
+
+    entries = asyncio.run(main())
+    assert len(entries) == 19
+    assert len(ContentStore(path=tmp_path / "content.json").list_entries()) == 19
+
+
+def test_async_store_does_not_block_loop(tmp_path, mocker):
+    astore = AsyncContentStore(path=tmp_path / "content.json")
+    mocker.patch.object(astore.store, "list_entries", side_effect=lambda *a: time.sleep(0.2) or [])
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        await astore.list_entries()
+        task.cancel()
+        await astore.close()
+        return ticks
+
+    assert asyncio.run(main()) >= 5
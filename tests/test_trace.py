@@ -0,0 +1,99 @@
+import json
+import pstats
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from social import trace
+from social.cli import cli
+from social.models import ContentEntry, Platform
+from social.store import ContentStore
+
+
+@pytest.fixture(autouse=True)
+def no_tracer(monkeypatch):
+    monkeypatch.delenv("SOCIAL_TRACE", raising=False)
+    monkeypatch.setattr(trace, "_tracer", None)
+
+
+def test_span_is_shared_noop_when_disabled():
+    assert trace.span("a") is trace.span("b")
+    with trace.span("store.parse") as sp:
+        sp.set(entries=3)
+    assert trace.active() is None
+
+
+def test_spans_recorded_when_enabled():
+    tracer = trace.enable()
+    with trace.span("outer", kind="x"):
+        with trace.span("inner") as sp:
+            sp.set(rows=2)
+    names = [event[0] for event in tracer.events]
+    assert names == ["inner", "outer"]
+    assert tracer.events[0][4] == {"rows": 2}
+
+
+def test_chrome_trace_file(tmp_path):
+    path = tmp_path / "trace.json"
+    trace.enable(path)
+    with trace.span("store.decode", entries=5):
+        pass
+    finished = trace.finish()
+    assert trace.active() is None
+    assert finished.path == path
+    data = json.loads(path.read_text())
+    (event,) = data["traceEvents"]
+    assert event["name"] == "store.decode"
+    assert event["cat"] == "store"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["args"] == {"entries": 5}
+
+
+def test_summary_aggregates_by_name():
+    tracer = trace.Tracer()
+    tracer.events = [
+        ("a", 0, 2_000_000, 1, {}),
+        ("a", 0, 4_000_000, 1, {}),
+        ("b", 0, 10_000_000, 1, {}),
+    ]
+    rows = tracer.summary()
+    assert [r["span"] for r in rows] == ["b", "a"]
+    assert rows[1]["calls"] == 2
+    assert rows[1]["total_ms"] == pytest.approx(6.0)
+    assert rows[1]["mean_ms"] == pytest.approx(3.0)
+    assert rows[1]["max_ms"] == pytest.approx(4.0)
+
+
+def test_store_load_is_traced(tmp_path):
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "One", "a"))
+    tracer = trace.enable()
+    ContentStore(path=tmp_path / "content.json").list_entries()
+    names = {event[0] for event in tracer.events}
+    assert {"store.parse", "store.decode", "store.sort"} <= names
+
+
+def test_cli_profile_writes_trace_and_summary(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOCIAL_TRACE", str(tmp_path / "trace.json"))
+    store = ContentStore(path=tmp_path / "content.json")
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "One", "a"))
+    with patch("social.cli.store", ContentStore(path=tmp_path / "content.json")):
+        result = CliRunner().invoke(cli, ["--profile", "calendar"])
+    assert result.exit_code == 0
+    assert "Trace summary" in result.output
+    assert "cli.calendar" in result.output
+    assert trace.active() is None
+    names = {e["name"] for e in json.loads((tmp_path / "trace.json").read_text())["traceEvents"]}
+    assert {"cli.calendar", "store.decode", "render.table", "render.print"} <= names
+
+
+def test_cli_cprofile_dumps_stats(tmp_path):
+    out = tmp_path / "calendar.prof"
+    with patch("social.cli.store") as mock_store:
+        mock_store.list_entries.return_value = []
+        result = CliRunner().invoke(cli, ["--cprofile", str(out), "calendar"])
+    assert result.exit_code == 0
+    assert pstats.Stats(str(out)).total_calls > 0
+    assert trace.active() is None
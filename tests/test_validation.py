@@ -0,0 +1,78 @@
+from dataclasses import replace
+
+import pytest
+
+from social.models import Platform
+from social.platforms import PLATFORMS
+from social.validation import check_content, content_length, validate_records, weighted_length
+
+TWITTER = PLATFORMS[Platform.TWITTER]
+LINKEDIN = PLATFORMS[Platform.LINKEDIN]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("hello", 5),
+    ("read https://example.com/a/very/long/path?utm=1 now", 5 + 23 + 4),
+    ("see example.com", 4 + 23),
+    ("你好世界", 8),
+    ("“quoted”", 8),
+    ("ok 👍🏽", 3 + 2),
+    ("family 👨‍👩‍👧", 7 + 2),
+])
+def test_weighted_length(text, expected):
+    assert weighted_length(text) == expected
+
+
+def test_content_length_uses_platform_counting():
+    text = "日本" * 100
+    assert content_length(text, TWITTER) == 400
+    assert content_length(text, LINKEDIN) == 200
+
+
+def test_cjk_tweet_over_weighted_limit():
+    assert check_content("日" * 141, TWITTER) == [("length", "282 weighted characters (max 280)")]
+    assert check_content("x" * 200 + " https://example.com/ " + "y" * 100, TWITTER)
+
+
+def test_url_tweet_within_weighted_limit():
+    text = "Worth a read " + "https://example.com/" + "p" * 300
+    assert check_content(text, TWITTER) == []
+
+
+def test_hashtag_count():
+    assert check_content("Post #a #b #c #d", TWITTER) == [("hashtags", "4 hashtags (max 3)")]
+    assert check_content("Post #a #b #c", TWITTER) == []
+
+
+def test_footer_hashtag_position():
+    assert check_content("Big #news today.\n\nMore details.\n\n#ai", LINKEDIN) == [
+        ("hashtag_position", "hashtags must be in the closing paragraph")
+    ]
+    assert check_content("Big news today.\n\nMore details.\n\n#ai #ml", LINKEDIN) == []
+
+
+def test_no_hashtag_style():
+    config = replace(LINKEDIN, hashtag_style="none")
+    assert check_content("Hello #there", config)[0][0] == "hashtags"
+    assert check_content("Issue &#35; is fine", config) == []
+
+
+def test_line_limit_and_banned_terms():
+    config = replace(LINKEDIN, max_lines=2, banned_terms=("guaranteed", "get rich"))
+    problems = dict(check_content("Guaranteed returns\nGet rich\nquick", config))
+    assert problems["lines"] == "3 lines (max 2)"
+    assert problems["banned_terms"] == "contains banned term(s): get rich, guaranteed"
+    assert check_content("Unguaranteed", config) == []
+
+
+def test_validate_records_batch():
+    records = [
+        {"id": "a1", "platform": "twitter", "content": "fine #ok"},
+        {"id": "b2", "platform": "twitter", "content": "x" * 281},
+        {"id": "c3", "platform": "linkedin", "content": "fine"},
+    ]
+    configs = dict(PLATFORMS)
+    configs[Platform.LINKEDIN] = replace(LINKEDIN, banned_terms=("fine",))
+    violations = list(validate_records(records, configs))
+    assert [(v.entry_id, v.rule) for v in violations] == [("b2", "length"), ("c3", "banned_terms")]
+    assert violations[0].to_dict()["platform"] == "twitter"
@@ -0,0 +1,68 @@
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+from social.watch import CalendarWatcher, watch_calendar
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(path=tmp_path / "content.json")
+
+
+def _make_entry(**kwargs):
+    defaults = dict(platform=Platform.TWITTER, content="Hello", topic="test")
+    defaults.update(kwargs)
+    return ContentEntry.new(**defaults)
+
+
+def test_watcher_applies_add_update_delete(store):
+    first = store.add_entry(_make_entry(topic="first"))
+    watcher = CalendarWatcher(store)
+    assert list(watcher.entries) == [first.id]
+    assert watcher.poll() is False
+
+    second = store.add_entry(_make_entry(topic="second", scheduled_date="2026-01-01"))
+    assert watcher.poll() is True
+    assert watcher._order == [second.id, first.id]
+
+    store.update_entry(first.id, topic="renamed")
+    assert watcher.poll() is True
+    assert watcher.entries[first.id].topic == "renamed"
+
+    store.delete_entry(second.id)
+    assert watcher.poll() is True
+    assert list(watcher.entries) == [first.id]
+
+
+def test_watcher_only_reformats_changed_rows(store, mocker):
+    a = store.add_entry(_make_entry(topic="a"))
+    b = store.add_entry(_make_entry(topic="b"))
+    watcher = CalendarWatcher(store)
+    watcher.render()
+    spy = mocker.spy(__import__("social.watch", fromlist=["x"]), "calendar_row")
+    store.update_entry(a.id, content="changed")
+    watcher.poll()
+    table = watcher.render()
+    assert table.row_count == 2
+    assert spy.call_count == 1
+    assert spy.call_args.args[0].id == a.id
+
+
+def test_watcher_respects_filters(store):
+    watcher = CalendarWatcher(store, status=ContentStatus.DRAFT)
+    entry = store.add_entry(_make_entry())
+    watcher.poll()
+    store.update_entry(entry.id, status=ContentStatus.SCHEDULED)
+    assert watcher.poll() is True
+    assert watcher.entries == {}
+
+
+def test_watch_calendar_renders(store):
+    store.add_entry(_make_entry(topic="Live topic"))
+    buf = StringIO()
+    watch_calendar(store, console=Console(file=buf, width=120), interval=0, max_polls=1)
+    assert "Live topic" in buf.getvalue()
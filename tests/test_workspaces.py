@@ -0,0 +1,141 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from social import cli as cli_module
+from social import workspaces
+from social.cli import cli
+from social.models import ContentEntry, ContentStatus, Platform
+from social.store import ContentStore
+from social.workspaces import (
+    WorkspaceError,
+    create_workspace,
+    list_across,
+    list_workspaces,
+    require_workspace,
+    search_across,
+    workspace_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setattr(workspaces, "DEFAULT_STORE_PATH", tmp_path / "content.json")
+    monkeypatch.setattr(workspaces, "WORKSPACES_DIR", tmp_path / "workspaces")
+    monkeypatch.setattr(cli_module, "store", None)
+    monkeypatch.delenv("SOCIAL_WORKSPACE", raising=False)
+    return tmp_path
+
+
+def _add(name, platform, content, day=None, status=ContentStatus.DRAFT):
+    entry = ContentEntry.new(platform, content, content.split()[0], scheduled_date=day, status=status)
+    return ContentStore(workspace_path(name)).add_entry(entry)
+
+
+def test_workspace_paths(home):
+    assert workspace_path() == home / "content.json"
+    assert workspace_path("default") == home / "content.json"
+    assert workspace_path("acme") == home / "workspaces" / "acme" / "content.json"
+    with pytest.raises(WorkspaceError):
+        workspace_path("../escape")
+
+
+def test_create_and_list(home):
+    assert list_workspaces() == ["default"]
+    create_workspace("zeta")
+    create_workspace("acme")
+    assert list_workspaces() == ["default", "acme", "zeta"]
+    with pytest.raises(WorkspaceError, match="already exists"):
+        create_workspace("acme")
+    with pytest.raises(WorkspaceError, match="No workspace named"):
+        require_workspace("missing")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_list_across_merges_in_calendar_order(workers):
+    create_workspace("acme")
+    create_workspace("beta")
+    _add("acme", Platform.TWITTER, "acme second", "2026-03-05")
+    _add("beta", Platform.TWITTER, "beta first", "2026-03-01")
+    _add("default", Platform.LINKEDIN, "default third", "2026-03-09")
+    _add("beta", Platform.LINKEDIN, "beta draft")
+
+    pairs = list_across(list_workspaces(), workers=workers)
+    assert [(name, e.content) for name, e in pairs] == [
+        ("beta", "beta first"),
+        ("acme", "acme second"),
+        ("default", "default third"),
+        ("beta", "beta draft"),
+    ]
+    linkedin = list_across(list_workspaces(), platform=Platform.LINKEDIN, workers=workers)
+    assert [name for name, _ in linkedin] == ["default", "beta"]
+
+
+def test_search_across(home):
+    create_workspace("acme")
+    _add("acme", Platform.TWITTER, "Launch day for Acme", "2026-03-05")
+    _add("default", Platform.TWITTER, "launch recap", "2026-03-01")
+    _add("default", Platform.TWITTER, "unrelated", "2026-03-02")
+    pairs = search_across(list_workspaces(), "LAUNCH", workers=2)
+    assert [(name, e.content) for name, e in pairs] == [
+        ("default", "launch recap"), ("acme", "Launch day for Acme"),
+    ]
+    assert search_across(list_workspaces(), "launch acme")[0][0] == "acme"
+
+
+def test_store_search_matches_all_words(tmp_path):
+    store = ContentStore(path=tmp_path / "s.json")
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Big news about Python", "release"))
+    store.add_entry(ContentEntry.new(Platform.TWITTER, "Python tips", "tips"))
+    assert [e.topic for e in store.search("python RELEASE")] == ["release"]
+    assert len(store.search("python")) == 2
+    assert store.search("rust") == []
+
+
+def test_cli_workspace_option_selects_store(home):
+    runner = CliRunner()
+    assert runner.invoke(cli, ["workspace", "create", "acme"]).exit_code == 0
+    result = runner.invoke(
+        cli, ["--workspace", "acme", "calendar", "add", "-p", "twitter", "-c", "Hi", "-t", "t"]
+    )
+    assert result.exit_code == 0
+    assert len(ContentStore(workspace_path("acme")).list_entries()) == 1
+    assert not (home / "content.json").exists()  # the default store was never touched
+
+
+def test_cli_publish_writes_next_to_workspace_store(home):
+    create_workspace("acme")
+    _add("acme", Platform.TWITTER, "acme launch", "2020-01-01", status=ContentStatus.SCHEDULED)
+    result = CliRunner().invoke(cli, ["--workspace", "acme", "publish", "--due"])
+    assert result.exit_code == 0
+    assert (home / "workspaces" / "acme" / "published" / "twitter.ndjson").exists()
+    assert not (home / "published").exists()
+
+
+def test_cli_unknown_workspace():
+    result = CliRunner().invoke(cli, ["--workspace", "nope", "calendar"])
+    assert result.exit_code == 2
+    assert "No workspace named 'nope'" in result.output
+
+
+def test_cli_all_workspaces_calendar_and_search():
+    create_workspace("acme")
+    _add("acme", Platform.TWITTER, "acme launch", "2026-03-05")
+    _add("default", Platform.TWITTER, "default launch", "2026-03-01")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--all-workspaces", "--format", "ndjson", "calendar"])
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert [(r["workspace"], r["content"]) for r in records] == [
+        ("default", "default launch"), ("acme", "acme launch"),
+    ]
+    table = runner.invoke(cli, ["--all-workspaces", "search", "acme"], env={"COLUMNS": "200"})
+    assert table.exit_code == 0
+    assert "acme launch" in table.output and "default launch" not in table.output
+
+
+def test_cli_all_workspaces_rejected_elsewhere():
+    result = CliRunner().invoke(cli, ["--all-workspaces", "platforms"])
+    assert result.exit_code == 2
+    assert "only applies to calendar and search" in result.output